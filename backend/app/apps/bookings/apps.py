@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class BookingsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.bookings"
+
+    def ready(self) -> None:
+        from apps.common.event_bus import event_bus
+
+        from .handlers import register
+
+        register(event_bus)
@@ -0,0 +1,81 @@
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List
+
+from django.db.models import Exists, OuterRef, QuerySet
+
+from .models import BLOCKING_STATUSES, Booking
+
+
+def overlapping_bookings(start_date: date, end_date: date) -> QuerySet:
+    return Booking.objects.filter(
+        status__in=BLOCKING_STATUSES,
+        start_date__lt=end_date,
+        end_date__gt=start_date,
+    )
+
+
+def filter_available(cars: QuerySet, start_date: date, end_date: date) -> QuerySet:
+    if end_date <= start_date:
+        raise ValueError("End date must be after start date")
+    busy = overlapping_bookings(start_date, end_date).filter(car=OuterRef("pk"))
+    return cars.exclude(Exists(busy))
+
+
+class CarIntervals:
+    __slots__ = ("starts", "ends", "_max_ends")
+
+    def __init__(self) -> None:
+        self.starts: List[date] = []
+        self.ends: List[date] = []
+        self._max_ends: List[date] | None = []
+
+    def add(self, start_date: date, end_date: date) -> None:
+        idx = bisect_left(self.starts, start_date)
+        self.starts.insert(idx, start_date)
+        self.ends.insert(idx, end_date)
+        self._max_ends = None
+
+    def overlaps(self, start_date: date, end_date: date) -> bool:
+        # Intervals are sorted by start; the running maximum of end dates tells whether any
+        # interval starting before ``end_date`` reaches past ``start_date``.
+        idx = bisect_left(self.starts, end_date)
+        if idx == 0:
+            return False
+        return self._prefix_max_ends()[idx - 1] > start_date
+
+    def _prefix_max_ends(self) -> List[date]:
+        if self._max_ends is None:
+            max_ends: List[date] = []
+            for end in self.ends:
+                max_ends.append(end if not max_ends or end > max_ends[-1] else max_ends[-1])
+            self._max_ends = max_ends
+        return self._max_ends
+
+
+class BookingIntervalIndex:
+    def __init__(self) -> None:
+        self._cars: Dict = defaultdict(CarIntervals)
+
+    @classmethod
+    def from_queryset(cls, bookings: QuerySet | None = None) -> "BookingIntervalIndex":
+        index = cls()
+        if bookings is None:
+            bookings = Booking.objects.filter(status__in=BLOCKING_STATUSES)
+        rows = bookings.order_by("car_id", "start_date").values_list(
+            "car_id", "start_date", "end_date"
+        )
+        for car_id, start_date, end_date in rows.iterator(chunk_size=10000):
+            index.add(car_id, start_date, end_date)
+        return index
+
+    def add(self, car_id, start_date: date, end_date: date) -> None:
+        self._cars[car_id].add(start_date, end_date)
+
+    def is_available(self, car_id, start_date: date, end_date: date) -> bool:
+        intervals = self._cars.get(car_id)
+        return intervals is None or not intervals.overlaps(start_date, end_date)
+
+    def available_cars(self, car_ids: Iterable, start_date: date, end_date: date) -> List:
+        return [car_id for car_id in car_ids if self.is_available(car_id, start_date, end_date)]
@@ -0,0 +1,31 @@
+from datetime import date
+
+from apps.common.event_bus import BOOKING_CONFIRMED, FINE_APPLIED, EventBus
+
+from .invoice_batch import InvoiceBatch
+from .services import BookingService
+
+
+def snapshot_invoice(booking) -> None:
+    BookingService().snapshot_invoice(booking)
+
+
+def snapshot_invoices(bookings) -> None:
+    InvoiceBatch(date.min).process([booking.pk for booking in bookings])
+
+
+def append_fine(fine) -> None:
+    BookingService().append_fine(fine)
+
+
+# (event, handler, set-based handler for publish_many)
+SUBSCRIPTIONS = (
+    (BOOKING_CONFIRMED, snapshot_invoice, snapshot_invoices),
+    (FINE_APPLIED, append_fine, None),
+)
+
+
+def register(bus: EventBus) -> None:
+    for event_name, handler, batch in SUBSCRIPTIONS:
+        if handler not in bus.subscriptions(event_name):
+            bus.subscribe(event_name, handler, batch)
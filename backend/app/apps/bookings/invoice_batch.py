@@ -0,0 +1,145 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Iterator, List
+
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from apps.common.event_bus import INVOICE_ISSUED, event_bus
+
+from .invoice_builder import InvoiceBuilder
+from .models import Booking, Invoice
+from .services import BookingService
+
+
+@dataclass
+class InvoiceBatchSummary:
+    bookings: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.bookings / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: "InvoiceBatchSummary") -> None:
+        self.bookings += other.bookings
+        self.created += other.created
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+
+
+def completed_booking_ids(since: date) -> List:
+    return list(
+        Booking.objects.filter(status=Booking.Status.COMPLETED, end_date__gte=since)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def chunked(ids: List, size: int) -> Iterator[List]:
+    for offset in range(0, len(ids), size):
+        yield ids[offset : offset + size]
+
+
+class InvoiceBatch:
+    # Invoices completed bookings chunk by chunk: one query for bookings with car and invoice,
+    # one for their fines, pricing from a single shared rule set, then a bulk_create and a
+    # bulk_update per chunk. Unchanged invoices (same content hash) are not written.
+    def __init__(self, since: date, chunk_size: int = 1000, workers: int = 1, service=None) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if workers > 1 and connection.vendor == "sqlite":
+            raise ValueError("A process pool needs a server database; use --workers 1 on SQLite")
+        self.since = since
+        self.chunk_size = chunk_size
+        self.workers = max(workers, 1)
+        self.service = service or BookingService()
+
+    def run(self, ids: List | None = None) -> InvoiceBatchSummary:
+        started = time.perf_counter()
+        if ids is None:
+            ids = completed_booking_ids(self.since)
+        chunks = list(chunked(ids, self.chunk_size))
+        summary = InvoiceBatchSummary()
+        if self.workers == 1:
+            for ids in chunks:
+                summary.merge(self.process(ids))
+        else:
+            # Spawned on every platform, so no worker inherits the parent's connections and each
+            # one sets Django up itself.
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            ) as pool:
+                for result in pool.map(_process_chunk, chunks):
+                    summary.merge(result)
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+    @transaction.atomic
+    def process(self, ids: Iterable) -> InvoiceBatchSummary:
+        bookings = (
+            Booking.objects.filter(id__in=list(ids))
+            .select_related("car", "invoice")
+            .prefetch_related("fines")
+        )
+        summary = InvoiceBatchSummary()
+        created: List[Invoice] = []
+        updated: List[Invoice] = []
+        now = timezone.now()
+        for booking in bookings:
+            summary.bookings += 1
+            builder = InvoiceBuilder.for_booking(booking)
+            self.service.prepare_invoice(builder)
+            invoice = builder.stage()
+            if invoice is None:
+                summary.unchanged += 1
+            elif invoice._state.adding:
+                created.append(invoice)
+            else:
+                invoice.updated_at = now
+                updated.append(invoice)
+        if updated:
+            # Lock the staged invoices and drop any that were paid since they were read: a paid
+            # invoice keeps the total that was charged.
+            unpaid = set(
+                Invoice.objects.select_for_update()
+                .filter(pk__in=[invoice.pk for invoice in updated], paid_at__isnull=True)
+                .values_list("pk", flat=True)
+            )
+            summary.unchanged += len(updated) - len(unpaid)
+            updated = [invoice for invoice in updated if invoice.pk in unpaid]
+        Invoice.objects.bulk_create(created)
+        Invoice.objects.bulk_update(updated, ["breakdown", "total", "content_hash", "updated_at"])
+        summary.created, summary.updated = len(created), len(updated)
+        event_bus.publish_many(
+            INVOICE_ISSUED,
+            created + updated,
+            [invoice.booking_id for invoice in created + updated],
+        )
+        return summary
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+    connections.close_all()
+
+
+def _process_chunk(ids: List) -> InvoiceBatchSummary:
+    try:
+        return InvoiceBatch(date.min).process(ids)
+    finally:
+        connections.close_all()
+
+
+def generate_invoices(since: date, chunk_size: int = 1000, workers: int = 1) -> InvoiceBatchSummary:
+    return InvoiceBatch(since, chunk_size=chunk_size, workers=workers).run()
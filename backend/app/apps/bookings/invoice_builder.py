@@ -1,22 +1,59 @@
+import hashlib
+import json
 from decimal import Decimal
 from typing import Iterable
 
-from .models import Invoice
+from django.utils import timezone
+
+from apps.pricing.money import Money, from_cents, to_cents
+
+from .models import Booking, Invoice
+
+
+def content_hash(items: list[dict]) -> str:
+    body = json.dumps(items, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def is_fine_item(item: dict) -> bool:
+    return "fine_id" in item.get("metadata", {})
 
 
 class InvoiceBuilder:
-    def __init__(self, booking) -> None:
+    def __init__(self, booking, invoice: Invoice | None = None) -> None:
         self.booking = booking
+        self.invoice = invoice
+        self.changed = False
         self._items: list[dict] = []
+        self._cents: list[int] = []
+        self._loaded = invoice is not None
+
+    @classmethod
+    def for_booking(cls, booking) -> "InvoiceBuilder":
+        # Uses the invoice loaded with the booking (select_related) when there is one.
+        if Booking.invoice.is_cached(booking):
+            invoice = getattr(booking, "invoice", None)
+        else:
+            invoice = Invoice.objects.filter(booking=booking).first()
+        builder = cls(booking, invoice)
+        builder._loaded = True
+        return builder
 
-    def add_charge(self, label: str, amount: Decimal, metadata: dict | None = None) -> None:
+    def add_charge(self, label: str, amount: Money | Decimal, metadata: dict | None = None) -> None:
+        amount = Money.of(amount)
         self._items.append(
             {
                 "label": label,
-                "amount": str(Decimal(amount)),
+                "amount": str(amount),
                 "metadata": metadata or {},
             }
         )
+        self._cents.append(amount.cents)
+
+    def add_items(self, items: Iterable[dict]) -> None:
+        for item in items:
+            self._items.append(item)
+            self._cents.append(to_cents(item["amount"]))
 
     def add_pricing_breakdown(self, breakdown: Iterable[dict]) -> None:
         for item in breakdown:
@@ -32,10 +69,48 @@ class InvoiceBuilder:
                 {"type": fine.type, "fine_id": str(fine.id)},
             )
 
+    def has_fine(self, fine) -> bool:
+        return any(item["metadata"].get("fine_id") == str(fine.id) for item in self._items)
+
+    def stage(self) -> Invoice | None:
+        # Applies the breakdown to the invoice in memory without writing. Returns the invoice when
+        # it needs an INSERT (no pk in the database yet) or UPDATE, None when the stored content
+        # hash already matches or the invoice is paid: a settled invoice keeps the total that was
+        # charged, and later fines stay on the booking only.
+        total = from_cents(sum(self._cents))
+        digest = content_hash(self._items)
+        if not self._loaded:
+            self.invoice = Invoice.objects.filter(booking=self.booking).first()
+            self._loaded = True
+        if self.invoice is not None and (
+            self.invoice.paid_at is not None or self.invoice.content_hash == digest
+        ):
+            return None
+        if self.invoice is None:
+            self.invoice = Invoice(booking=self.booking)
+        self.invoice.breakdown = self._items
+        self.invoice.total = total
+        self.invoice.content_hash = digest
+        self.changed = True
+        return self.invoice
+
     def build(self) -> Invoice:
-        total = sum(Decimal(item["amount"]) for item in self._items)
-        invoice, _ = Invoice.objects.update_or_create(
-            booking=self.booking,
-            defaults={"breakdown": self._items, "total": total},
+        # Writes only when the breakdown differs from the stored one (by content hash). Updates
+        # only apply while the invoice is unpaid, since the instance may predate a payment.
+        invoice = self.stage()
+        if invoice is None:
+            return self.invoice
+        if invoice._state.adding:
+            invoice.save(force_insert=True)
+            return invoice
+        invoice.updated_at = timezone.now()
+        written = Invoice.objects.filter(pk=invoice.pk, paid_at__isnull=True).update(
+            breakdown=invoice.breakdown,
+            total=invoice.total,
+            content_hash=invoice.content_hash,
+            updated_at=invoice.updated_at,
         )
+        if not written:
+            invoice.refresh_from_db()
+            self.changed = False
         return invoice
@@ -0,0 +1,36 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.bookings.invoice_batch import generate_invoices
+
+
+class Command(BaseCommand):
+    help = "Create or refresh invoices for completed bookings in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            required=True,
+            help="Only bookings ending on or after this day (YYYY-MM-DD).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers", type=int, default=1, help="Process pool size (server databases only)."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            summary = generate_invoices(
+                options["since"], chunk_size=options["chunk_size"], workers=options["workers"]
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {summary.bookings} bookings in {summary.seconds:.1f}s "
+                f"({summary.per_second:.0f}/s): {summary.created} created, "
+                f"{summary.updated} updated, {summary.unchanged} unchanged."
+            )
+        )
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0002_initial"),
+        ("cars", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "confirmed", "active"])),
+                fields=["car", "start_date", "end_date"],
+                name="booking_blocking_range_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+from django.db import migrations
+
+CONSTRAINT = "booking_no_overlap"
+BLOCKING = "('pending', 'confirmed', 'active')"
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    f"""
+    ALTER TABLE bookings_booking ADD CONSTRAINT {CONSTRAINT}
+    EXCLUDE USING gist (car_id WITH =, daterange(start_date, end_date, '[)') WITH &&)
+    WHERE (status IN {BLOCKING})
+    """,
+]
+POSTGRES_REVERSE = [f"ALTER TABLE bookings_booking DROP CONSTRAINT IF EXISTS {CONSTRAINT}"]
+
+SQLITE_OVERLAP_CHECK = f"""
+    SELECT RAISE(ABORT, '{CONSTRAINT}')
+    WHERE EXISTS (
+        SELECT 1 FROM bookings_booking b
+        WHERE b.car_id = NEW.car_id
+          AND b.id != NEW.id
+          AND b.status IN {BLOCKING}
+          AND b.start_date < NEW.end_date
+          AND b.end_date > NEW.start_date
+    );
+"""
+SQLITE_FORWARD = [
+    f"""
+    CREATE TRIGGER {CONSTRAINT}_insert BEFORE INSERT ON bookings_booking
+    WHEN NEW.status IN {BLOCKING}
+    BEGIN {SQLITE_OVERLAP_CHECK} END
+    """,
+    f"""
+    CREATE TRIGGER {CONSTRAINT}_update
+    BEFORE UPDATE OF car_id, start_date, end_date, status ON bookings_booking
+    WHEN NEW.status IN {BLOCKING}
+    BEGIN {SQLITE_OVERLAP_CHECK} END
+    """,
+]
+SQLITE_REVERSE = [
+    f"DROP TRIGGER IF EXISTS {CONSTRAINT}_insert",
+    f"DROP TRIGGER IF EXISTS {CONSTRAINT}_update",
+]
+
+
+OVERLAPS = f"""
+    SELECT a.car_id, a.id, a.start_date, a.end_date, b.id, b.start_date, b.end_date
+    FROM bookings_booking a
+    JOIN bookings_booking b
+      ON b.car_id = a.car_id
+     AND a.id < b.id
+     AND a.start_date < b.end_date
+     AND b.start_date < a.end_date
+    WHERE a.status IN {BLOCKING} AND b.status IN {BLOCKING}
+    ORDER BY a.car_id, a.start_date
+"""
+MAX_REPORTED = 20
+
+
+def check_no_overlaps(apps, schema_editor):
+    # Existing overlaps would make the constraint fail halfway with a raw database error. They
+    # are business data (which booking wins is not ours to decide), so list them and stop.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(OVERLAPS)
+        rows = cursor.fetchmany(MAX_REPORTED + 1)
+    if not rows:
+        return
+    lines = [
+        f"  car {car}: booking {a} ({a_start} to {a_end}) overlaps {b} ({b_start} to {b_end})"
+        for car, a, a_start, a_end, b, b_start, b_end in rows[:MAX_REPORTED]
+    ]
+    if len(rows) > MAX_REPORTED:
+        lines.append("  ...")
+    raise RuntimeError(
+        f"Cannot add {CONSTRAINT}: pending/confirmed/active bookings overlap. Cancel or move "
+        "one booking of each pair and run the migration again.\n" + "\n".join(lines)
+    )
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0003_booking_blocking_range_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_no_overlaps, migrations.RunPython.noop),
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
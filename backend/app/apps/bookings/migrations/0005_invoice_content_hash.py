@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0004_booking_no_overlap"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invoice",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0005_invoice_content_hash"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="booking",
+            name="bookings_bo_car_id_a83c2e_idx",
+        ),
+    ]
@@ -7,13 +7,25 @@ from django.utils import timezone
 from apps.cars.models import Car
 
 
+class BookingStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    CONFIRMED = "confirmed", "Confirmed"
+    ACTIVE = "active", "Active"
+    COMPLETED = "completed", "Completed"
+    CANCELED = "canceled", "Canceled"
+
+
+# Bookings in these statuses hold their car for their dates. Defined ahead of Booking so its
+# partial index is built from the same tuple the availability queries filter on.
+BLOCKING_STATUSES: tuple[str, ...] = (
+    BookingStatus.PENDING,
+    BookingStatus.CONFIRMED,
+    BookingStatus.ACTIVE,
+)
+
+
 class Booking(models.Model):
-    class Status(models.TextChoices):
-        PENDING = "pending", "Pending"
-        CONFIRMED = "confirmed", "Confirmed"
-        ACTIVE = "active", "Active"
-        COMPLETED = "completed", "Completed"
-        CANCELED = "canceled", "Canceled"
+    Status = BookingStatus
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     customer = models.ForeignKey(
@@ -28,7 +40,13 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ["-start_date", "car"]
-        indexes = [models.Index(fields=["car", "start_date", "end_date"])]
+        indexes = [
+            models.Index(
+                fields=["car", "start_date", "end_date"],
+                condition=models.Q(status__in=list(BLOCKING_STATUSES)),
+                name="booking_blocking_range_idx",
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 condition=models.Q(end_date__gt=models.F("start_date")),
@@ -40,6 +58,10 @@ class Booking(models.Model):
         return f"Booking {self.id} for {self.car}"
 
 
+# Enforced by migration 0004: an exclusion constraint on Postgres, triggers on SQLite.
+BOOKING_OVERLAP_CONSTRAINT = "booking_no_overlap"
+
+
 class Deposit(models.Model):
     class Status(models.TextChoices):
         HELD = "held", "Held"
@@ -82,6 +104,7 @@ class Invoice(models.Model):
     booking = models.OneToOneField(Booking, on_delete=models.CASCADE, related_name="invoice")
     breakdown = models.JSONField(default=list)
     total = models.DecimalField(max_digits=10, decimal_places=2)
+    content_hash = models.CharField(max_length=64, blank=True)
     paid_at = models.DateTimeField(null=True, blank=True)
     method = models.CharField(max_length=64, blank=True)
     payment_reference = models.CharField(max_length=128, blank=True)
@@ -0,0 +1,5 @@
+from apps.common.pagination import KeysetPagination
+
+
+class BookingKeysetPagination(KeysetPagination):
+    ordering = ("-start_date", "car_id", "id")
@@ -78,3 +78,47 @@ class BookingSerializer(serializers.ModelSerializer):
         if start_date and end_date and end_date <= start_date:
             raise serializers.ValidationError("End date must be after start date.")
         return attrs
+
+
+class BookingListSerializer(serializers.ModelSerializer):
+    car = CarSerializer(read_only=True)
+    fines_count = serializers.IntegerField(read_only=True)
+    deposit_status = serializers.CharField(source="deposit.status", read_only=True, default=None)
+    invoice_total = serializers.DecimalField(
+        source="invoice.total", max_digits=10, decimal_places=2, read_only=True, default=None
+    )
+    invoice_paid_at = serializers.DateTimeField(
+        source="invoice.paid_at", read_only=True, default=None
+    )
+
+    class Meta:
+        model = Booking
+        fields = [
+            "id",
+            "customer",
+            "car",
+            "start_date",
+            "end_date",
+            "status",
+            "created_at",
+            "updated_at",
+            "fines_count",
+            "deposit_status",
+            "invoice_total",
+            "invoice_paid_at",
+        ]
+        read_only_fields = fields
+
+
+class BulkTransitionSerializer(serializers.Serializer):
+    MAX_BOOKINGS = 500
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BOOKINGS
+    )
+    status = serializers.ChoiceField(
+        choices=[choice for choice in Booking.Status.choices if choice[0] != Booking.Status.PENDING]
+    )
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
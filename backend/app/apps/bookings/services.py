@@ -1,14 +1,15 @@
 from datetime import date
 from decimal import Decimal
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
-from apps.common.event_bus import FINE_APPLIED, event_bus
+from apps.common.event_bus import FINE_APPLIED, INVOICE_ISSUED, event_bus
 from apps.pricing.services import PricingService
 
-from .invoice_builder import InvoiceBuilder
-from .models import Booking, Fine
-from .state import BookingStateMachine, InvalidStateTransition
+from .availability import overlapping_bookings
+from .invoice_builder import InvoiceBuilder, is_fine_item
+from .models import BOOKING_OVERLAP_CONSTRAINT, Booking, Fine, Invoice
+from .state import BookingStateMachine, InvalidStateTransition, TransitionConflict
 
 
 class BookingOverlapError(Exception):
@@ -21,25 +22,25 @@ class BookingService:
         self.state_machine = state_machine or BookingStateMachine()
 
     def has_overlaps(self, car, start_date: date, end_date: date, exclude_booking_id=None) -> bool:
-        qs = Booking.objects.filter(
-            car=car,
-            status__in=[Booking.Status.PENDING, Booking.Status.CONFIRMED, Booking.Status.ACTIVE],
-            start_date__lt=end_date,
-            end_date__gt=start_date,
-        )
+        qs = overlapping_bookings(start_date, end_date).filter(car=car)
         if exclude_booking_id:
             qs = qs.exclude(id=exclude_booking_id)
         return qs.exists()
 
-    @transaction.atomic
     def create_booking(self, customer, car, start_date: date, end_date: date) -> Booking:
         if end_date <= start_date:
             raise ValueError("End date must be after start date")
-        if self.has_overlaps(car, start_date, end_date):
-            raise BookingOverlapError("Car already booked for the selected period")
-        return Booking.objects.create(
-            customer=customer, car=car, start_date=start_date, end_date=end_date
-        )
+        # Overlaps are rejected by the database (see BOOKING_OVERLAP_CONSTRAINT), so concurrent
+        # requests cannot both pass a read-then-insert check.
+        try:
+            with transaction.atomic():
+                return Booking.objects.create(
+                    customer=customer, car=car, start_date=start_date, end_date=end_date
+                )
+        except IntegrityError as exc:
+            if BOOKING_OVERLAP_CONSTRAINT not in str(exc):
+                raise
+            raise BookingOverlapError("Car already booked for the selected period") from exc
 
     def confirm_booking(self, booking: Booking) -> Booking:
         return self.state_machine.transition(booking, Booking.Status.CONFIRMED)
@@ -53,24 +54,79 @@ class BookingService:
     def cancel_booking(self, booking: Booking) -> Booking:
         return self.state_machine.transition(booking, Booking.Status.CANCELED)
 
+    def bulk_transition(self, booking_ids, target_status: str) -> list[dict]:
+        with transaction.atomic():
+            bookings = Booking.objects.select_related("car").in_bulk(booking_ids)
+            applied, errors = self.state_machine.transition_many(
+                [bookings[pk] for pk in booking_ids if pk in bookings], target_status
+            )
+        applied_ids = {booking.pk for booking in applied}
+        results = []
+        for pk in booking_ids:
+            if pk in applied_ids:
+                results.append({"id": pk, "ok": True, "status": target_status})
+            elif pk in errors:
+                results.append(
+                    {"id": pk, "ok": False, "status": bookings[pk].status, "error": errors[pk]}
+                )
+            else:
+                results.append({"id": pk, "ok": False, "status": None, "error": "Not found."})
+        return results
+
     def apply_fine(
         self, booking: Booking, fine_type: str, amount: Decimal, notes: str = ""
     ) -> Fine:
         fine = Fine.objects.create(booking=booking, type=fine_type, amount=amount, notes=notes)
-        event_bus.publish(FINE_APPLIED, fine)
+        event_bus.publish(FINE_APPLIED, fine, aggregate_id=booking.id)
         return fine
 
     def build_invoice(self, booking: Booking) -> dict:
-        quote = self.pricing_service.quote(booking.car, booking.start_date, booking.end_date)
-        builder = InvoiceBuilder(booking)
-        builder.add_pricing_breakdown(quote["breakdown"])
-        builder.add_fines(list(booking.fines.all()))
+        return self._build_invoice(InvoiceBuilder.for_booking(booking))
+
+    def snapshot_invoice(self, booking: Booking) -> Invoice:
+        builder = InvoiceBuilder.for_booking(booking)
+        if builder.invoice is not None:
+            return builder.invoice
+        return self._build_invoice(builder)["invoice"]
+
+    def _build_invoice(self, builder: InvoiceBuilder) -> dict:
+        quote = self.prepare_invoice(builder)
         invoice = builder.build()
+        if builder.changed:
+            event_bus.publish(INVOICE_ISSUED, invoice, aggregate_id=builder.booking.id)
         return {"invoice": invoice, "pricing": quote}
 
+    def prepare_invoice(self, builder: InvoiceBuilder) -> dict | None:
+        # Reprices only when no invoice exists yet; otherwise the priced lines snapshotted at
+        # confirmation are reused and only the fines are refreshed.
+        booking = builder.booking
+        quote = None
+        if builder.invoice is None:
+            quote = self.pricing_service.quote(booking.car, booking.start_date, booking.end_date)
+            builder.add_pricing_breakdown(quote["breakdown"])
+        else:
+            builder.add_items(item for item in builder.invoice.breakdown if not is_fine_item(item))
+        builder.add_fines(list(booking.fines.all()))
+        return quote
+
+    def append_fine(self, fine: Fine) -> Invoice | None:
+        # Adds the fine to an existing unpaid invoice as a delta; bookings without an invoice pick
+        # their fines up when it is built. A paid invoice is returned unchanged.
+        builder = InvoiceBuilder.for_booking(fine.booking)
+        if builder.invoice is None:
+            return None
+        builder.add_items(builder.invoice.breakdown)
+        if not builder.has_fine(fine):
+            builder.add_fines([fine])
+        invoice = builder.build()
+        if builder.changed:
+            event_bus.publish(INVOICE_ISSUED, invoice, aggregate_id=fine.booking_id)
+        return invoice
+
 
 __all__ = [
     "BookingService",
     "BookingOverlapError",
     "InvalidStateTransition",
+    "TransitionConflict",
 ]
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ClassVar, Dict, Iterable, List, Mapping, Tuple
 
+from django.db import transaction
+from django.utils import timezone
+
+from apps.cars.catalog_cache import invalidate_catalog
 from apps.cars.models import Car
-from apps.common.event_bus import CAR_RETURNED, BOOKING_CONFIRMED, event_bus
+from apps.common.event_bus import BOOKING_CANCELED, BOOKING_CONFIRMED, CAR_RETURNED, event_bus
 
 from .models import Booking
 
@@ -10,6 +16,11 @@ class InvalidStateTransition(Exception):
     pass
 
 
+class TransitionConflict(InvalidStateTransition):
+    # The booking's stored status no longer matches the one the transition was validated from.
+    pass
+
+
 CAR_STATUS_BY_BOOKING: dict[str, str] = {
     Booking.Status.CONFIRMED: Car.Status.RESERVED,
     Booking.Status.ACTIVE: Car.Status.RENTED,
@@ -17,65 +28,41 @@ CAR_STATUS_BY_BOOKING: dict[str, str] = {
     Booking.Status.CANCELED: Car.Status.AVAILABLE,
 }
 
+EVENT_BY_STATUS: dict[str, str] = {
+    Booking.Status.CONFIRMED: BOOKING_CONFIRMED,
+    Booking.Status.COMPLETED: CAR_RETURNED,
+    Booking.Status.CANCELED: BOOKING_CANCELED,
+}
+
 
 @dataclass
 class BookingState:
+    # Declarative description of one status; the machine compiles these into TRANSITIONS.
     booking: Booking
+    allowed_transitions: ClassVar[tuple[str, ...]] = ()
 
     def transition_to(self, target_status: str) -> Booking:
-        if target_status not in self.allowed_transitions:
-            raise InvalidStateTransition(
-                f"Cannot transition booking from {self.booking.status} to {target_status}"
-            )
-
-        self.booking.status = target_status
-        car_status = CAR_STATUS_BY_BOOKING.get(target_status)
-        if car_status:
-            self.booking.car.status = car_status
-            self.booking.car.save(update_fields=["status"])
-        self.booking.save(update_fields=["status", "updated_at"])
-        self._emit_events(target_status)
-        return self.booking
-
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return ()
-
-    def _emit_events(self, target_status: str) -> None:
-        if target_status == Booking.Status.CONFIRMED:
-            event_bus.publish(BOOKING_CONFIRMED, self.booking)
-        if target_status == Booking.Status.COMPLETED:
-            event_bus.publish(CAR_RETURNED, self.booking)
+        return BookingStateMachine().transition(self.booking, target_status)
 
 
 class PendingState(BookingState):
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return (Booking.Status.CONFIRMED, Booking.Status.CANCELED)
+    allowed_transitions = (Booking.Status.CONFIRMED, Booking.Status.CANCELED)
 
 
 class ConfirmedState(BookingState):
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return (Booking.Status.ACTIVE, Booking.Status.CANCELED)
+    allowed_transitions = (Booking.Status.ACTIVE, Booking.Status.CANCELED)
 
 
 class ActiveState(BookingState):
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return (Booking.Status.COMPLETED, Booking.Status.CANCELED)
+    allowed_transitions = (Booking.Status.COMPLETED, Booking.Status.CANCELED)
 
 
 class CompletedState(BookingState):
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return ()
+    allowed_transitions = ()
 
 
 class CanceledState(BookingState):
-    @property
-    def allowed_transitions(self) -> tuple[str, ...]:
-        return ()
+    allowed_transitions = ()
 
 
 STATE_FACTORY = {
@@ -87,10 +74,159 @@ STATE_FACTORY = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class TransitionEffect:
+    source: str
+    target: str
+    car_status: str | None
+    event: str | None
+
+
+TransitionTable = Mapping[str, Mapping[str, TransitionEffect]]
+
+
+def compile_transitions(
+    factory: Mapping[str, type[BookingState]] = STATE_FACTORY,
+) -> TransitionTable:
+    return MappingProxyType(
+        {
+            str(source): MappingProxyType(
+                {
+                    str(target): TransitionEffect(
+                        source=str(source),
+                        target=str(target),
+                        car_status=CAR_STATUS_BY_BOOKING.get(target),
+                        event=EVENT_BY_STATUS.get(target),
+                    )
+                    for target in state_cls.allowed_transitions
+                }
+            )
+            for source, state_cls in factory.items()
+        }
+    )
+
+
+TRANSITIONS = compile_transitions()
+
+
 class BookingStateMachine:
+    # Transitions are a lookup in the precompiled table; effects are shared immutable objects,
+    # so validating a transition allocates nothing.
+    def __init__(self, table: TransitionTable = TRANSITIONS) -> None:
+        self.table = table
+
+    def effect(self, source: str, target_status: str) -> TransitionEffect:
+        targets = self.table.get(source)
+        if targets is None:
+            raise InvalidStateTransition(f"No state registered for {source}")
+        effect = targets.get(target_status)
+        if effect is None:
+            raise InvalidStateTransition(
+                f"Cannot transition booking from {source} to {target_status}"
+            )
+        return effect
+
+    def allowed_targets(self, source: str) -> Iterable[str]:
+        return self.table.get(source, {}).keys()
+
+    def can_transition(self, source: str, target_status: str) -> bool:
+        return target_status in self.table.get(source, ())
+
+    def check(self, booking: Booking, target_status: str) -> TransitionEffect:
+        return self.effect(booking.status, target_status)
+
     def transition(self, booking: Booking, target_status: str) -> Booking:
-        state_cls = STATE_FACTORY.get(booking.status)
-        if not state_cls:
-            raise InvalidStateTransition(f"No state registered for {booking.status}")
-        state = state_cls(booking)
-        return state.transition_to(target_status)
+        # Compare-and-swap: the UPDATE only matches while the row still has the status the
+        # transition was validated from, so concurrent transitions cannot both succeed. No
+        # savepoint is needed because nothing inside the block raises on a lost race.
+        effect = self.effect(booking.status, target_status)
+        now = timezone.now()
+        with transaction.atomic(savepoint=False):
+            updated = Booking.objects.filter(pk=booking.pk, status=effect.source).update(
+                status=effect.target, updated_at=now
+            )
+            if updated:
+                if effect.car_status:
+                    Car.objects.filter(pk=booking.car_id).update(status=effect.car_status)
+                    invalidate_catalog()
+                booking.status = effect.target
+                booking.updated_at = now
+                if effect.car_status and Booking.car.is_cached(booking):
+                    booking.car.status = effect.car_status
+                if effect.event:
+                    event_bus.publish(effect.event, booking)
+        if not updated:
+            current = Booking.objects.filter(pk=booking.pk).values_list("status", flat=True)
+            raise TransitionConflict(
+                f"Booking changed concurrently: expected {effect.source}, "
+                f"found {current.first() or 'no booking'}"
+            )
+        return booking
+
+    def validate_many(
+        self, bookings: Iterable[Booking], target_status: str
+    ) -> Tuple[List[Booking], Dict[object, str]]:
+        valid: List[Booking] = []
+        errors: Dict[object, str] = {}
+        for booking in bookings:
+            if self.can_transition(booking.status, target_status):
+                valid.append(booking)
+                continue
+            try:
+                self.effect(booking.status, target_status)
+            except InvalidStateTransition as exc:
+                errors[booking.pk] = str(exc)
+        return valid, errors
+
+    def replay(self, statuses: Iterable[str], start: str = Booking.Status.PENDING) -> str:
+        # Folds an event log of target statuses from `start`, raising on the first step that
+        # the table does not allow.
+        current = start
+        for target in statuses:
+            current = self.effect(current, target).target
+        return current
+
+    def transition_many(
+        self, bookings: Iterable[Booking], target_status: str
+    ) -> Tuple[List[Booking], Dict[object, str]]:
+        # Validates every booking in memory, then applies one conditional UPDATE per source
+        # status (compare-and-swap, as in transition()). Rows that changed in the meantime are
+        # reported as conflicts. The `updated_at` stamp identifies the rows this call wrote.
+        valid, errors = self.validate_many(bookings, target_status)
+        if not valid:
+            return valid, errors
+
+        now = timezone.now()
+        by_source: Dict[str, List[Booking]] = {}
+        for booking in valid:
+            by_source.setdefault(booking.status, []).append(booking)
+        with transaction.atomic():
+            for source, group in by_source.items():
+                Booking.objects.filter(pk__in=[b.pk for b in group], status=source).update(
+                    status=target_status, updated_at=now
+                )
+            written = set(
+                Booking.objects.filter(
+                    pk__in=[b.pk for b in valid], status=target_status, updated_at=now
+                ).values_list("pk", flat=True)
+            )
+            applied = [booking for booking in valid if booking.pk in written]
+            effect = None
+            for booking in valid:
+                if booking.pk not in written:
+                    errors[booking.pk] = f"Booking changed concurrently: expected {booking.status}"
+                    continue
+                effect = self.effect(booking.status, target_status)
+                booking.status = effect.target
+                booking.updated_at = now
+                if effect.car_status and Booking.car.is_cached(booking):
+                    booking.car.status = effect.car_status
+            if effect and effect.car_status:
+                Car.objects.filter(pk__in={b.car_id for b in applied}).update(
+                    status=effect.car_status
+                )
+                invalidate_catalog()
+            event_name = EVENT_BY_STATUS.get(target_status)
+            if event_name:
+                event_bus.publish_many(event_name, applied)
+        return applied, errors
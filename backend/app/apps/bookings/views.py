@@ -1,21 +1,47 @@
 from decimal import Decimal, InvalidOperation
 
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count
+from django.http import Http404
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from apps.common.async_views import AsyncAPIView
 from apps.common.permissions import IsManagerOrAdmin
 from apps.payments.services import PaymentService
 
 from .models import Booking
-from .serializers import BookingSerializer, FineSerializer
-from .services import BookingOverlapError, BookingService, InvalidStateTransition
+from .pagination import BookingKeysetPagination
+from .serializers import (
+    BookingListSerializer,
+    BookingSerializer,
+    BulkTransitionSerializer,
+    FineSerializer,
+)
+from .services import (
+    BookingOverlapError,
+    BookingService,
+    InvalidStateTransition,
+    TransitionConflict,
+)
+
+
+def transition_error(exc: InvalidStateTransition) -> Response:
+    code = (
+        status.HTTP_409_CONFLICT
+        if isinstance(exc, TransitionConflict)
+        else status.HTTP_400_BAD_REQUEST
+    )
+    return Response({"detail": str(exc)}, status=code)
 
 
 class BookingViewSet(viewsets.ModelViewSet):
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = BookingKeysetPagination
     http_method_names = ["get", "post"]
 
     @property
@@ -30,8 +56,20 @@ class BookingViewSet(viewsets.ModelViewSet):
             self._payment_service = PaymentService()
         return self._payment_service
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return BookingListSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self):
-        base_qs = Booking.objects.select_related("customer", "car").prefetch_related("fines")
+        if self.action == "list":
+            base_qs = Booking.objects.select_related("car", "deposit", "invoice").annotate(
+                fines_count=Count("fines")
+            )
+        else:
+            base_qs = Booking.objects.select_related(
+                "customer", "car", "deposit", "invoice"
+            ).prefetch_related("fines")
         user = self.request.user
         if user.role in (user.Role.ADMIN, user.Role.MANAGER):
             return base_qs
@@ -62,7 +100,7 @@ class BookingViewSet(viewsets.ModelViewSet):
         try:
             booking = self.booking_service.confirm_booking(booking)
         except InvalidStateTransition as exc:
-            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            return transition_error(exc)
         return Response(self.get_serializer(booking).data)
 
     @action(detail=True, methods=["post"], permission_classes=[IsManagerOrAdmin])
@@ -71,7 +109,7 @@ class BookingViewSet(viewsets.ModelViewSet):
         try:
             booking = self.booking_service.checkin_booking(booking)
         except InvalidStateTransition as exc:
-            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            return transition_error(exc)
         return Response(self.get_serializer(booking).data)
 
     @action(detail=True, methods=["post"], url_path="return", permission_classes=[IsManagerOrAdmin])
@@ -80,7 +118,7 @@ class BookingViewSet(viewsets.ModelViewSet):
         try:
             booking = self.booking_service.return_booking(booking)
         except InvalidStateTransition as exc:
-            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            return transition_error(exc)
         return Response(self.get_serializer(booking).data)
 
     @action(detail=True, methods=["post"])
@@ -94,9 +132,28 @@ class BookingViewSet(viewsets.ModelViewSet):
         try:
             booking = self.booking_service.cancel_booking(booking)
         except InvalidStateTransition as exc:
-            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            return transition_error(exc)
         return Response(self.get_serializer(booking).data)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-transition",
+        permission_classes=[IsManagerOrAdmin],
+    )
+    def bulk_transition(self, request):
+        serializer = BulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target = serializer.validated_data["status"]
+        results = self.booking_service.bulk_transition(serializer.validated_data["ids"], target)
+        return Response(
+            {
+                "status": target,
+                "updated": sum(result["ok"] for result in results),
+                "results": results,
+            }
+        )
+
     @action(detail=True, methods=["get", "post"], url_path="fines")
     def fines(self, request, pk=None):
         booking = self.get_object()
@@ -199,3 +256,28 @@ class BookingViewSet(viewsets.ModelViewSet):
             booking.car, booking.start_date, booking.end_date
         )
         return Response(quote)
+
+
+def build_invoice(booking: Booking):
+    return BookingService().build_invoice(booking)["invoice"]
+
+
+class AsyncPayInvoiceView(AsyncAPIView):
+    # BookingViewSet.pay_invoice for ASGI: the booking lookup, the provider call and the invoice
+    # update are awaited, so a worker keeps serving other requests while the gateway responds.
+    async def post(self, request, pk):
+        user = request.user
+        bookings = Booking.objects.select_related("invoice")
+        if user.role not in (user.Role.ADMIN, user.Role.MANAGER):
+            bookings = bookings.filter(customer=user)
+        try:
+            booking = await bookings.aget(pk=pk)
+        except (Booking.DoesNotExist, DjangoValidationError):
+            raise Http404
+        method = request.data.get("method", "card")
+
+        invoice = getattr(booking, "invoice", None)
+        if not invoice:
+            invoice = await sync_to_async(build_invoice)(booking)
+        invoice = await PaymentService().apay_invoice(invoice, method)
+        return self.render({"id": str(invoice.id), "status": "paid", "method": invoice.method})
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CarsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.cars"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
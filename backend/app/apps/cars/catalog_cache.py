@@ -0,0 +1,87 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+CATALOG_VERSION_KEY = "cars:catalog:version"
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    etag: str
+    data: Any
+
+
+class CatalogCache:
+    # Cached list/retrieve payloads are keyed by the shared catalog version, so bumping the
+    # version orphans every entry at once; stale ones simply expire.
+    def version(self) -> int:
+        version = cache.get(CATALOG_VERSION_KEY)
+        if version is None:
+            cache.add(CATALOG_VERSION_KEY, 0, timeout=None)
+            version = cache.get(CATALOG_VERSION_KEY, 0)
+        return version
+
+    def bump(self) -> None:
+        cache.add(CATALOG_VERSION_KEY, 0, timeout=None)
+        try:
+            cache.incr(CATALOG_VERSION_KEY)
+        except ValueError:
+            cache.set(CATALOG_VERSION_KEY, 1, timeout=None)
+
+    async def aversion(self) -> int:
+        version = await cache.aget(CATALOG_VERSION_KEY)
+        if version is None:
+            await cache.aadd(CATALOG_VERSION_KEY, 0, timeout=None)
+            version = await cache.aget(CATALOG_VERSION_KEY, 0)
+        return version
+
+    def key(self, kind: str, params: dict[str, list[str]]) -> str:
+        return self._key(self.version(), kind, params)
+
+    async def akey(self, kind: str, params: dict[str, list[str]]) -> str:
+        return self._key(await self.aversion(), kind, params)
+
+    def _key(self, version: int, kind: str, params: dict[str, list[str]]) -> str:
+        # Values are kept raw and in order: filters see the last value of a parameter verbatim,
+        # so only the order of parameter names is irrelevant.
+        normalized = urlencode([(name, value) for name in sorted(params) for value in params[name]])
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f"cars:catalog:{version}:{kind}:{digest}"
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> CatalogEntry:
+        entry = cache.get(key)
+        if entry is None:
+            entry = self._entry(build())
+            cache.set(key, entry, timeout=self._timeout())
+        return entry
+
+    async def aget_or_build(self, key: str, build: Callable[[], Awaitable[Any]]) -> CatalogEntry:
+        entry = await cache.aget(key)
+        if entry is None:
+            entry = self._entry(await build())
+            await cache.aset(key, entry, timeout=self._timeout())
+        return entry
+
+    def _entry(self, data: Any) -> CatalogEntry:
+        body = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+        return CatalogEntry(etag=f'"{hashlib.sha1(body.encode()).hexdigest()}"', data=data)
+
+    def _timeout(self) -> int:
+        return getattr(settings, "CAR_CATALOG_CACHE_TIMEOUT", 300)
+
+
+catalog_cache = CatalogCache()
+
+
+def invalidate_catalog() -> None:
+    # Bump immediately for the writing connection and again after commit, so a request that
+    # filled the cache while the transaction was still open does not keep the pre-commit rows.
+    catalog_cache.bump()
+    transaction.on_commit(catalog_cache.bump)
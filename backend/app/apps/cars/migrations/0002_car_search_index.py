@@ -0,0 +1,68 @@
+from django.db import migrations
+
+INDEX = "car_search_trgm_idx"
+FTS = "cars_car_search"
+DOCUMENT = "lower(make || ' ' || model || ' ' || type || ' ' || vin)"
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS {INDEX} ON cars_car USING gin (({DOCUMENT}) gin_trgm_ops)",
+]
+POSTGRES_REVERSE = [f"DROP INDEX IF EXISTS {INDEX}"]
+
+# FTS5 table sharing cars_car's rowid, kept in sync by triggers; the trigram tokenizer gives
+# the same substring semantics as pg_trgm. SQLite is the test/dev fallback, where the implicit
+# rowid is stable (nothing runs VACUUM).
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE {FTS} USING fts5(make, model, type, vin, tokenize = 'trigram')",
+    f"INSERT INTO {FTS} (rowid, make, model, type, vin) "
+    "SELECT rowid, make, model, type, vin FROM cars_car",
+    f"""
+    CREATE TRIGGER {FTS}_insert AFTER INSERT ON cars_car
+    BEGIN
+        INSERT INTO {FTS} (rowid, make, model, type, vin)
+        VALUES (NEW.rowid, NEW.make, NEW.model, NEW.type, NEW.vin);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_update AFTER UPDATE OF make, model, type, vin ON cars_car
+    BEGIN
+        UPDATE {FTS} SET make = NEW.make, model = NEW.model, type = NEW.type, vin = NEW.vin
+        WHERE rowid = OLD.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_delete AFTER DELETE ON cars_car
+    BEGIN
+        DELETE FROM {FTS} WHERE rowid = OLD.rowid;
+    END
+    """,
+]
+SQLITE_REVERSE = [
+    f"DROP TRIGGER IF EXISTS {FTS}_insert",
+    f"DROP TRIGGER IF EXISTS {FTS}_update",
+    f"DROP TRIGGER IF EXISTS {FTS}_delete",
+    f"DROP TABLE IF EXISTS {FTS}",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cars", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,79 @@
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+# Must match the expression of car_search_trgm_idx (migration 0002) for Postgres to use it.
+SEARCH_DOCUMENT = (
+    'lower("cars_car"."make" || \' \' || "cars_car"."model" || \' \' || '
+    '"cars_car"."type" || \' \' || "cars_car"."vin")'
+)
+FTS_TABLE = "cars_car_search"
+# pg_trgm and the FTS5 trigram tokenizer only index terms of three or more characters.
+MIN_TERM_LENGTH = 3
+
+
+def search_terms(query: str) -> list[str]:
+    return [term for term in query.lower().split() if term]
+
+
+def search_cars(cars: QuerySet, query: str) -> QuerySet:
+    # Filters to cars matching every term (substring match over make, model, type and VIN) and
+    # annotates `search_rank`, where higher is more relevant.
+    terms = search_terms(query)
+    if not terms:
+        return cars.annotate(search_rank=RawSQL("0", [], output_field=FloatField()))
+    if min(map(len, terms)) >= MIN_TERM_LENGTH:
+        if connection.vendor == "postgresql":
+            return _search_postgres(cars, terms)
+        if connection.vendor == "sqlite":
+            return _search_sqlite(cars, terms)
+    return _search_fallback(cars, terms)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_postgres(cars: QuerySet, terms: list[str]) -> QuerySet:
+    for term in terms:
+        cars = cars.filter(
+            RawSQL(f"{SEARCH_DOCUMENT} LIKE %s", [f"%{_escape_like(term)}%"], BooleanField())
+        )
+    return cars.annotate(
+        search_rank=RawSQL(
+            f"word_similarity(%s, {SEARCH_DOCUMENT})", [" ".join(terms)], FloatField()
+        )
+    )
+
+
+def _search_sqlite(cars: QuerySet, terms: list[str]) -> QuerySet:
+    # FTS5 bm25() is lower-is-better, hence the negation. LIMIT -1 stops SQLite from flattening
+    # the ranked match into the correlated lookup, so the MATCH runs once and is materialized
+    # (with an automatic rowid index) instead of once per car.
+    match = " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+    return cars.filter(
+        RawSQL(
+            f'"cars_car".rowid IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)',
+            [match],
+            BooleanField(),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            "(SELECT ranked.rank FROM "
+            f"(SELECT rowid, -rank AS rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s LIMIT -1)"
+            ' AS ranked WHERE ranked.rowid = "cars_car".rowid)',
+            [match],
+            FloatField(),
+        )
+    )
+
+
+def _search_fallback(cars: QuerySet, terms: list[str]) -> QuerySet:
+    for term in terms:
+        cars = cars.filter(
+            Q(make__icontains=term)
+            | Q(model__icontains=term)
+            | Q(type__icontains=term)
+            | Q(vin__icontains=term)
+        )
+    return cars.annotate(search_rank=RawSQL("0", [], output_field=FloatField()))
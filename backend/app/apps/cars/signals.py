@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.bookings.models import Booking
+
+from .catalog_cache import invalidate_catalog
+from .models import Car
+
+
+# Bookings feed the `available_from`/`available_to` filter, so saving one also invalidates.
+# There is deliberately no Booking post_delete receiver: it would disable the fast cascade
+# delete of bookings when cars are removed in bulk.
+@receiver(post_save, sender=Car, dispatch_uid="catalog_car_saved")
+@receiver(post_delete, sender=Car, dispatch_uid="catalog_car_deleted")
+@receiver(post_save, sender=Booking, dispatch_uid="catalog_booking_saved")
+def invalidate_car_catalog(sender, **kwargs) -> None:
+    invalidate_catalog()
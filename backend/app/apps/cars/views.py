@@ -1,13 +1,67 @@
-from rest_framework import permissions, viewsets
+from datetime import datetime
+
+from rest_framework import permissions, status, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.db.models import Q
 
+from apps.bookings.availability import filter_available
+from apps.common.async_views import AsyncAPIView
+from apps.common.pagination import AsyncPageNumberPagination
 from apps.common.permissions import IsManagerOrAdmin
 
+from .catalog_cache import CatalogEntry, catalog_cache
 from .models import Car
+from .search import search_cars
 from .serializers import CarSerializer
 
 
+def apply_filters(queryset, params):
+    if make := params.get("make"):
+        queryset = queryset.filter(make__icontains=make)
+    if model := params.get("model"):
+        queryset = queryset.filter(model__icontains=model)
+    if car_type := params.get("type"):
+        queryset = queryset.filter(type__iexact=car_type)
+    if status := params.get("status"):
+        queryset = queryset.filter(status=status)
+    if year_min := params.get("year_min"):
+        queryset = queryset.filter(year__gte=year_min)
+    if year_max := params.get("year_max"):
+        queryset = queryset.filter(year__lte=year_max)
+    available_from = params.get("available_from")
+    available_to = params.get("available_to")
+    if available_from or available_to:
+        queryset = _filter_available(queryset, available_from, available_to)
+    if search := params.get("search", "").strip():
+        return search_cars(queryset, search).order_by("-search_rank", "make", "model", "year")
+    return queryset.order_by("make", "model", "year")
+
+
+def _filter_available(queryset, available_from, available_to):
+    if not (available_from and available_to):
+        raise ValidationError("available_from and available_to must be provided together.")
+    try:
+        start_date = datetime.strptime(available_from, "%Y-%m-%d").date()
+        end_date = datetime.strptime(available_to, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValidationError("Invalid date format, expected YYYY-MM-DD.")
+    try:
+        return filter_available(queryset, start_date, end_date)
+    except ValueError as exc:
+        raise ValidationError(str(exc))
+
+
+def list_cache_params(request) -> dict[str, list[str]]:
+    # Pagination links are absolute, so the scheme and host are part of the key.
+    origin = f"{request.scheme}://{request.get_host()}"
+    return {**dict(request.query_params.lists()), "_origin": [origin]}
+
+
+def if_none_match(request, entry: CatalogEntry) -> bool:
+    tags = request.headers.get("If-None-Match", "")
+    return entry.etag in {tag.strip() for tag in tags.split(",")}
+
+
 class CarViewSet(viewsets.ModelViewSet):
     serializer_class = CarSerializer
     queryset = Car.objects.all()
@@ -19,29 +73,46 @@ class CarViewSet(viewsets.ModelViewSet):
         return [IsManagerOrAdmin()]
 
     def list(self, request, *args, **kwargs):
+        return self._cached_response(
+            catalog_cache.key("list", list_cache_params(request)), self._list_data
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        key = catalog_cache.key("detail", {"pk": [str(kwargs[self.lookup_field])]})
+        return self._cached_response(key, lambda: self.get_serializer(self.get_object()).data)
+
+    def _list_data(self):
         queryset = self.filter_queryset(self.get_queryset())
-        queryset = self._apply_filters(queryset, request)
+        queryset = apply_filters(queryset, self.request.query_params)
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-    def _apply_filters(self, queryset, request):
-        params = request.query_params
-        if make := params.get("make"):
-            queryset = queryset.filter(make__icontains=make)
-        if model := params.get("model"):
-            queryset = queryset.filter(model__icontains=model)
-        if car_type := params.get("type"):
-            queryset = queryset.filter(type__iexact=car_type)
-        if status := params.get("status"):
-            queryset = queryset.filter(status=status)
-        if year_min := params.get("year_min"):
-            queryset = queryset.filter(year__gte=year_min)
-        if year_max := params.get("year_max"):
-            queryset = queryset.filter(year__lte=year_max)
-        if search := params.get("search"):
-            queryset = queryset.filter(Q(model__icontains=search) | Q(make__icontains=search))
-        return queryset.order_by("make", "model", "year")
+            return self.get_paginated_response(serializer.data).data
+        return self.get_serializer(queryset, many=True).data
+
+    def _cached_response(self, key, build) -> Response:
+        entry: CatalogEntry = catalog_cache.get_or_build(key, build)
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if if_none_match(self.request, entry):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry.data, headers=headers)
+
+
+class AsyncCarListView(AsyncAPIView):
+    # GET /api/cars/ under ASGI. Shares catalog cache entries (and so ETags) with
+    # CarViewSet.list; create still goes through the viewset.
+    fallback = CarViewSet.as_view({"get": "list", "post": "create"})
+
+    async def get(self, request):
+        key = await catalog_cache.akey("list", list_cache_params(request))
+        entry = await catalog_cache.aget_or_build(key, lambda: self._list_data(request))
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if if_none_match(request, entry):
+            return self.render(None, status.HTTP_304_NOT_MODIFIED, headers)
+        return self.render(entry.data, headers=headers)
+
+    async def _list_data(self, request):
+        queryset = apply_filters(Car.objects.all(), request.query_params)
+        paginator = AsyncPageNumberPagination()
+        page = await paginator.apaginate_queryset(queryset, request)
+        return paginator.get_paginated_response(CarSerializer(page, many=True).data).data
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db_connections import connection_metrics
+        from .metrics import metrics
+
+        connection_created.connect(connection_metrics.connected)
+        metrics.add_collector(connection_metrics.render_metrics)
@@ -0,0 +1,78 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
+from django.http import Http404, HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from rest_framework import exceptions, permissions
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+
+class AsyncAPIView(View):
+    # A minimal async counterpart of APIView for hot read/payment paths under ASGI: the same
+    # authenticators, permissions, parsers and JSON rendering, with `async def` handlers.
+    # Methods without an async handler are served by `fallback`, a regular (sync) DRF view, so
+    # one URL can mix both.
+    permission_classes = [permissions.IsAuthenticated]
+    fallback = None
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None)
+        if request.method.lower() not in self.http_method_names or handler is None:
+            # Looked up on the class so the view function is not bound as a method.
+            fallback = type(self).fallback
+            if fallback is not None:
+                return await sync_to_async(fallback)(request, *args, **kwargs)
+            return await sync_to_async(self.http_method_not_allowed)(request, *args, **kwargs)
+
+        drf_request = Request(
+            request,
+            parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES],
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        self.request = drf_request
+        try:
+            await sync_to_async(self.check_permissions)(drf_request)
+            return await handler(drf_request, *args, **kwargs)
+        except Exception as exc:
+            data, status, headers = self.handle_exception(drf_request, exc)
+            return self.render(data, status, headers)
+
+    def check_permissions(self, request) -> None:
+        # Reading request.user runs the authenticators (which may query), hence sync_to_async.
+        for permission in [permission() for permission in self.permission_classes]:
+            if not permission.has_permission(request, self):
+                if request.authenticators and not request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, "message", None))
+
+    def handle_exception(self, request, exc) -> tuple[dict, int, dict]:
+        if isinstance(exc, Http404):
+            exc = exceptions.NotFound()
+        elif isinstance(exc, DjangoPermissionDenied):
+            exc = exceptions.PermissionDenied()
+        if not isinstance(exc, exceptions.APIException):
+            raise exc
+        headers = {}
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            header = request.authenticators[0].authenticate_header(request)
+            if header:
+                headers["WWW-Authenticate"] = header
+            else:
+                exc.status_code = 403
+        detail = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+        return detail, exc.status_code, headers
+
+    def render(self, data, status: int = 200, headers: dict | None = None) -> HttpResponse:
+        body = b"" if data is None else JSONRenderer().render(data)
+        response = HttpResponse(body, status=status, content_type="application/json")
+        for name, value in (headers or {}).items():
+            response[name] = value
+        return response
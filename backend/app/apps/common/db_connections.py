@@ -0,0 +1,105 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.db import connections
+
+
+@dataclass
+class ConnectionStats:
+    alias: str
+    mode: str
+    opened: int = 0
+    size: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    timeouts: int = 0
+
+
+class ConnectionMetrics:
+    # Per-process view of database connections. With persistent connections (CONN_MAX_AGE)
+    # `opened` counts real connects, so requests per connection shows how well they are reused.
+    # With a psycopg pool, Django "connects" by checking a connection out, and the size, in-use
+    # and wait figures come from the pool itself.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._opened: dict[str, int] = defaultdict(int)
+
+    def connected(self, sender, connection, **kwargs) -> None:
+        with self._lock:
+            self._opened[connection.alias] += 1
+
+    def stats(self) -> list[ConnectionStats]:
+        with self._lock:
+            opened = dict(self._opened)
+        result = []
+        for alias in connections:
+            connection = connections[alias]
+            pool = getattr(connection, "pool", None)
+            stats = ConnectionStats(
+                alias=alias,
+                mode="pool" if pool is not None else self._mode(connection),
+                opened=opened.get(alias, 0),
+            )
+            if pool is not None:
+                pool_stats = pool.get_stats()
+                stats.size = pool_stats.get("pool_size", 0)
+                stats.in_use = stats.size - pool_stats.get("pool_available", 0)
+                stats.waiting = pool_stats.get("requests_waiting", 0)
+                stats.waits = pool_stats.get("requests_queued", 0)
+                stats.wait_seconds = pool_stats.get("requests_wait_ms", 0) / 1000
+                stats.timeouts = pool_stats.get("requests_errors", 0)
+            result.append(stats)
+        return result
+
+    def render_metrics(self) -> list[str]:
+        all_stats = self.stats()
+        lines = []
+        for name, kind, help_text, attr in (
+            ("db_connections_opened_total", "counter", "Connections opened.", "opened"),
+            ("db_pool_size", "gauge", "Connections held by the pool.", "size"),
+            ("db_pool_in_use", "gauge", "Pool connections checked out.", "in_use"),
+            ("db_pool_waiting", "gauge", "Requests waiting for a connection.", "waiting"),
+            (
+                "db_pool_waits_total",
+                "counter",
+                "Requests that had to wait for a connection.",
+                "waits",
+            ),
+            (
+                "db_pool_wait_seconds_total",
+                "counter",
+                "Time spent waiting for a connection.",
+                "wait_seconds",
+            ),
+            (
+                "db_pool_timeouts_total",
+                "counter",
+                "Requests that got no connection in time.",
+                "timeouts",
+            ),
+        ):
+            series = [stats for stats in all_stats if attr == "opened" or stats.mode == "pool"]
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stats in series:
+                value = getattr(stats, attr)
+                value = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(f'{name}{{alias="{stats.alias}",mode="{stats.mode}"}} {value}')
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._opened.clear()
+
+    @staticmethod
+    def _mode(connection) -> str:
+        max_age = connection.settings_dict.get("CONN_MAX_AGE", 0)
+        return "per-request" if max_age == 0 else "persistent"
+
+
+connection_metrics = ConnectionMetrics()
@@ -1,18 +1,66 @@
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List
 
+from django.conf import settings
 
 Handler = Callable[[Any], None]
+BatchHandler = Callable[[List[Any]], None]
+
+SYNC = "sync"
+OUTBOX = "outbox"
 
 
 class EventBus:
-    def __init__(self) -> None:
+    def __init__(self, mode: str | None = None) -> None:
         self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._batch_handlers: Dict[Handler, BatchHandler] = {}
+        self._mode = mode
+
+    @property
+    def mode(self) -> str:
+        return self._mode or getattr(settings, "EVENT_BUS_MODE", SYNC)
 
-    def subscribe(self, event_name: str, handler: Handler) -> None:
+    @mode.setter
+    def mode(self, value: str | None) -> None:
+        self._mode = value
+
+    def subscribe(
+        self, event_name: str, handler: Handler, batch: BatchHandler | None = None
+    ) -> None:
+        # `batch`, when given, handles a whole publish_many() payload list in one call (set-based
+        # queries) and must have the same effect as calling `handler` for each payload.
         self._handlers[event_name].append(handler)
+        if batch is not None:
+            self._batch_handlers[handler] = batch
+
+    def publish(self, event_name: str, payload: Any, aggregate_id: Any = None) -> None:
+        if self.mode == OUTBOX:
+            from .outbox import enqueue
+
+            enqueue(event_name, payload, aggregate_id)
+            return
+        self.dispatch(event_name, payload)
+
+    def publish_many(
+        self, event_name: str, payloads: Iterable[Any], aggregate_ids: Iterable[Any] | None = None
+    ) -> None:
+        payloads = list(payloads)
+        if not payloads:
+            return
+        if self.mode == OUTBOX:
+            from .outbox import enqueue_many
+
+            enqueue_many(event_name, payloads, aggregate_ids)
+            return
+        for handler in list(self._handlers.get(event_name, [])):
+            batch = self._batch_handlers.get(handler)
+            if batch is not None:
+                batch(payloads)
+                continue
+            for payload in payloads:
+                handler(payload)
 
-    def publish(self, event_name: str, payload: Any) -> None:
+    def dispatch(self, event_name: str, payload: Any) -> None:
         for handler in list(self._handlers.get(event_name, [])):
             handler(payload)
 
@@ -21,10 +69,13 @@ class EventBus:
 
     def clear(self) -> None:
         self._handlers.clear()
+        self._batch_handlers.clear()
 
 
 event_bus = EventBus()
 
 BOOKING_CONFIRMED = "BookingConfirmed"
+BOOKING_CANCELED = "BookingCanceled"
 CAR_RETURNED = "CarReturned"
 FINE_APPLIED = "FineApplied"
+INVOICE_ISSUED = "InvoiceIssued"
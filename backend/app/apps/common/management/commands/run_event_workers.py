@@ -0,0 +1,77 @@
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.common.outbox import OutboxDispatcher
+
+
+class Command(BaseCommand):
+    help = "Drain the event outbox with a pool of worker threads (optionally across processes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Threads per process.")
+        parser.add_argument("--processes", type=int, default=1)
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument("--handler-timeout", type=float, default=None)
+        parser.add_argument("--max-attempts", type=int, default=None)
+        parser.add_argument(
+            "--once", action="store_true", help="Process currently due events and exit."
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            dispatcher = self._dispatcher(options)
+            total = 0
+            try:
+                while processed := dispatcher.run_once():
+                    total += processed
+            finally:
+                dispatcher.close()
+            self.stdout.write(self.style.SUCCESS(f"Processed {total} events."))
+            return
+
+        if options["processes"] <= 1:
+            self.stdout.write(f"Event worker started with {options['workers']} threads.")
+            self._run(options)
+            return
+
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=self._run, args=(options,), daemon=True)
+            for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(
+            f"Started {len(processes)} event worker processes "
+            f"with {options['workers']} threads each."
+        )
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+
+    def _dispatcher(self, options) -> OutboxDispatcher:
+        return OutboxDispatcher(
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            handler_timeout=options["handler_timeout"],
+            max_attempts=options["max_attempts"],
+        )
+
+    def _run(self, options) -> None:
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        dispatcher = self._dispatcher(options)
+        try:
+            dispatcher.run_forever(poll_interval=options["poll_interval"], stop=stop)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            dispatcher.close()
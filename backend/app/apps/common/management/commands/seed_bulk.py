@@ -0,0 +1,68 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.seeding import BulkSeeder
+
+
+class Command(BaseCommand):
+    help = "Generate large synthetic datasets (customers, cars, non-overlapping bookings)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cars", type=int, default=1000)
+        parser.add_argument("--customers", type=int, default=10000)
+        parser.add_argument("--bookings", type=int, default=100000)
+        parser.add_argument("--seed", type=int, default=0, help="Same seed, same data.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--prefix", default="bulk", help="Username/VIN prefix for rows (lowercase letters and digits).")
+        parser.add_argument(
+            "--end", type=date.fromisoformat, default=None, help="Last booking day (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--copy",
+            dest="use_copy",
+            action="store_true",
+            default=None,
+            help="Load with COPY (default on PostgreSQL).",
+        )
+        parser.add_argument("--no-copy", dest="use_copy", action="store_false")
+        parser.add_argument(
+            "--purge", action="store_true", help="Delete rows from a previous run first."
+        )
+        parser.add_argument(
+            "--rebuild-reports", action="store_true", help="Rebuild report rollups afterwards."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            seeder = BulkSeeder(
+                cars=options["cars"],
+                customers=options["customers"],
+                bookings=options["bookings"],
+                seed=options["seed"],
+                batch_size=options["batch_size"],
+                prefix=options["prefix"],
+                end=options["end"],
+                use_copy=options["use_copy"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["purge"]:
+            seeder.purge()
+        started = time.perf_counter()
+        summary = seeder.run()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {summary.customers} customers, {summary.cars} cars and "
+                f"{summary.bookings} bookings in {elapsed:.1f}s."
+            )
+        )
+
+        if options["rebuild_reports"]:
+            from apps.reports.rollups import rebuild_rollups
+
+            sources = rebuild_rollups(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt report rollups from {sources} sources."))
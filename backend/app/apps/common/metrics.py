@@ -0,0 +1,183 @@
+import hmac
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from django.conf import settings
+from django.http import HttpResponse
+
+Listener = Callable[[str, "RequestStats"], None]
+Collector = Callable[[], List[str]]
+
+
+@dataclass
+class RequestStats:
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    sql_seconds: float = 0.0
+    render_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.sql_seconds * 1000:.2f};desc="{self.queries} queries"',
+                f"render;dur={self.render_seconds * 1000:.2f}",
+                f"total;dur={self.wall_seconds * 1000:.2f}",
+            ]
+        )
+
+
+current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class QueryRecorder:
+    # Installed with connection.execute_wrapper(); attributes every statement to the request
+    # that is active in the current context.
+    def __call__(self, execute, sql, params, many, context):
+        stats = current_stats.get()
+        if stats is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stats.queries += 1
+            stats.sql_seconds += time.perf_counter() - started
+
+
+@dataclass
+class EndpointTotals:
+    requests: int = 0
+    errors: int = 0
+    queries: int = 0
+    sql_seconds: float = 0.0
+    render_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    max_queries: int = 0
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[tuple[str, str], EndpointTotals] = defaultdict(EndpointTotals)
+        self._listeners: List[Listener] = []
+        self._collectors: List[Collector] = []
+
+    def observe(self, endpoint: str, method: str, status: int, stats: RequestStats) -> None:
+        with self._lock:
+            totals = self._totals[(endpoint, method)]
+            totals.requests += 1
+            totals.errors += status >= 500
+            totals.queries += stats.queries
+            totals.sql_seconds += stats.sql_seconds
+            totals.render_seconds += stats.render_seconds
+            totals.wall_seconds += stats.wall_seconds
+            totals.max_queries = max(totals.max_queries, stats.queries)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(endpoint, stats)
+
+    def add_listener(self, listener: Listener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def add_collector(self, collector: Collector) -> None:
+        # Collectors return extra exposition lines (HELP/TYPE included) for render().
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[tuple[str, str], EndpointTotals]:
+        with self._lock:
+            return {key: EndpointTotals(**vars(value)) for key, value in self._totals.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+    def render(self) -> str:
+        series = [
+            ("http_requests_total", "counter", "Requests served.", "requests"),
+            ("http_request_errors_total", "counter", "Requests that returned 5xx.", "errors"),
+            ("http_request_queries_total", "counter", "SQL statements executed.", "queries"),
+            (
+                "http_request_queries_max",
+                "gauge",
+                "Most SQL statements in one request.",
+                "max_queries",
+            ),
+            ("http_request_sql_seconds_total", "counter", "Time spent in SQL.", "sql_seconds"),
+            (
+                "http_request_render_seconds_total",
+                "counter",
+                "Time spent rendering responses.",
+                "render_seconds",
+            ),
+            (
+                "http_request_seconds_total",
+                "counter",
+                "Wall time spent in requests.",
+                "wall_seconds",
+            ),
+        ]
+        snapshot = sorted(self.snapshot().items())
+        lines = []
+        for name, kind, help_text, attr in series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (endpoint, method), totals in snapshot:
+                value = getattr(totals, attr)
+                value = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(f'{name}{{endpoint="{endpoint}",method="{method}"}} {value}')
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def endpoint_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    view = match.func
+    cls = getattr(view, "cls", None)
+    if cls is None:
+        return getattr(view, "__name__", match.view_name)
+    actions = getattr(view, "actions", None)
+    if actions:
+        action = actions.get(request.method.lower(), request.method.lower())
+    else:
+        action = request.method.lower()
+    return f"{cls.__name__}.{action}"
+
+
+def metrics_allowed(request) -> bool:
+    # Scrapers authenticate with METRICS_TOKEN as a bearer token or come from one of
+    # METRICS_ALLOWED_IPS (matched on REMOTE_ADDR, not on forwarded headers). Neither is set by
+    # default, so the endpoint is closed until configured.
+    if request.META.get("REMOTE_ADDR") in getattr(settings, "METRICS_ALLOWED_IPS", []):
+        return True
+    token = getattr(settings, "METRICS_TOKEN", "")
+    scheme, _, supplied = request.headers.get("Authorization", "").partition(" ")
+    return bool(token) and scheme == "Bearer" and hmac.compare_digest(supplied, token)
+
+
+def metrics_view(request):
+    if not metrics_allowed(request):
+        response = HttpResponse("Unauthorized\n", status=401, content_type="text/plain")
+        response["WWW-Authenticate"] = 'Bearer realm="metrics"'
+        return response
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
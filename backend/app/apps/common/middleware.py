@@ -0,0 +1,73 @@
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from .metrics import QueryRecorder, RequestStats, current_stats, endpoint_name, metrics
+
+
+class RequestMetricsMiddleware:
+    # Async-capable so that under ASGI it does not pin every request to the sync thread. The
+    # query recorder still sees async ORM calls: they run with this context's connections.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.recorder = QueryRecorder()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, "REQUEST_METRICS_ENABLED", True):
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        try:
+            with self._recording():
+                response = self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        return self._finish(request, response, stats)
+
+    async def __acall__(self, request):
+        if not getattr(settings, "REQUEST_METRICS_ENABLED", True):
+            return await self.get_response(request)
+
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        try:
+            with self._recording():
+                response = await self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        return self._finish(request, response, stats)
+
+    def _recording(self) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self.recorder))
+        return stack
+
+    def _finish(self, request, response, stats: RequestStats):
+        stats.wall_seconds = time.perf_counter() - stats.started
+        response["Server-Timing"] = stats.server_timing()
+        metrics.observe(endpoint_name(request), request.method, response.status_code, stats)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook; time it via a post-render callback.
+        stats = current_stats.get()
+        if stats is not None:
+            started = time.perf_counter()
+
+            def finished(rendered):
+                stats.render_seconds += time.perf_counter() - started
+
+            response.add_post_render_callback(finished)
+        return response
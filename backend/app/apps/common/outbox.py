@@ -0,0 +1,204 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Iterable, List
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Exists, F, Model, OuterRef
+from django.utils import timezone
+
+from .event_bus import EventBus, event_bus
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+UNFINISHED = (OutboxEvent.Status.PENDING, OutboxEvent.Status.PROCESSING)
+
+# Set after a transaction that enqueued events commits, so an in-process dispatcher can skip
+# the rest of its poll interval.
+outbox_ready = threading.Event()
+
+
+def serialize_payload(payload: Any) -> dict:
+    if isinstance(payload, Model):
+        return {"model": payload._meta.label_lower, "pk": str(payload.pk)}
+    return {"value": payload}
+
+
+def deserialize_payload(data: dict) -> Any:
+    if "model" in data:
+        model = apps.get_model(data["model"])
+        return model._default_manager.get(pk=data["pk"])
+    return data.get("value")
+
+
+def enqueue(event_name: str, payload: Any, aggregate_id: Any = None) -> OutboxEvent:
+    # The row is written inside the caller's transaction, so it exists iff the change commits.
+    if aggregate_id is None:
+        aggregate_id = getattr(payload, "pk", None)
+    event = OutboxEvent.objects.create(
+        event_name=event_name,
+        aggregate_id="" if aggregate_id is None else str(aggregate_id),
+        payload=serialize_payload(payload),
+    )
+    transaction.on_commit(outbox_ready.set)
+    return event
+
+
+def enqueue_many(
+    event_name: str, payloads: Iterable[Any], aggregate_ids: Iterable[Any] | None = None
+) -> List[OutboxEvent]:
+    payloads = list(payloads)
+    if aggregate_ids is None:
+        aggregate_ids = [getattr(payload, "pk", None) for payload in payloads]
+    events = OutboxEvent.objects.bulk_create(
+        OutboxEvent(
+            event_name=event_name,
+            aggregate_id="" if aggregate_id is None else str(aggregate_id),
+            payload=serialize_payload(payload),
+        )
+        for payload, aggregate_id in zip(payloads, aggregate_ids, strict=True)
+    )
+    transaction.on_commit(outbox_ready.set)
+    return events
+
+
+class OutboxDispatcher:
+    def __init__(
+        self,
+        bus: EventBus | None = None,
+        workers: int = 4,
+        batch_size: int = 100,
+        handler_timeout: float | None = None,
+        max_attempts: int | None = None,
+        lease_seconds: float = 300,
+    ) -> None:
+        self.bus = bus or event_bus
+        self.workers = workers
+        self.batch_size = batch_size
+        self.handler_timeout = (
+            handler_timeout
+            if handler_timeout is not None
+            else getattr(settings, "EVENT_BUS_HANDLER_TIMEOUT", 10.0)
+        )
+        self.max_attempts = max_attempts or getattr(settings, "EVENT_BUS_MAX_ATTEMPTS", 5)
+        self.lease = timedelta(seconds=lease_seconds)
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._handler_pool = (
+            ThreadPoolExecutor(max_workers=max(workers, 1) * 2) if self.handler_timeout else None
+        )
+
+    def claim(self) -> List[OutboxEvent]:
+        # Only the oldest unfinished event of each aggregate is claimable, which keeps delivery
+        # ordered per aggregate even with several dispatchers polling the same table.
+        now = timezone.now()
+        earlier_unfinished = OutboxEvent.objects.filter(
+            aggregate_id=OuterRef("aggregate_id"), id__lt=OuterRef("id"), status__in=UNFINISHED
+        )
+        with transaction.atomic():
+            qs = (
+                OutboxEvent.objects.filter(status__in=UNFINISHED, available_at__lte=now)
+                .exclude(Exists(earlier_unfinished))
+                .order_by("id")
+            )
+            skip_locked = connection.features.has_select_for_update_skip_locked
+            if skip_locked:
+                qs = qs.select_for_update(skip_locked=True)
+            events = list(qs[: self.batch_size])
+            if not events:
+                return []
+            # The claim repeats the selection predicates, so a row another dispatcher claimed
+            # after we read it is left alone. Without SKIP LOCKED nothing stops two dispatchers
+            # reading the same rows; claiming row by row tells us which updates actually hit.
+            claimable = OutboxEvent.objects.filter(status__in=UNFINISHED, available_at__lte=now)
+            claim = {"status": OutboxEvent.Status.PROCESSING, "available_at": now + self.lease}
+            if skip_locked:
+                claimable.filter(id__in=[event.id for event in events]).update(**claim)
+            else:
+                events = [
+                    event for event in events if claimable.filter(id=event.id).update(**claim)
+                ]
+        return events
+
+    def process(self, event: OutboxEvent) -> bool:
+        # A retry runs every handler of the event again, including those that already succeeded,
+        # and an expired lease can hand a slow event to a second dispatcher. Handlers must
+        # therefore be idempotent.
+        try:
+            payload = deserialize_payload(event.payload)
+        except (LookupError, ObjectDoesNotExist) as exc:
+            self._finish(event, OutboxEvent.Status.FAILED, error=f"Payload unavailable: {exc}")
+            return False
+
+        try:
+            for handler in self.bus.subscriptions(event.event_name):
+                self._call(handler, payload)
+        except Exception as exc:
+            logger.exception("Handler failed for outbox event %s", event.id)
+            self._retry(event, exc)
+            return False
+        self._finish(event, OutboxEvent.Status.DONE)
+        return True
+
+    def run_once(self) -> int:
+        events = self.claim()
+        if not events:
+            return 0
+        if self._pool is None:
+            for event in events:
+                self.process(event)
+        else:
+            list(self._pool.map(self._process_in_thread, events))
+        return len(events)
+
+    def run_forever(self, poll_interval: float = 1.0, stop: threading.Event | None = None) -> None:
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            close_old_connections()
+            if self.run_once():
+                continue
+            outbox_ready.wait(poll_interval)
+            outbox_ready.clear()
+
+    def close(self) -> None:
+        for pool in (self._pool, self._handler_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, handler, payload: Any) -> None:
+        if self._handler_pool is None:
+            handler(payload)
+            return
+        # A timed-out handler cannot be interrupted; its thread finishes in the background
+        # while the event is scheduled for retry.
+        self._handler_pool.submit(handler, payload).result(timeout=self.handler_timeout)
+
+    def _process_in_thread(self, event: OutboxEvent) -> bool:
+        close_old_connections()
+        return self.process(event)
+
+    def _retry(self, event: OutboxEvent, exc: Exception) -> None:
+        attempts = event.attempts + 1
+        error = repr(exc) or exc.__class__.__name__
+        if attempts >= self.max_attempts:
+            self._finish(event, OutboxEvent.Status.FAILED, error=error)
+            return
+        backoff = timedelta(seconds=min(2**attempts, 300))
+        OutboxEvent.objects.filter(id=event.id).update(
+            status=OutboxEvent.Status.PENDING,
+            attempts=attempts,
+            available_at=timezone.now() + backoff,
+            last_error=error,
+        )
+
+    def _finish(self, event: OutboxEvent, status: str, error: str = "") -> None:
+        OutboxEvent.objects.filter(id=event.id).update(
+            status=status,
+            attempts=F("attempts") + 1,
+            processed_at=timezone.now(),
+            last_error=error,
+        )
@@ -0,0 +1,161 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    # Seek pagination over a unique, composite ordering: each page filters on the last row's
+    # key instead of OFFSET, and no COUNT(*) is issued.
+    ordering: tuple[str, ...] = ("-id",)
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+        ordering = self._flip(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self._seek(ordering, cursor["position"]))
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None if not reverse else has_more
+        self.first_position = self._position(rows[0]) if rows else None
+        self.last_position = self._position(rows[-1]) if rows else None
+        if cursor and not rows:
+            self.has_next = reverse
+            self.has_previous = not reverse
+            self.first_position = self.last_position = cursor["position"]
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        default = getattr(settings, "REST_FRAMEWORK", {}).get("PAGE_SIZE", 10)
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, default))
+        except (TypeError, ValueError):
+            return default
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self._link(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self._link(self.first_position, reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            position = [
+                self.model._meta.get_field(self._field_name(field)).to_python(value)
+                for field, value in zip(self.ordering, raw["p"], strict=True)
+            ]
+            return {"position": position, "reverse": bool(raw.get("r"))}
+        except (TypeError, ValueError, KeyError, FieldDoesNotExist, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _link(self, position, reverse: bool) -> str:
+        payload = {"p": [self._encode(value) for value in position]}
+        if reverse:
+            payload["r"] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _position(self, instance) -> list:
+        return [
+            getattr(instance, self.model._meta.get_field(self._field_name(field)).attname)
+            for field in self.ordering
+        ]
+
+    def _seek(self, ordering, position) -> Q:
+        seek = Q()
+        for idx, field in enumerate(ordering):
+            name = self._field_name(field)
+            lookup = "lt" if field.startswith("-") else "gt"
+            clause = Q(**{f"{name}__{lookup}": position[idx]})
+            for prev_field, value in zip(ordering[:idx], position[:idx]):
+                clause &= Q(**{self._field_name(prev_field): value})
+            seek |= clause
+        return seek
+
+    @staticmethod
+    def _field_name(field: str) -> str:
+        return field.lstrip("-")
+
+    @staticmethod
+    def _flip(ordering) -> tuple[str, ...]:
+        return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+    @staticmethod
+    def _encode(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        if isinstance(value, (int, float, str)) or value is None:
+            return value
+        return str(value)
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    # PageNumberPagination for async views: the COUNT and the page are fetched with the async
+    # ORM; the links and response body are the same as the sync class produces.
+    async def apaginate_queryset(self, queryset, request) -> list:
+        self.request = request
+        paginator = self.django_paginator_class(queryset, self.get_page_size(request))
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=exc))
+        self.page.object_list = [item async for item in self.page.object_list]
+        return self.page.object_list
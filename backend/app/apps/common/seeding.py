@@ -0,0 +1,242 @@
+import csv
+import io
+import random
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable, Iterator, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.cars.catalog_cache import invalidate_catalog
+from apps.cars.models import Car
+from apps.users.models import CustomerProfile
+
+CATALOG = [
+    ("Toyota", "Camry", "sedan"),
+    ("Honda", "Civic", "sedan"),
+    ("Ford", "Escape", "suv"),
+    ("Tesla", "Model 3", "sedan"),
+    ("Chevrolet", "Tahoe", "suv"),
+    ("BMW", "X5", "suv"),
+    ("Audi", "A4", "sedan"),
+    ("Hyundai", "Elantra", "sedan"),
+    ("Kia", "Sorento", "suv"),
+    ("Jeep", "Wrangler", "suv"),
+    ("Volkswagen", "Golf", "hatchback"),
+    ("Mazda", "CX-5", "suv"),
+]
+
+CANCEL_RATE = 0.05
+
+# Lowercase letters and digits only: the VIN prefix is the upper-cased prefix plus "-", so two
+# different prefixes never produce the same VINs or match each other's rows on purge.
+PREFIX_PATTERN = re.compile(r"[a-z0-9]+")
+VIN_LENGTH = 17
+
+# Written unquoted for NULL so that empty strings stay empty strings under COPY ... CSV.
+COPY_NULL = "\\N"
+
+
+@dataclass
+class SeedSummary:
+    customers: int
+    cars: int
+    bookings: int
+
+
+class BulkSeeder:
+    # Generates customers, cars and per-car booking timelines that never overlap, entirely from
+    # a seeded RNG (ids included), and writes them in batches with bulk_create or COPY.
+    def __init__(
+        self,
+        cars: int,
+        customers: int,
+        bookings: int,
+        seed: int = 0,
+        batch_size: int = 5000,
+        prefix: str = "bulk",
+        end: date | None = None,
+        use_copy: bool | None = None,
+        password: str = "bulkpass",
+    ) -> None:
+        if customers < 1 and bookings:
+            raise ValueError("Bookings need at least one customer")
+        if cars < 1 and bookings:
+            raise ValueError("Bookings need at least one car")
+        if not PREFIX_PATTERN.fullmatch(prefix):
+            raise ValueError("The prefix may only contain lowercase letters and digits")
+        digits = VIN_LENGTH - len(prefix) - 1
+        if digits < len(str(max(cars - 1, 0))):
+            raise ValueError(f"The prefix {prefix!r} leaves no room to number {cars} cars in a VIN")
+        self.cars = cars
+        self.customers = customers
+        self.bookings = bookings
+        self.batch_size = batch_size
+        self.prefix = prefix
+        self.end = end or timezone.localdate() + timedelta(days=60)
+        self.use_copy = connection.vendor == "postgresql" if use_copy is None else use_copy
+        self.password = password
+        self.rng = random.Random(seed)
+        self.today = timezone.localdate()
+        self.customer_ids: List[uuid.UUID] = []
+        self.car_ids: List[uuid.UUID] = []
+
+    @property
+    def vin_prefix(self) -> str:
+        return f"{self.prefix.upper()}-"
+
+    @property
+    def username_prefix(self) -> str:
+        return f"{self.prefix}-customer-"
+
+    def run(self) -> SeedSummary:
+        with transaction.atomic():
+            self.customer_ids = self._seed_customers()
+            self.car_ids = self._seed_cars()
+            self._insert(Booking, self._bookings(self.car_ids, self.customer_ids))
+            invalidate_catalog()
+        return SeedSummary(
+            customers=len(self.customer_ids), cars=len(self.car_ids), bookings=self.bookings
+        )
+
+    def purge(self) -> None:
+        Booking.objects.filter(car__vin__startswith=self.vin_prefix).delete()
+        Car.objects.filter(vin__startswith=self.vin_prefix).delete()
+        get_user_model().objects.filter(username__startswith=self.username_prefix).delete()
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _seed_customers(self) -> List[uuid.UUID]:
+        User = get_user_model()
+        password = make_password(self.password)
+        joined = timezone.now()
+        ids = [self._uuid() for _ in range(self.customers)]
+        self._insert(
+            User,
+            (
+                User(
+                    id=user_id,
+                    username=f"{self.username_prefix}{idx}",
+                    email=f"{self.username_prefix}{idx}@example.com",
+                    password=password,
+                    role=User.Role.CUSTOMER,
+                    date_joined=joined,
+                )
+                for idx, user_id in enumerate(ids)
+            ),
+        )
+        self._insert(
+            CustomerProfile,
+            (
+                CustomerProfile(
+                    id=self._uuid(),
+                    user_id=user_id,
+                    full_name=f"Customer {idx}",
+                    phone=f"555-{idx % 10000:04d}",
+                    driver_license_no=f"DL-{idx:08d}",
+                    address=f"{idx} Bulk Street",
+                )
+                for idx, user_id in enumerate(ids)
+            ),
+        )
+        return ids
+
+    def _seed_cars(self) -> List[uuid.UUID]:
+        ids = []
+
+        def cars() -> Iterator[Car]:
+            digits = VIN_LENGTH - len(self.vin_prefix)
+            for idx in range(self.cars):
+                make, model, car_type = CATALOG[idx % len(CATALOG)]
+                car_id = self._uuid()
+                ids.append(car_id)
+                yield Car(
+                    id=car_id,
+                    make=make,
+                    model=model,
+                    year=2015 + self.rng.randrange(10),
+                    vin=f"{self.vin_prefix}{idx:0{digits}d}",
+                    type=car_type,
+                    base_price_per_day=Decimal(self.rng.randrange(4000, 20000)) / 100,
+                    mileage=self.rng.randrange(0, 150_000),
+                )
+
+        self._insert(Car, cars())
+        return ids
+
+    def _bookings(self, car_ids, customer_ids) -> Iterator[Booking]:
+        # Each car's timeline is walked backwards from `end` with random gaps, so intervals on
+        # the same car are disjoint by construction.
+        now = timezone.now()
+        per_car, remainder = divmod(self.bookings, max(len(car_ids), 1))
+        for idx, car_id in enumerate(car_ids):
+            end = self.end
+            for _ in range(per_car + (idx < remainder)):
+                end -= timedelta(days=self.rng.randint(0, 4))
+                start = end - timedelta(days=self.rng.randint(1, 7))
+                yield Booking(
+                    id=self._uuid(),
+                    customer_id=customer_ids[self.rng.randrange(len(customer_ids))],
+                    car_id=car_id,
+                    start_date=start,
+                    end_date=end,
+                    status=self._status(start, end),
+                    created_at=now,
+                    updated_at=now,
+                )
+                end = start
+
+    def _status(self, start: date, end: date) -> str:
+        # Both draws are always taken so the generated ids do not depend on the current date.
+        canceled, confirmed = self.rng.random() < CANCEL_RATE, self.rng.random() < 0.7
+        if canceled:
+            return Booking.Status.CANCELED
+        if end <= self.today:
+            return Booking.Status.COMPLETED
+        if start <= self.today:
+            return Booking.Status.ACTIVE
+        return Booking.Status.CONFIRMED if confirmed else Booking.Status.PENDING
+
+    def _insert(self, model, objs: Iterable[models.Model]) -> None:
+        batch = []
+        for obj in objs:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                self._write(model, batch)
+                batch = []
+        if batch:
+            self._write(model, batch)
+
+    def _write(self, model, batch) -> None:
+        if not self.use_copy:
+            model.objects.bulk_create(batch)
+            return
+        fields = list(model._meta.concrete_fields)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for obj in batch:
+            writer.writerow(
+                _copy_value(field.get_db_prep_save(getattr(obj, field.attname), connection))
+                for field in fields
+            )
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(model._meta.db_table)
+        sql = f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        with connection.cursor() as cursor, cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def _copy_value(value):
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return value
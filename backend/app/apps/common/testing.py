@@ -0,0 +1,73 @@
+from typing import Dict, List
+
+import pytest
+
+from .metrics import RequestStats, metrics
+
+# pytest plugin: every request served through RequestMetricsMiddleware during a test is checked
+# against a query budget. Budgets come from the `query_budgets` fixture (endpoint -> max
+# queries, overridable per conftest) and from `@pytest.mark.query_budget(...)` on the test,
+# which takes one number for every endpoint and/or a mapping of per-endpoint budgets. It also
+# empties the process-level caches around every test, so tests and benchmarks start cold.
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(limit=None, endpoints=None): fail when a request exceeds its query budget",
+    )
+
+
+@pytest.fixture
+def query_budgets() -> Dict[str, int]:
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def _enforce_query_budgets(request, query_budgets):
+    budgets = dict(query_budgets)
+    default = None
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is not None:
+        for arg in marker.args:
+            if isinstance(arg, dict):
+                budgets.update(arg)
+            else:
+                default = arg
+        default = marker.kwargs.get("limit", default)
+        budgets.update(marker.kwargs.get("endpoints") or {})
+
+    over: List[str] = []
+
+    def check(endpoint: str, stats: RequestStats) -> None:
+        limit = budgets.get(endpoint, default)
+        if limit is not None and stats.queries > limit:
+            over.append(f"{endpoint}: {stats.queries} queries (budget {limit})")
+
+    metrics.add_listener(check)
+    yield
+    metrics.remove_listener(check)
+    if over:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(over), pytrace=False)
+
+
+def reset_caches() -> None:
+    from django.core.cache import cache
+
+    from apps.pricing.quote_cache import quote_cache
+    from apps.pricing.rule_cache import pricing_rule_cache
+    from apps.users.authentication import token_state_cache
+    from apps.users.tokens import blacklisted_jti_cache
+
+    cache.clear()
+    pricing_rule_cache.clear()
+    quote_cache.reset()
+    token_state_cache.clear()
+    blacklisted_jti_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    reset_caches()
+    yield
+    reset_caches()
@@ -1,5 +1,9 @@
+import asyncio
+import time
 from uuid import uuid4
 
+from django.conf import settings
+
 
 class MockDepositProvider:
     def hold(self, amount):
@@ -13,9 +17,19 @@ class MockDepositProvider:
 
 
 class MockInvoiceProvider:
+    # PAYMENT_PROVIDER_LATENCY simulates the gateway round trip, in seconds.
     def pay(self, amount, method):
+        time.sleep(self._latency())
+        return f"payment-{uuid4()}-{method}-{amount}"
+
+    async def apay(self, amount, method):
+        await asyncio.sleep(self._latency())
         return f"payment-{uuid4()}-{method}-{amount}"
 
+    @staticmethod
+    def _latency() -> float:
+        return getattr(settings, "PAYMENT_PROVIDER_LATENCY", 0.0)
+
 
 class PaymentProviderFactory:
     def get_deposit_provider(self):
@@ -44,3 +44,12 @@ class PaymentService:
         invoice.payment_reference = txn_ref
         invoice.save(update_fields=["method", "paid_at", "payment_reference", "updated_at"])
         return invoice
+
+    async def apay_invoice(self, invoice: Invoice, method: str) -> Invoice:
+        provider = self.provider_factory.get_invoice_provider()
+        txn_ref = await provider.apay(invoice.total, method)
+        invoice.method = method
+        invoice.paid_at = timezone.now()
+        invoice.payment_reference = txn_ref
+        await invoice.asave(update_fields=["method", "paid_at", "payment_reference", "updated_at"])
+        return invoice
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class PricingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.pricing"
+
+    def ready(self) -> None:
+        from apps.common.metrics import metrics
+
+        from . import signals  # noqa: F401
+        from .quote_cache import quote_cache
+
+        metrics.add_collector(quote_cache.render_metrics)
@@ -0,0 +1,163 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Sequence
+
+from .money import from_cents, round_hundredths, to_cents
+from .rule_cache import RuleSet, pricing_rule_cache
+from .strategies import (
+    BasePriceStrategy,
+    DurationDiscountStrategy,
+    SeasonalStrategy,
+    YearDepreciationStrategy,
+)
+
+
+@dataclass
+class StageColumn:
+    name: str
+    metadata_key: str
+    amounts: array
+    rates: array | None = None
+    applied: bytearray | None = None
+
+
+@dataclass
+class FleetQuoteTable:
+    car_ids: List
+    ranges: List[tuple[date, date]]
+    days: array
+    totals: array
+    stages: List[StageColumn] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def index(self, car_id, start_date: date, end_date: date) -> int:
+        car_idx = self.car_ids.index(car_id)
+        range_idx = self.ranges.index((start_date, end_date))
+        return car_idx * len(self.ranges) + range_idx
+
+    def total(self, car_id, start_date: date, end_date: date) -> Decimal:
+        return from_cents(self.totals[self.index(car_id, start_date, end_date)])
+
+    def quote(self, car_id, start_date: date, end_date: date) -> Dict:
+        return self.quote_at(self.index(car_id, start_date, end_date))
+
+    def quote_at(self, idx: int) -> Dict:
+        days = self.days[idx % len(self.ranges)]
+        breakdown = []
+        for stage in self.stages:
+            if stage.applied is not None and not stage.applied[idx]:
+                continue
+            if stage.rates is None:
+                metadata = {stage.metadata_key: days}
+            else:
+                metadata = {stage.metadata_key: stage.rates[idx] / 100}
+            breakdown.append(
+                {"name": stage.name, "amount": from_cents(stage.amounts[idx]), "metadata": metadata}
+            )
+        return {"total": from_cents(self.totals[idx]), "breakdown": breakdown}
+
+    def as_dict(self) -> Dict[tuple, Dict]:
+        return {
+            (car_id, start_date, end_date): self.quote_at(car_idx * len(self.ranges) + range_idx)
+            for car_idx, car_id in enumerate(self.car_ids)
+            for range_idx, (start_date, end_date) in enumerate(self.ranges)
+        }
+
+
+class FleetPricingEngine:
+    def __init__(self, rule_set: RuleSet | None = None, today: date | None = None) -> None:
+        self.rule_set = rule_set or pricing_rule_cache.get()
+        self.today = today or date.today()
+        self._duration = DurationDiscountStrategy(self.rule_set.duration)
+        self._depreciation = YearDepreciationStrategy(self.rule_set.depreciation)
+        self._seasonal_rules = [
+            (rule.name or SeasonalStrategy.label, rule.months, to_cents(rule.multiplier) - 100)
+            for rule in self.rule_set.seasonal
+        ]
+
+    def price(self, cars: Sequence, ranges: Iterable[tuple[date, date]]) -> FleetQuoteTable:
+        ranges = list(ranges)
+        for start_date, end_date in ranges:
+            if end_date <= start_date:
+                raise ValueError("End date must be after start date")
+
+        n_ranges = len(ranges)
+        days = array("q", (max((end - start).days, 1) for start, end in ranges))
+        months = [start.month for start, _ in ranges]
+        prices = [to_cents(car.base_price_per_day) for car in cars]
+        years = [car.year for car in cars]
+
+        base = array("q", (price * d for price in prices for d in days))
+        totals = array("q", base)
+        table = FleetQuoteTable(
+            car_ids=[car.id for car in cars],
+            ranges=ranges,
+            days=days,
+            totals=totals,
+            stages=[StageColumn(BasePriceStrategy.label, "days", base)],
+        )
+
+        duration_rates = [self._duration.resolve_hundredths(d) for d in days]
+        table.stages.append(
+            self._discount_stage(
+                DurationDiscountStrategy.label,
+                totals,
+                (duration_rates[idx % n_ranges] for idx in range(len(totals))),
+            )
+        )
+
+        year_rates = {
+            year: self._depreciation.resolve_hundredths(year, self.today) for year in set(years)
+        }
+        table.stages.append(
+            self._discount_stage(
+                YearDepreciationStrategy.label,
+                totals,
+                (year_rates[year] for year in years for _ in range(n_ranges)),
+            )
+        )
+
+        for name, rule_months, uplift in self._seasonal_rules:
+            table.stages.append(self._seasonal_stage(name, rule_months, uplift, totals, months))
+        return table
+
+    @staticmethod
+    def _discount_stage(name: str, totals: array, rates: Iterable[int]) -> StageColumn:
+        amounts = array("q", bytes(8 * len(totals)))
+        rate_column = array("q", bytes(8 * len(totals)))
+        applied = bytearray(len(totals))
+        for idx, rate in enumerate(rates):
+            if rate <= 0:
+                continue
+            discount = round_hundredths(totals[idx] * rate)
+            amounts[idx] = -discount
+            rate_column[idx] = rate
+            applied[idx] = 1
+            totals[idx] -= discount
+        return StageColumn(name, "rate", amounts, rate_column, applied)
+
+    @staticmethod
+    def _seasonal_stage(
+        name: str, rule_months, uplift: int, totals: array, months: List[int]
+    ) -> StageColumn:
+        n_ranges = len(months)
+        amounts = array("q", bytes(8 * len(totals)))
+        multipliers = array("q", [uplift + 100]) * len(totals)
+        applied = bytearray(len(totals))
+        matching = [idx for idx, month in enumerate(months) if month in rule_months]
+        if uplift and matching:
+            for base_idx in range(0, len(totals), n_ranges):
+                for range_idx in matching:
+                    idx = base_idx + range_idx
+                    raw = totals[idx] * uplift
+                    if raw == 0:
+                        continue
+                    adjustment = round_hundredths(raw)
+                    amounts[idx] = adjustment
+                    applied[idx] = 1
+                    totals[idx] += adjustment
+        return StageColumn(name, "multiplier", amounts, multipliers, applied)
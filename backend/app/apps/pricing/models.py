@@ -22,3 +22,15 @@ class PricingRule(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - display utility
         return f"{self.name} ({self.strategy_type})"
+
+
+class PricingRulesVersion(models.Model):
+    # Single row, bumped in the same transaction as every rule change, so each worker process
+    # can tell that its compiled rules are stale without sharing a cache.
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover - display utility
+        return f"Pricing rules v{self.version}"
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+
+CENT = Decimal("0.01")
+
+
+def to_cents(value: Decimal | float | int | str) -> int:
+    # Same rounding as quantizing to 0.01 with ROUND_HALF_UP (see strategies.to_decimal).
+    if isinstance(value, int):
+        return value * 100
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int(value.quantize(CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def round_hundredths(value: int) -> int:
+    # ``value`` is an amount in cents multiplied by a rate in hundredths; rounds back to cents
+    # with ROUND_HALF_UP (away from zero), matching ``to_decimal``.
+    quotient, remainder = divmod(abs(value), 100)
+    cents = quotient + (remainder >= 50)
+    return cents if value >= 0 else -cents
+
+
+class Money:
+    # An amount in integer cents. Arithmetic stays in ints; Decimal and strings are produced only
+    # when serializing (``to_decimal``/``str``).
+    __slots__ = ("cents",)
+
+    def __init__(self, cents: int = 0) -> None:
+        self.cents = cents
+
+    @classmethod
+    def of(cls, value: Money | Decimal | float | int | str) -> Money:
+        if isinstance(value, Money):
+            return value
+        return cls(to_cents(value))
+
+    def to_decimal(self) -> Decimal:
+        return from_cents(self.cents)
+
+    def times_rate(self, hundredths: int) -> Money:
+        return Money(round_hundredths(self.cents * hundredths))
+
+    def __add__(self, other: Money) -> Money:
+        if isinstance(other, Money):
+            return Money(self.cents + other.cents)
+        return NotImplemented
+
+    def __radd__(self, other) -> Money:
+        # Lets sum() start from its default 0.
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: Money) -> Money:
+        if isinstance(other, Money):
+            return Money(self.cents - other.cents)
+        return NotImplemented
+
+    def __neg__(self) -> Money:
+        return Money(-self.cents)
+
+    def __mul__(self, factor: int) -> Money:
+        if isinstance(factor, int):
+            return Money(self.cents * factor)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Money):
+            return self.cents == other.cents
+        return NotImplemented
+
+    def __lt__(self, other: Money) -> bool:
+        return self.cents < other.cents
+
+    def __le__(self, other: Money) -> bool:
+        return self.cents <= other.cents
+
+    def __hash__(self) -> int:
+        return hash(self.cents)
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def __str__(self) -> str:
+        sign = "-" if self.cents < 0 else ""
+        units, cents = divmod(abs(self.cents), 100)
+        return f"{sign}{units}.{cents:02d}"
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+
+ZERO = Money(0)
@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .money import to_cents
+
+
+@dataclass
+class QuoteCacheStats:
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.shared_hits + self.misses
+        return (self.hits + self.shared_hits) / lookups if lookups else 0.0
+
+
+def copy_quote(quote: dict) -> dict:
+    # Callers get their own dicts so that mutating a quote cannot change the cached one.
+    return {
+        "total": quote["total"],
+        "breakdown": [{**item, "metadata": dict(item["metadata"])} for item in quote["breakdown"]],
+    }
+
+
+class QuoteCache:
+    # Quotes are keyed on everything that changes the price: the rule-set version, the car's
+    # base price and year, the dates and the current year (default depreciation is by age).
+    # Rule or price changes therefore produce new keys and old entries age out of the LRU.
+    # A process-local LRU with a TTL sits in front of the optional shared Django cache.
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        timeout: float | None = None,
+        shared: bool | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._stats = QuoteCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries() > 0
+
+    def key(self, version: int, car, start_date: date, end_date: date) -> tuple:
+        return (
+            version,
+            to_cents(car.base_price_per_day),
+            car.year,
+            start_date,
+            end_date,
+            date.today().year,
+        )
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], dict]) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return copy_quote(entry[1])
+
+        quote = None
+        if self._shared():
+            quote = cache.get(self._shared_key(key))
+        with self._lock:
+            if quote is None:
+                self._stats.misses += 1
+            else:
+                self._stats.shared_hits += 1
+        if quote is None:
+            quote = compute()
+            if self._shared():
+                cache.set(self._shared_key(key), quote, timeout=self._timeout())
+        self._store(key, quote, now)
+        return copy_quote(quote)
+
+    def stats(self) -> QuoteCacheStats:
+        with self._lock:
+            return QuoteCacheStats(**{**vars(self._stats), "size": len(self._entries)})
+
+    def clear(self) -> None:
+        # Local entries only; shared entries are orphaned by the rule version or car price.
+        with self._lock:
+            self._entries.clear()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = QuoteCacheStats()
+
+    def render_metrics(self) -> list[str]:
+        stats = self.stats()
+        lines = []
+        for name, kind, help_text, value in (
+            ("pricing_quote_cache_hits_total", "counter", "Quotes served from cache.", None),
+            ("pricing_quote_cache_misses_total", "counter", "Quotes computed.", stats.misses),
+            (
+                "pricing_quote_cache_evictions_total",
+                "counter",
+                "Quotes evicted from the local LRU.",
+                stats.evictions,
+            ),
+            ("pricing_quote_cache_entries", "gauge", "Quotes in the local LRU.", stats.size),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if value is None:
+                lines.append(f'{name}{{layer="local"}} {stats.hits}')
+                lines.append(f'{name}{{layer="shared"}} {stats.shared_hits}')
+            else:
+                lines.append(f"{name} {value}")
+        return lines
+
+    def _store(self, key: tuple, quote: dict, now: float) -> None:
+        limit = self._max_entries()
+        with self._lock:
+            self._entries[key] = (now + self._timeout(), quote)
+            self._entries.move_to_end(key)
+            while len(self._entries) > limit:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def _shared_key(self, key: tuple) -> str:
+        version, cents, year, start_date, end_date, today_year = key
+        return f"pricing:quote:{version}:{cents}:{year}:{start_date}:{end_date}:{today_year}"
+
+    def _max_entries(self) -> int:
+        if self.max_entries is not None:
+            return self.max_entries
+        return getattr(settings, "PRICING_QUOTE_CACHE_SIZE", 10_000)
+
+    def _timeout(self) -> float:
+        if self.timeout is not None:
+            return self.timeout
+        return getattr(settings, "PRICING_QUOTE_CACHE_TIMEOUT", 300)
+
+    def _shared(self) -> bool:
+        if self.shared is not None:
+            return self.shared
+        return getattr(settings, "PRICING_QUOTE_CACHE_SHARED", False)
+
+
+quote_cache = QuoteCache()
@@ -0,0 +1,111 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db.models import F
+
+from apps.pricing.models import PricingRule, PricingRulesVersion
+
+from .strategies import DepreciationRule, DurationRule, SeasonalRule
+
+@dataclass(frozen=True)
+class RuleSet:
+    version: int
+    seasonal: tuple[SeasonalRule, ...] = field(default_factory=tuple)
+    duration: tuple[DurationRule, ...] = field(default_factory=tuple)
+    depreciation: tuple[DepreciationRule, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def load(cls, version: int) -> "RuleSet":
+        seasonal, duration, depreciation = [], [], []
+        for rule in PricingRule.objects.filter(active=True):
+            if rule.strategy_type == PricingRule.StrategyType.SEASONAL:
+                seasonal.append(SeasonalRule.from_model(rule))
+            elif rule.strategy_type == PricingRule.StrategyType.DURATION_DISCOUNT:
+                duration.append(DurationRule.from_model(rule))
+            elif rule.strategy_type == PricingRule.StrategyType.YEAR_DEPRECIATION:
+                depreciation.append(DepreciationRule.from_model(rule))
+        return cls(
+            version=version,
+            seasonal=tuple(seasonal),
+            duration=tuple(duration),
+            depreciation=tuple(depreciation),
+        )
+
+
+class PricingRuleCache:
+    # The version row is read at most every PRICING_RULES_CHECK_INTERVAL seconds; the rules are
+    # reloaded when it moved, and unconditionally after PRICING_RULES_MAX_AGE seconds so that a
+    # change written without a bump (e.g. QuerySet.update) cannot leave them stale for good.
+    def __init__(self, check_interval: float | None = None, max_age: float | None = None) -> None:
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._rule_set: RuleSet | None = None
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+
+    def get(self) -> RuleSet:
+        rule_set = self._rule_set
+        now = time.monotonic()
+        if rule_set is not None and now - self._checked_at < self._interval():
+            return rule_set
+
+        with self._lock:
+            version = self._shared_version()
+            rule_set = self._rule_set
+            if (
+                rule_set is None
+                or rule_set.version != version
+                or now - self._loaded_at >= self._max_age()
+            ):
+                rule_set = RuleSet.load(version)
+                self._rule_set = rule_set
+                self._loaded_at = now
+            self._checked_at = now
+        return rule_set
+
+    @property
+    def version(self) -> int:
+        return self.get().version
+
+    def invalidate(self) -> None:
+        # Runs inside the writing transaction: other processes see the new version exactly when
+        # they can see the new rules.
+        with self._lock:
+            self._rule_set = None
+            bumped = PricingRulesVersion.objects.filter(pk=PricingRulesVersion.SINGLETON_ID)
+            if not bumped.update(version=F("version") + 1):
+                _, created = PricingRulesVersion.objects.get_or_create(
+                    pk=PricingRulesVersion.SINGLETON_ID, defaults={"version": 1}
+                )
+                if not created:
+                    bumped.update(version=F("version") + 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rule_set = None
+            self._checked_at = self._loaded_at = 0.0
+
+    def _interval(self) -> float:
+        if self.check_interval is not None:
+            return self.check_interval
+        return getattr(settings, "PRICING_RULES_CHECK_INTERVAL", 1.0)
+
+    def _max_age(self) -> float:
+        if self.max_age is not None:
+            return self.max_age
+        return getattr(settings, "PRICING_RULES_MAX_AGE", 300.0)
+
+    @staticmethod
+    def _shared_version() -> int:
+        version = (
+            PricingRulesVersion.objects.filter(pk=PricingRulesVersion.SINGLETON_ID)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return version or 0
+
+
+pricing_rule_cache = PricingRuleCache()
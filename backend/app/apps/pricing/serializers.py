@@ -8,3 +8,28 @@ class PricingRuleSerializer(serializers.ModelSerializer):
         model = PricingRule
         fields = ["id", "name", "strategy_type", "params", "active", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+
+class QuoteRangeSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+
+    def validate(self, attrs):
+        if attrs["end"] <= attrs["start"]:
+            raise serializers.ValidationError("End date must be after start date.")
+        return attrs
+
+
+class BatchQuoteSerializer(serializers.Serializer):
+    MAX_QUOTES = 1000
+
+    cars = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+    ranges = serializers.ListField(child=QuoteRangeSerializer(), allow_empty=False)
+
+    def validate(self, attrs):
+        attrs["cars"] = list(dict.fromkeys(attrs["cars"]))
+        if len(attrs["cars"]) * len(attrs["ranges"]) > self.MAX_QUOTES:
+            raise serializers.ValidationError(
+                f"A batch may contain at most {self.MAX_QUOTES} car/range combinations."
+            )
+        return attrs
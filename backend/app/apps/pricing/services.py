@@ -1,8 +1,10 @@
 from datetime import date
 from typing import Iterable, Sequence
 
-from apps.pricing.models import PricingRule
+from apps.cars.models import Car
 
+from .quote_cache import QuoteCache, quote_cache as default_quote_cache
+from .rule_cache import PricingRuleCache, RuleSet, pricing_rule_cache
 from .strategies import (
     BasePriceStrategy,
     DurationDiscountStrategy,
@@ -14,32 +16,67 @@ from .strategies import (
 
 
 class PricingService:
-    def __init__(self, strategies: Sequence | None = None) -> None:
-        self.strategies = list(strategies) if strategies else self._default_strategies()
+    def __init__(
+        self,
+        strategies: Sequence | None = None,
+        rule_cache: PricingRuleCache | None = None,
+        quote_cache: QuoteCache | None = None,
+    ) -> None:
+        self.rule_cache = rule_cache or pricing_rule_cache
+        # Quotes are only memoized for the shared rule set, whose version identifies the rules.
+        self.rule_set: RuleSet | None = None
+        if strategies:
+            self.strategies = list(strategies)
+        else:
+            self.rule_set = self.rule_cache.get()
+            self.strategies = list(self.build_strategies(self.rule_set))
+        self.quote_cache = quote_cache or default_quote_cache
 
-    def _default_strategies(self) -> Iterable:
-        seasonal_rules = PricingRule.objects.filter(
-            strategy_type=PricingRule.StrategyType.SEASONAL, active=True
-        )
-        duration_rules = PricingRule.objects.filter(
-            strategy_type=PricingRule.StrategyType.DURATION_DISCOUNT, active=True
-        )
-        depreciation_rules = PricingRule.objects.filter(
-            strategy_type=PricingRule.StrategyType.YEAR_DEPRECIATION, active=True
-        )
+    @staticmethod
+    def build_strategies(rule_set: RuleSet) -> Iterable:
         return (
             BasePriceStrategy(),
-            DurationDiscountStrategy(duration_rules),
-            YearDepreciationStrategy(depreciation_rules),
-            SeasonalStrategy(seasonal_rules),
+            DurationDiscountStrategy(rule_set.duration),
+            YearDepreciationStrategy(rule_set.depreciation),
+            SeasonalStrategy(rule_set.seasonal),
         )
 
     def quote(self, car, start_date: date, end_date: date) -> dict:
         if end_date <= start_date:
             raise ValueError("End date must be after start date")
 
+        if self.rule_set is None or not self.quote_cache.enabled:
+            return self._price(car, start_date, end_date)
+        key = self.quote_cache.key(self.rule_set.version, car, start_date, end_date)
+        return self.quote_cache.get_or_compute(key, lambda: self._price(car, start_date, end_date))
+
+    def _price(self, car, start_date: date, end_date: date) -> dict:
         context = PricingContext(car=car, start_date=start_date, end_date=end_date)
         result = PricingResult()
         for strategy in self.strategies:
             strategy.apply(context, result)
         return result.as_dict()
+
+    def quote_many(self, cars: Iterable, ranges: Iterable[tuple[date, date]]) -> dict[tuple, dict]:
+        ranges = list(ranges)
+        for start_date, end_date in ranges:
+            if end_date <= start_date:
+                raise ValueError("End date must be after start date")
+
+        cars = self._resolve_cars(cars)
+        quotes: dict[tuple, dict] = {}
+        for car in cars:
+            for start_date, end_date in ranges:
+                quotes[(car.id, start_date, end_date)] = self.quote(car, start_date, end_date)
+        return quotes
+
+    def _resolve_cars(self, cars: Iterable) -> list:
+        cars = [car if isinstance(car, Car) else Car._meta.pk.to_python(car) for car in cars]
+        car_ids = [car for car in cars if not isinstance(car, Car)]
+        if not car_ids:
+            return cars
+        loaded = Car.objects.in_bulk(car_ids)
+        unknown = [car_id for car_id in car_ids if car_id not in loaded]
+        if unknown:
+            raise Car.DoesNotExist(f"Unknown cars: {', '.join(str(car_id) for car_id in unknown)}")
+        return [car if isinstance(car, Car) else loaded[car] for car in cars]
@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PricingRule
+from .quote_cache import quote_cache
+from .rule_cache import pricing_rule_cache
+
+
+@receiver(post_save, sender=PricingRule, dispatch_uid="pricing_rule_saved")
+@receiver(post_delete, sender=PricingRule, dispatch_uid="pricing_rule_deleted")
+def invalidate_pricing_rules(sender, **kwargs) -> None:
+    # The version row is bumped in the same transaction as the rule, so it becomes visible to
+    # other workers together with the change.
+    pricing_rule_cache.invalidate()
+    # Quotes of the old version can no longer be hit; drop them instead of waiting for the LRU.
+    quote_cache.clear()
+    transaction.on_commit(quote_cache.clear)
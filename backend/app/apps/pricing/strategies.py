@@ -3,15 +3,64 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, FrozenSet, Iterable, List
 
 from apps.pricing.models import PricingRule
 
+from .money import ZERO, Money, from_cents, to_cents
+
 
 def to_decimal(value: Decimal | float | int | str) -> Decimal:
     return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+@dataclass(frozen=True)
+class DurationRule:
+    min_days: int
+    discount_rate: Decimal
+
+    @classmethod
+    def from_model(cls, rule: PricingRule) -> "DurationRule":
+        params = rule.params or {}
+        return cls(
+            min_days=int(params.get("min_days", 0)),
+            discount_rate=to_decimal(params.get("discount_rate", 0)),
+        )
+
+
+@dataclass(frozen=True)
+class DepreciationRule:
+    rate: Decimal
+
+    @classmethod
+    def from_model(cls, rule: PricingRule) -> "DepreciationRule":
+        params = rule.params or {}
+        return cls(rate=to_decimal(params.get("rate", 0)))
+
+
+@dataclass(frozen=True)
+class SeasonalRule:
+    name: str
+    months: FrozenSet
+    multiplier: Decimal
+
+    @classmethod
+    def from_model(cls, rule: PricingRule) -> "SeasonalRule":
+        params = rule.params or {}
+        return cls(
+            name=rule.name,
+            months=frozenset(params.get("months", [])),
+            multiplier=to_decimal(params.get("multiplier", 1)),
+        )
+
+
+def _compile_rules(rules: Iterable | None, compiled_cls) -> list:
+    return [
+        rule if isinstance(rule, compiled_cls) else compiled_cls.from_model(rule)
+        for rule in (rules or [])
+    ]
+
+
 @dataclass
 class PricingContext:
     car: Any
@@ -26,27 +75,29 @@ class PricingContext:
 @dataclass
 class PriceBreakdownItem:
     name: str
-    amount: Decimal
+    amount: Money
     metadata: Dict | None = None
 
 
 @dataclass
 class PricingResult:
+    # Amounts are Money (integer cents) until as_dict(), the serialization boundary.
     breakdown: List[PriceBreakdownItem] = field(default_factory=list)
-    total: Decimal = field(default_factory=lambda: Decimal("0.00"))
+    total: Money = ZERO
 
-    def add_item(self, name: str, amount: Decimal, metadata: Dict | None = None) -> None:
-        normalized = to_decimal(amount)
-        self.breakdown.append(PriceBreakdownItem(name=name, amount=normalized, metadata=metadata))
-        self.total += normalized
+    def add_item(self, name: str, amount: Money | Decimal, metadata: Dict | None = None) -> None:
+        if not isinstance(amount, Money):
+            amount = Money.of(amount)
+        self.breakdown.append(PriceBreakdownItem(name=name, amount=amount, metadata=metadata))
+        self.total = Money(self.total.cents + amount.cents)
 
     def as_dict(self) -> Dict:
         return {
-            "total": to_decimal(self.total),
+            "total": from_cents(self.total.cents),
             "breakdown": [
                 {
                     "name": item.name,
-                    "amount": to_decimal(item.amount),
+                    "amount": from_cents(item.amount.cents),
                     "metadata": item.metadata or {},
                 }
                 for item in self.breakdown
@@ -65,79 +116,82 @@ class BasePriceStrategy(PricingStrategy):
     label = "Base price"
 
     def apply(self, context: PricingContext, result: PricingResult) -> None:
-        amount = to_decimal(context.car.base_price_per_day) * context.rental_days
+        amount = Money.of(context.car.base_price_per_day) * context.rental_days
         result.add_item(self.label, amount, metadata={"days": context.rental_days})
 
 
 class DurationDiscountStrategy(PricingStrategy):
     label = "Duration discount"
 
-    def __init__(self, rules: Iterable[PricingRule] | None = None) -> None:
-        self.rules = list(rules) if rules else []
+    def __init__(self, rules: Iterable[PricingRule | DurationRule] | None = None) -> None:
+        self.rules = _compile_rules(rules, DurationRule)
+        # Rule rates are quantized to hundredths, so they are exact as integers.
+        self._rates = [(rule.min_days, to_cents(rule.discount_rate)) for rule in self.rules]
 
     def apply(self, context: PricingContext, result: PricingResult) -> None:
-        rate = self._resolve_rate(context.rental_days)
+        rate = self.resolve_hundredths(context.rental_days)
         if rate <= 0:
             return
-        discount = result.total * rate
-        result.add_item(self.label, -discount, metadata={"rate": float(rate)})
-
-    def _resolve_rate(self, rental_days: int) -> Decimal:
-        matched_rate = Decimal("0.00")
-        for rule in self.rules:
-            params = rule.params or {}
-            min_days = int(params.get("min_days", 0))
+        discount = result.total.times_rate(rate)
+        result.add_item(self.label, -discount, metadata={"rate": rate / 100})
+
+    def resolve_hundredths(self, rental_days: int) -> int:
+        matched_rate = 0
+        for min_days, rate in self._rates:
             if rental_days >= min_days:
-                rule_rate = to_decimal(params.get("discount_rate", 0))
-                matched_rate = max(matched_rate, rule_rate)
-        if not self.rules and rental_days >= 7:
-            matched_rate = Decimal("0.10")
+                matched_rate = max(matched_rate, rate)
+        if not self._rates and rental_days >= 7:
+            matched_rate = 10
         return matched_rate
 
 
 class YearDepreciationStrategy(PricingStrategy):
     label = "Year depreciation"
 
-    def __init__(self, rules: Iterable[PricingRule] | None = None) -> None:
-        self.rules = list(rules) if rules else []
+    def __init__(self, rules: Iterable[PricingRule | DepreciationRule] | None = None) -> None:
+        self.rules = _compile_rules(rules, DepreciationRule)
+        self._rate = to_cents(self.rules[0].rate) if self.rules else None
 
     def apply(self, context: PricingContext, result: PricingResult) -> None:
-        depreciation_rate = self._resolve_rate(context.car.year)
+        depreciation_rate = self.resolve_hundredths(context.car.year)
         if depreciation_rate <= 0:
             return
-        amount = result.total * depreciation_rate
-        result.add_item(self.label, -amount, metadata={"rate": float(depreciation_rate)})
+        amount = result.total.times_rate(depreciation_rate)
+        result.add_item(self.label, -amount, metadata={"rate": depreciation_rate / 100})
 
-    def _resolve_rate(self, car_year: int) -> Decimal:
-        if self.rules:
-            params = self.rules[0].params or {}
-            return to_decimal(params.get("rate", 0))
+    def resolve_hundredths(self, car_year: int, today: date | None = None) -> int:
+        if self._rate is not None:
+            return self._rate
 
-        current_year = date.today().year
+        current_year = (today or date.today()).year
         age = max(current_year - car_year, 0)
-        return min(Decimal("0.01") * age, Decimal("0.20"))
+        return min(age, 20)
 
 
 class SeasonalStrategy(PricingStrategy):
     label = "Seasonal adjustment"
 
-    def __init__(self, rules: Iterable[PricingRule] | None = None) -> None:
-        self.rules = list(rules) if rules else []
+    def __init__(self, rules: Iterable[PricingRule | SeasonalRule] | None = None) -> None:
+        self.rules = None if rules is None else _compile_rules(rules, SeasonalRule)
 
     def apply(self, context: PricingContext, result: PricingResult) -> None:
         month = context.start_date.month
-        applicable_rules = self.rules or PricingRule.objects.filter(
-            strategy_type=PricingRule.StrategyType.SEASONAL, active=True
-        )
+        applicable_rules = self.rules
+        if applicable_rules is None:
+            applicable_rules = _compile_rules(
+                PricingRule.objects.filter(
+                    strategy_type=PricingRule.StrategyType.SEASONAL, active=True
+                ),
+                SeasonalRule,
+            )
         for rule in applicable_rules:
-            params = rule.params or {}
-            months = params.get("months", [])
-            if month not in months:
+            if month not in rule.months:
                 continue
-            multiplier = to_decimal(params.get("multiplier", 1))
-            adjustment = result.total * (multiplier - 1)
-            if adjustment == 0:
+            uplift = to_cents(rule.multiplier) - 100
+            if not uplift or not result.total:
                 continue
             result.add_item(
-                rule.name or self.label, adjustment, metadata={"multiplier": float(multiplier)}
+                rule.name or self.label,
+                result.total.times_rate(uplift),
+                metadata={"multiplier": float(rule.multiplier)},
             )
@@ -1,13 +1,14 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .views import PricingRuleViewSet, QuoteView
+from .views import BatchQuoteView, PricingRuleViewSet, QuoteView
 
 router = DefaultRouter()
 router.register("rules", PricingRuleViewSet, basename="pricing-rule")
 
 urlpatterns = [
     path("quote/", QuoteView.as_view(), name="pricing-quote"),
+    path("quote/batch/", BatchQuoteView.as_view(), name="pricing-quote-batch"),
 ]
 
 urlpatterns += router.urls
@@ -1,39 +1,45 @@
-from datetime import datetime
+from datetime import date, datetime
 
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.cars.models import Car
+from apps.common.async_views import AsyncAPIView
 from apps.common.permissions import IsAdmin
 from apps.pricing.services import PricingService
 
 from .models import PricingRule
-from .serializers import PricingRuleSerializer
+from .serializers import BatchQuoteSerializer, PricingRuleSerializer
+
+
+def parse_quote_params(params) -> tuple[str, date, date]:
+    # Shared by QuoteView and AsyncQuoteView; a ValueError message is the 400 response detail.
+    car_id = params.get("car")
+    start = params.get("start")
+    end = params.get("end")
+    if not (car_id and start and end):
+        raise ValueError("car, start, and end query parameters are required.")
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError("Invalid date format, expected YYYY-MM-DD.")
+    return car_id, start_date, end_date
 
 
 class QuoteView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        car_id = request.query_params.get("car")
-        start = request.query_params.get("start")
-        end = request.query_params.get("end")
-        if not (car_id and start and end):
-            return Response(
-                {"detail": "car, start, and end query parameters are required."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         try:
-            start_date = datetime.strptime(start, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end, "%Y-%m-%d").date()
-        except ValueError:
-            return Response(
-                {"detail": "Invalid date format, expected YYYY-MM-DD."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            car_id, start_date, end_date = parse_quote_params(request.query_params)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         car = get_object_or_404(Car, id=car_id)
         try:
@@ -43,6 +49,54 @@ class QuoteView(APIView):
         return Response(quote)
 
 
+def price_car(car, start_date, end_date) -> dict:
+    # PricingService() reads the compiled rule set, so it is built in the worker thread too.
+    return PricingService().quote(car, start_date, end_date)
+
+
+class AsyncQuoteView(AsyncAPIView):
+    # QuoteView for ASGI: the car is loaded with the async ORM. Pricing itself is CPU work over
+    # the in-process rule and quote caches, so it runs in a worker thread.
+    async def get(self, request):
+        try:
+            car_id, start_date, end_date = parse_quote_params(request.query_params)
+        except ValueError as exc:
+            return self.render({"detail": str(exc)}, status.HTTP_400_BAD_REQUEST)
+
+        try:
+            car = await Car.objects.aget(id=car_id)
+        except (Car.DoesNotExist, ValueError, ValidationError):
+            raise Http404
+        try:
+            quote = await sync_to_async(price_car)(car, start_date, end_date)
+        except ValueError as exc:
+            return self.render({"detail": str(exc)}, status.HTTP_400_BAD_REQUEST)
+        return self.render(quote)
+
+
+class BatchQuoteView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = BatchQuoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ranges = [(item["start"], item["end"]) for item in serializer.validated_data["ranges"]]
+        try:
+            quotes = PricingService().quote_many(serializer.validated_data["cars"], ranges)
+        except Car.DoesNotExist as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "quotes": [
+                    {"car": car_id, "start": start_date, "end": end_date, **quote}
+                    for (car_id, start_date, end_date), quote in quotes.items()
+                ]
+            }
+        )
+
+
 class PricingRuleViewSet(viewsets.ModelViewSet):
     queryset = PricingRule.objects.all()
     serializer_class = PricingRuleSerializer
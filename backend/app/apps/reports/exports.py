@@ -0,0 +1,132 @@
+import csv
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Iterator, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, DecimalField, QuerySet, Sum
+
+from apps.bookings.models import Booking, Fine, Invoice
+
+CHUNK_SIZE = 2000
+
+
+class Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+class Export:
+    columns: Sequence[tuple[str, str]] = ()
+
+    def queryset(self, start: date, end: date) -> QuerySet:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    @property
+    def headers(self) -> list[str]:
+        return [header for header, _ in self.columns]
+
+    def rows(self, start: date, end: date) -> Iterator[tuple]:
+        fields = [field for _, field in self.columns]
+        return self.queryset(start, end).values_list(*fields).iterator(chunk_size=CHUNK_SIZE)
+
+
+class BookingExport(Export):
+    columns = (
+        ("id", "id"),
+        ("customer_id", "customer_id"),
+        ("customer", "customer__username"),
+        ("car_id", "car_id"),
+        ("vin", "car__vin"),
+        ("make", "car__make"),
+        ("model", "car__model"),
+        ("type", "car__type"),
+        ("start_date", "start_date"),
+        ("end_date", "end_date"),
+        ("status", "status"),
+        ("created_at", "created_at"),
+        ("invoice_id", "invoice__id"),
+        ("invoice_total", "invoice__total"),
+        ("invoice_paid_at", "invoice__paid_at"),
+        ("invoice_method", "invoice__method"),
+        ("fines_count", "fines_count"),
+        ("fines_total", "fines_total"),
+    )
+
+    def queryset(self, start: date, end: date) -> QuerySet:
+        return (
+            Booking.objects.filter(start_date__gte=start, start_date__lt=end)
+            .annotate(
+                fines_count=Count("fines"),
+                fines_total=Sum(
+                    "fines__amount",
+                    default=Decimal("0.00"),
+                    output_field=DecimalField(max_digits=14, decimal_places=2),
+                ),
+            )
+            .order_by("start_date", "id")
+        )
+
+
+class InvoiceExport(Export):
+    columns = (
+        ("id", "id"),
+        ("booking_id", "booking_id"),
+        ("customer", "booking__customer__username"),
+        ("vin", "booking__car__vin"),
+        ("start_date", "booking__start_date"),
+        ("end_date", "booking__end_date"),
+        ("total", "total"),
+        ("paid_at", "paid_at"),
+        ("method", "method"),
+        ("payment_reference", "payment_reference"),
+        ("created_at", "created_at"),
+    )
+
+    def queryset(self, start: date, end: date) -> QuerySet:
+        return Invoice.objects.filter(
+            booking__start_date__gte=start, booking__start_date__lt=end
+        ).order_by("booking__start_date", "id")
+
+
+class FineExport(Export):
+    columns = (
+        ("id", "id"),
+        ("booking_id", "booking_id"),
+        ("vin", "booking__car__vin"),
+        ("type", "type"),
+        ("amount", "amount"),
+        ("notes", "notes"),
+        ("assessed_at", "assessed_at"),
+    )
+
+    def queryset(self, start: date, end: date) -> QuerySet:
+        return Fine.objects.filter(
+            assessed_at__date__gte=start, assessed_at__date__lt=end
+        ).order_by("assessed_at", "id")
+
+
+EXPORTS: dict[str, Export] = {
+    "bookings": BookingExport(),
+    "invoices": InvoiceExport(),
+    "fines": FineExport(),
+}
+
+
+def stream_csv(headers: Sequence[str], rows: Iterable[tuple]) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_ndjson(headers: Sequence[str], rows: Iterable[tuple]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(headers, row))) + "\n"
+
+
+FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
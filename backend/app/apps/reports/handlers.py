@@ -0,0 +1,34 @@
+from apps.common.event_bus import (
+    BOOKING_CANCELED,
+    BOOKING_CONFIRMED,
+    CAR_RETURNED,
+    FINE_APPLIED,
+    INVOICE_ISSUED,
+    EventBus,
+)
+
+from .rollups import (
+    sync_booking,
+    sync_booking_invoice,
+    sync_booking_invoices,
+    sync_bookings,
+    sync_fine,
+    sync_invoice,
+    sync_invoices,
+)
+
+# (event, handler, set-based handler for publish_many)
+SUBSCRIPTIONS = (
+    (BOOKING_CONFIRMED, sync_booking, sync_bookings),
+    (CAR_RETURNED, sync_booking, sync_bookings),
+    (BOOKING_CANCELED, sync_booking, sync_bookings),
+    (BOOKING_CANCELED, sync_booking_invoice, sync_booking_invoices),
+    (INVOICE_ISSUED, sync_invoice, sync_invoices),
+    (FINE_APPLIED, sync_fine, None),
+)
+
+
+def register(bus: EventBus) -> None:
+    for event_name, handler, batch in SUBSCRIPTIONS:
+        if handler not in bus.subscriptions(event_name):
+            bus.subscribe(event_name, handler, batch)
@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.reports.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild report rollups from bookings, invoices and fines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        sources = rebuild_rollups(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt rollups from {sources} sources in {elapsed:.1f}s.")
+        )
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:38
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("cars", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReportContribution",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("source", models.CharField(max_length=96, unique=True)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("utilization", "Utilization"),
+                            ("revenue", "Revenue"),
+                            ("fines", "Fines"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("car_type", models.CharField(max_length=64)),
+                ("start_day", models.DateField()),
+                ("end_day", models.DateField()),
+                ("amount", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "car",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="report_contributions",
+                        to="cars.car",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="DailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("car_type", models.CharField(max_length=64)),
+                ("booked_days", models.IntegerField(default=0)),
+                ("bookings_started", models.IntegerField(default=0)),
+                ("revenue", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("invoices", models.IntegerField(default=0)),
+                ("fines_total", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("fines_count", models.IntegerField(default=0)),
+                (
+                    "car",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="cars.car",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["day", "car"],
+                "indexes": [
+                    models.Index(fields=["car", "day"], name="reports_dai_car_id_4686f6_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("day", "car"), name="daily_rollup_day_car")
+                ],
+            },
+        ),
+    ]
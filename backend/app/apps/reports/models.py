@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+from django.db import models
+
+from apps.cars.models import Car
+
+
+class DailyRollup(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    day = models.DateField()
+    car = models.ForeignKey(Car, on_delete=models.CASCADE, related_name="daily_rollups")
+    car_type = models.CharField(max_length=64)
+    booked_days = models.IntegerField(default=0)
+    bookings_started = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    invoices = models.IntegerField(default=0)
+    fines_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    fines_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["day", "car"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "car"], name="daily_rollup_day_car"),
+        ]
+        indexes = [models.Index(fields=["car", "day"])]
+
+    def __str__(self) -> str:  # pragma: no cover - display utility
+        return f"Rollup {self.day} for {self.car_id}"
+
+
+class ReportContribution(models.Model):
+    class Kind(models.TextChoices):
+        UTILIZATION = "utilization", "Utilization"
+        REVENUE = "revenue", "Revenue"
+        FINES = "fines", "Fines"
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    source = models.CharField(max_length=96, unique=True)
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    car = models.ForeignKey(Car, on_delete=models.CASCADE, related_name="report_contributions")
+    car_type = models.CharField(max_length=64)
+    start_day = models.DateField()
+    end_day = models.DateField()
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover - display utility
+        return f"{self.source} ({self.kind})"
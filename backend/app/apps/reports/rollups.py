@@ -0,0 +1,321 @@
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth
+
+from apps.bookings.models import Booking, Fine, Invoice
+
+from .models import DailyRollup, ReportContribution
+
+Kind = ReportContribution.Kind
+
+UTILIZED_STATUSES = (Booking.Status.CONFIRMED, Booking.Status.ACTIVE, Booking.Status.COMPLETED)
+ROLLUP_FIELDS = [
+    "booked_days",
+    "bookings_started",
+    "revenue",
+    "invoices",
+    "fines_total",
+    "fines_count",
+]
+
+
+@dataclass(frozen=True)
+class Contribution:
+    kind: str
+    car_id: object
+    car_type: str
+    start_day: date
+    end_day: date
+    amount: Decimal = Decimal("0.00")
+    count: int = 0
+
+    @classmethod
+    def from_model(cls, row: ReportContribution) -> "Contribution":
+        return cls(
+            kind=row.kind,
+            car_id=row.car_id,
+            car_type=row.car_type,
+            start_day=row.start_day,
+            end_day=row.end_day,
+            amount=row.amount,
+            count=row.count,
+        )
+
+    def days(self) -> Iterator[date]:
+        for offset in range((self.end_day - self.start_day).days):
+            yield self.start_day + timedelta(days=offset)
+
+
+def booking_contribution(booking: Booking) -> Contribution | None:
+    if booking.status not in UTILIZED_STATUSES:
+        return None
+    return Contribution(
+        kind=Kind.UTILIZATION,
+        car_id=booking.car_id,
+        car_type=booking.car.type,
+        start_day=booking.start_date,
+        end_day=booking.end_date,
+        count=1,
+    )
+
+
+def invoice_contribution(invoice: Invoice) -> Contribution | None:
+    booking = invoice.booking
+    # Invoices are issued at confirmation; an unpaid one for a canceled booking earns nothing.
+    if booking.status == Booking.Status.CANCELED and invoice.paid_at is None:
+        return None
+    return Contribution(
+        kind=Kind.REVENUE,
+        car_id=booking.car_id,
+        car_type=booking.car.type,
+        start_day=booking.start_date,
+        end_day=booking.start_date + timedelta(days=1),
+        amount=invoice.total,
+        count=1,
+    )
+
+
+def fine_contribution(fine: Fine) -> Contribution:
+    booking = fine.booking
+    day = fine.assessed_at.date()
+    return Contribution(
+        kind=Kind.FINES,
+        car_id=booking.car_id,
+        car_type=booking.car.type,
+        start_day=day,
+        end_day=day + timedelta(days=1),
+        amount=fine.amount,
+        count=1,
+    )
+
+
+def sync_booking(booking: Booking) -> None:
+    record(f"booking:{booking.pk}", booking_contribution(booking))
+
+
+def sync_invoice(invoice: Invoice) -> None:
+    record(f"invoice:{invoice.pk}", invoice_contribution(invoice))
+
+
+def sync_booking_invoice(booking: Booking) -> None:
+    invoice = Invoice.objects.filter(booking=booking).first()
+    if invoice is not None:
+        sync_invoice(invoice)
+
+
+def sync_bookings(bookings: List[Booking]) -> None:
+    record_many((f"booking:{booking.pk}", booking_contribution(booking)) for booking in bookings)
+
+
+def sync_invoices(invoices: List[Invoice]) -> None:
+    record_many((f"invoice:{invoice.pk}", invoice_contribution(invoice)) for invoice in invoices)
+
+
+def sync_booking_invoices(bookings: List[Booking]) -> None:
+    by_id = {booking.pk: booking for booking in bookings}
+    invoices = list(Invoice.objects.filter(booking_id__in=list(by_id)))
+    for invoice in invoices:
+        invoice.booking = by_id[invoice.booking_id]
+    sync_invoices(invoices)
+
+
+def sync_fine(fine: Fine) -> None:
+    record(f"fine:{fine.pk}", fine_contribution(fine))
+
+
+@transaction.atomic
+def record(source: str, contribution: Contribution | None) -> None:
+    # Each source (booking, invoice, fine) owns one contribution; replaying an event swaps the
+    # stored contribution for the new one, so delivery may be repeated or reordered safely.
+    previous = ReportContribution.objects.select_for_update().filter(source=source).first()
+    if previous is not None:
+        if contribution == Contribution.from_model(previous):
+            return
+        _apply(Contribution.from_model(previous), sign=-1)
+        previous.delete()
+    if contribution is None:
+        return
+    _apply(contribution, sign=1)
+    ReportContribution.objects.create(source=source, **asdict(contribution))
+
+
+def _apply(contribution: Contribution, sign: int) -> None:
+    DailyRollup.objects.bulk_create(
+        [
+            DailyRollup(day=day, car_id=contribution.car_id, car_type=contribution.car_type)
+            for day in contribution.days()
+        ],
+        ignore_conflicts=True,
+    )
+    rows = DailyRollup.objects.filter(
+        car_id=contribution.car_id,
+        day__gte=contribution.start_day,
+        day__lt=contribution.end_day,
+    )
+    if contribution.kind == Kind.UTILIZATION:
+        rows.update(booked_days=F("booked_days") + sign)
+        rows.filter(day=contribution.start_day).update(
+            bookings_started=F("bookings_started") + sign * contribution.count
+        )
+    elif contribution.kind == Kind.REVENUE:
+        rows.update(
+            revenue=F("revenue") + sign * contribution.amount,
+            invoices=F("invoices") + sign * contribution.count,
+        )
+    elif contribution.kind == Kind.FINES:
+        rows.update(
+            fines_total=F("fines_total") + sign * contribution.amount,
+            fines_count=F("fines_count") + sign * contribution.count,
+        )
+
+
+@transaction.atomic
+def record_many(entries: Iterable[Tuple[str, Contribution | None]]) -> None:
+    # record() for many sources with a fixed number of queries: the previous contributions and
+    # the affected rollup rows are locked and read once, changed in memory and written back in
+    # bulk.
+    entries = dict(entries)
+    if not entries:
+        return
+    previous = {
+        row.source: row
+        for row in ReportContribution.objects.select_for_update().filter(source__in=list(entries))
+    }
+    deltas: List[Tuple[Contribution, int]] = []
+    replaced = []
+    created = []
+    for source, contribution in entries.items():
+        row = previous.get(source)
+        if row is not None:
+            if contribution == Contribution.from_model(row):
+                continue
+            deltas.append((Contribution.from_model(row), -1))
+            replaced.append(row.pk)
+        if contribution is not None:
+            deltas.append((contribution, 1))
+            created.append(ReportContribution(source=source, **asdict(contribution)))
+    if replaced:
+        ReportContribution.objects.filter(pk__in=replaced).delete()
+    ReportContribution.objects.bulk_create(created)
+    _apply_many(deltas)
+
+
+def _apply_many(deltas: List[Tuple[Contribution, int]]) -> None:
+    car_types = {
+        (day, contribution.car_id): contribution.car_type
+        for contribution, _ in deltas
+        for day in contribution.days()
+    }
+    if not car_types:
+        return
+    DailyRollup.objects.bulk_create(
+        [DailyRollup(day=day, car_id=car_id, car_type=t) for (day, car_id), t in car_types.items()],
+        ignore_conflicts=True,
+    )
+    days = [day for day, _ in car_types]
+    candidates = DailyRollup.objects.select_for_update().filter(
+        car_id__in={car_id for _, car_id in car_types}, day__gte=min(days), day__lte=max(days)
+    )
+    rollups = {
+        (row.day, row.car_id): row for row in candidates if (row.day, row.car_id) in car_types
+    }
+    for contribution, sign in deltas:
+        for day in contribution.days():
+            _accumulate(rollups[(day, contribution.car_id)], contribution, day, sign)
+    DailyRollup.objects.bulk_update(rollups.values(), ROLLUP_FIELDS)
+
+
+def _accumulate(rollup: DailyRollup, contribution: Contribution, day: date, sign: int = 1) -> None:
+    if contribution.kind == Kind.UTILIZATION:
+        rollup.booked_days += sign
+        if day == contribution.start_day:
+            rollup.bookings_started += sign * contribution.count
+    elif contribution.kind == Kind.REVENUE:
+        rollup.revenue += sign * contribution.amount
+        rollup.invoices += sign * contribution.count
+    elif contribution.kind == Kind.FINES:
+        rollup.fines_total += sign * contribution.amount
+        rollup.fines_count += sign * contribution.count
+
+
+class RollupBackfill:
+    def __init__(self, batch_size: int = 5000) -> None:
+        self.batch_size = batch_size
+        self._rollups: Dict[tuple, DailyRollup] = {}
+        self._contributions: List[ReportContribution] = []
+        self.sources = 0
+
+    @transaction.atomic
+    def run(self) -> int:
+        ReportContribution.objects.all().delete()
+        DailyRollup.objects.all().delete()
+
+        bookings = Booking.objects.filter(status__in=UTILIZED_STATUSES).select_related("car")
+        for booking in bookings.iterator(chunk_size=self.batch_size):
+            self._add(f"booking:{booking.pk}", booking_contribution(booking))
+        invoices = Invoice.objects.select_related("booking__car")
+        for invoice in invoices.iterator(chunk_size=self.batch_size):
+            self._add(f"invoice:{invoice.pk}", invoice_contribution(invoice))
+        fines = Fine.objects.select_related("booking__car")
+        for fine in fines.iterator(chunk_size=self.batch_size):
+            self._add(f"fine:{fine.pk}", fine_contribution(fine))
+
+        self._flush_contributions()
+        DailyRollup.objects.bulk_create(self._rollups.values(), batch_size=self.batch_size)
+        return self.sources
+
+    def _add(self, source: str, contribution: Contribution | None) -> None:
+        if contribution is None:
+            return
+        self.sources += 1
+        self._contributions.append(ReportContribution(source=source, **asdict(contribution)))
+        if len(self._contributions) >= self.batch_size:
+            self._flush_contributions()
+
+        for day in contribution.days():
+            key = (day, contribution.car_id)
+            rollup = self._rollups.get(key)
+            if rollup is None:
+                rollup = self._rollups[key] = DailyRollup(
+                    day=day,
+                    car_id=contribution.car_id,
+                    car_type=contribution.car_type,
+                    revenue=Decimal("0.00"),
+                    fines_total=Decimal("0.00"),
+                )
+            _accumulate(rollup, contribution, day)
+
+    def _flush_contributions(self) -> None:
+        ReportContribution.objects.bulk_create(self._contributions, batch_size=self.batch_size)
+        self._contributions = []
+
+
+def rebuild_rollups(batch_size: int = 5000) -> int:
+    return RollupBackfill(batch_size=batch_size).run()
+
+
+def grouped_totals(start: date, end: date, group_by: str) -> List[dict]:
+    rows = DailyRollup.objects.filter(day__gte=start, day__lt=end)
+    if group_by == "month":
+        rows = rows.annotate(key=TruncMonth("day"))
+    elif group_by == "type":
+        rows = rows.annotate(key=F("car_type"))
+    else:
+        rows = rows.annotate(key=F("car_id"))
+    return list(
+        rows.values("key")
+        .annotate(
+            booked_days=Sum("booked_days"),
+            bookings=Sum("bookings_started"),
+            revenue=Sum("revenue"),
+            invoices=Sum("invoices"),
+            fines_total=Sum("fines_total"),
+            fines_count=Sum("fines_count"),
+        )
+        .order_by("key")
+    )
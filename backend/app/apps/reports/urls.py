@@ -1,8 +1,10 @@
 from django.urls import path
 
-from .views import reports_placeholder
+from .views import ExportView, FinesReportView, RevenueReportView, UtilizationReportView
 
 urlpatterns = [
-    path("", reports_placeholder, name="reports-placeholder"),
-    path("<path:any_path>/", reports_placeholder, name="reports-placeholder-any"),
+    path("utilization/", UtilizationReportView.as_view(), name="reports-utilization"),
+    path("revenue/", RevenueReportView.as_view(), name="reports-revenue"),
+    path("fines/", FinesReportView.as_view(), name="reports-fines"),
+    path("exports/<slug:dataset>/", ExportView.as_view(), name="reports-export"),
 ]
@@ -1,5 +1,155 @@
-from django.http import JsonResponse
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
+from django.db.models import Count, Sum
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-def reports_placeholder(_request):
-    return JsonResponse({"detail": "Reports not implemented"}, status=501)
+from apps.cars.models import Car
+from apps.common.permissions import IsManagerOrAdmin
+
+from .exports import EXPORTS, FORMATS
+from .models import DailyRollup
+from .rollups import grouped_totals
+
+MAX_WINDOW_DAYS = 731
+
+
+def parse_window(request) -> tuple[date, date]:
+    params = request.query_params
+    today = date.today()
+    month_start = today.replace(day=1)
+    try:
+        start = (
+            datetime.strptime(params["from"], "%Y-%m-%d").date()
+            if params.get("from")
+            else month_start
+        )
+        end = (
+            datetime.strptime(params["to"], "%Y-%m-%d").date()
+            if params.get("to")
+            else (month_start + timedelta(days=32)).replace(day=1)
+        )
+    except ValueError:
+        raise ValidationError("Invalid date format, expected YYYY-MM-DD.")
+    if end <= start:
+        raise ValidationError("'to' must be after 'from'.")
+    if (end - start).days > MAX_WINDOW_DAYS:
+        raise ValidationError(f"Report window may span at most {MAX_WINDOW_DAYS} days.")
+    return start, end
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+class UtilizationReportView(APIView):
+    permission_classes = [IsManagerOrAdmin]
+
+    def get(self, request):
+        start, end = parse_window(request)
+        days = (end - start).days
+        fleet_by_type = dict(Car.objects.values_list("type").annotate(total=Count("id")))
+        booked_by_type = dict(
+            DailyRollup.objects.filter(day__gte=start, day__lt=end)
+            .values_list("car_type")
+            .annotate(booked=Sum("booked_days"))
+        )
+        fleet_size = sum(fleet_by_type.values())
+        booked_days = sum(booked_by_type.values())
+        return Response(
+            {
+                "from": start,
+                "to": end,
+                "fleet_size": fleet_size,
+                "car_days": fleet_size * days,
+                "booked_days": booked_days,
+                "utilization": _ratio(booked_days, fleet_size * days),
+                "by_type": [
+                    {
+                        "type": car_type,
+                        "fleet_size": size,
+                        "booked_days": booked_by_type.get(car_type, 0),
+                        "utilization": _ratio(booked_by_type.get(car_type, 0), size * days),
+                    }
+                    for car_type, size in sorted(fleet_by_type.items())
+                ],
+            }
+        )
+
+
+class RevenueReportView(APIView):
+    permission_classes = [IsManagerOrAdmin]
+    GROUPS = ("month", "type", "car")
+
+    def get(self, request):
+        start, end = parse_window(request)
+        group_by = request.query_params.get("group_by", "month")
+        if group_by not in self.GROUPS:
+            raise ValidationError(f"group_by must be one of: {', '.join(self.GROUPS)}.")
+        rows = [
+            {
+                group_by: row["key"],
+                "revenue": row["revenue"],
+                "invoices": row["invoices"],
+                "bookings": row["bookings"],
+            }
+            for row in grouped_totals(start, end, group_by)
+        ]
+        return Response(
+            {
+                "from": start,
+                "to": end,
+                "group_by": group_by,
+                "total": sum((row["revenue"] for row in rows), Decimal("0.00")),
+                "rows": rows,
+            }
+        )
+
+
+class FinesReportView(APIView):
+    permission_classes = [IsManagerOrAdmin]
+
+    def get(self, request):
+        start, end = parse_window(request)
+        rows = [
+            {"month": row["key"], "total": row["fines_total"], "count": row["fines_count"]}
+            for row in grouped_totals(start, end, "month")
+            if row["fines_count"]
+        ]
+        return Response(
+            {
+                "from": start,
+                "to": end,
+                "total": sum((row["total"] for row in rows), Decimal("0.00")),
+                "count": sum(row["count"] for row in rows),
+                "by_month": rows,
+            }
+        )
+
+
+class ExportView(APIView):
+    permission_classes = [IsManagerOrAdmin]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The export picks its own content type; don't reject Accept: text/csv and friends.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, dataset: str):
+        export = EXPORTS.get(dataset)
+        if export is None:
+            raise NotFound(f"Unknown export '{dataset}'.")
+        output = request.query_params.get("output", "csv")
+        if output not in FORMATS:
+            raise ValidationError(f"output must be one of: {', '.join(FORMATS)}.")
+        start, end = parse_window(request)
+        stream, content_type = FORMATS[output]
+        response = StreamingHttpResponse(
+            stream(export.headers, export.rows(start, end)), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{dataset}-{start.isoformat()}-{end.isoformat()}.{output}"'
+        )
+        return response
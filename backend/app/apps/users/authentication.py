@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import router
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+ROLE_CLAIM = "role"
+USERNAME_CLAIM = "username"
+REVISION_CLAIM = "rev"
+
+
+@dataclass(frozen=True)
+class TokenState:
+    revision: int
+    is_active: bool
+
+
+def load_token_state(user_id) -> TokenState | None:
+    row = User.objects.filter(pk=user_id).values_list("token_revision", "is_active").first()
+    return TokenState(*row) if row else None
+
+
+class TokenStateCache:
+    # Per-process, short-lived copy of each user's (token_revision, is_active). Saves on this
+    # process forget the entry at once; other processes see a role change or deactivation within
+    # AUTH_TOKEN_STATE_TTL seconds.
+    def __init__(self, ttl: float | None = None, max_entries: int = 10_000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, user_id) -> TokenState | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        state = load_token_state(user_id)
+        if state is None:
+            return None
+        with self._lock:
+            self._entries[user_id] = (now + self._ttl(), state)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return state
+
+    def forget(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _ttl(self) -> float:
+        if self.ttl is not None:
+            return self.ttl
+        return getattr(settings, "AUTH_TOKEN_STATE_TTL", 5.0)
+
+
+token_state_cache = TokenStateCache()
+
+
+def add_token_claims(token, user: User):
+    token[ROLE_CLAIM] = user.role
+    token[USERNAME_CLAIM] = user.username
+    token[REVISION_CLAIM] = user.token_revision
+    return token
+
+
+def check_token_revision(token, state: TokenState | None) -> None:
+    if state is None:
+        raise AuthenticationFailed("User not found", code="user_not_found")
+    if not state.is_active:
+        raise AuthenticationFailed("User is inactive", code="user_inactive")
+    if token.get(REVISION_CLAIM) != state.revision:
+        raise InvalidToken("Token has been revoked")
+
+
+def token_user(user_id, token) -> User:
+    # A User built from claims without a query. Fields that are not claims are deferred, so
+    # reading one loads it from the database; views needing the full row should fetch it.
+    values = {
+        "id": user_id,
+        "username": token[USERNAME_CLAIM],
+        "role": token[ROLE_CLAIM],
+        "is_active": True,
+        "token_revision": token[REVISION_CLAIM],
+    }
+    fields = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(router.db_for_read(User), fields, [values[name] for name in fields])
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    # Trusts the role and username carried by the access token and only checks the token
+    # revision (served from token_state_cache). Tokens issued without the claims fall back to
+    # loading the user.
+    def get_user(self, validated_token) -> User:
+        if REVISION_CLAIM not in validated_token or ROLE_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        try:
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except (KeyError, ValidationError) as exc:
+            raise InvalidToken("Token contained no recognizable user identification") from exc
+        check_token_revision(validated_token, token_state_cache.get(user_id))
+        return token_user(user_id, validated_token)
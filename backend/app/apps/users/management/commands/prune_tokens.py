@@ -0,0 +1,38 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.tokens import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted JWT refresh tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--interval", type=float, default=3600.0, help="Seconds between prune runs."
+        )
+        parser.add_argument("--once", action="store_true", help="Prune once and exit.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+        stop = threading.Event()
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        try:
+            while True:
+                summary = prune_expired_tokens(batch_size=options["batch_size"])
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Pruned {summary.outstanding} outstanding and {summary.blacklisted} "
+                        f"blacklisted tokens in {summary.batches} batches "
+                        f"({summary.seconds:.1f}s)."
+                    )
+                )
+                if options["once"] or stop.wait(options["interval"]):
+                    break
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+# token_blacklist does not index expires_at; prune_tokens selects expired rows by it.
+CREATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS token_blacklist_outstanding_expires_idx "
+    "ON token_blacklist_outstandingtoken (expires_at)"
+)
+DROP_INDEX = "DROP INDEX IF EXISTS token_blacklist_outstanding_expires_idx"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_user_token_revision"),
+        ("token_blacklist", "0013_alter_blacklistedtoken_options_and_more"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX, DROP_INDEX),
+    ]
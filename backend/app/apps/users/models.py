@@ -12,6 +12,10 @@ class User(AbstractUser):
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.CUSTOMER)
+    # Embedded in issued tokens; bumped when a field in TOKEN_FIELDS changes, which revokes them.
+    token_revision = models.PositiveIntegerField(default=0)
+
+    TOKEN_FIELDS = ("role", "is_active", "password")
 
     def __str__(self) -> str:  # pragma: no cover - delegated to AbstractUser
         return f"{self.username} ({self.get_role_display()})"
@@ -1,7 +1,16 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.users.authentication import (
+    REVISION_CLAIM,
+    add_token_claims,
+    check_token_revision,
+    load_token_state,
+)
 from apps.users.models import CustomerProfile
+from apps.users.tokens import RefreshToken
 
 
 User = get_user_model()
@@ -74,3 +83,24 @@ class MeSerializer(serializers.ModelSerializer):
             setattr(profile, field, value)
         profile.save()
         return instance
+
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        return add_token_claims(super().get_token(user), user)
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
+
+    # New access tokens copy the refresh token's claims, so a refresh token issued before a role
+    # change or deactivation must not be exchanged. Checked against the database, not the cache.
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if REVISION_CLAIM in refresh:
+            user_id = User._meta.pk.to_python(refresh[api_settings.USER_ID_CLAIM])
+            check_token_revision(refresh, load_token_state(user_id))
+        return super().validate(attrs)
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import token_state_cache
+from .models import User
+from .tokens import blacklisted_jti_cache
+
+
+@receiver(pre_save, sender=User, dispatch_uid="user_token_fields_changed")
+def detect_token_field_change(sender, instance: User, raw=False, update_fields=None, **kwargs):
+    instance._revoke_tokens = False
+    if raw or instance._state.adding:
+        return
+    fields = User.TOKEN_FIELDS
+    if update_fields is not None:
+        fields = [name for name in fields if name in update_fields]
+        if not fields:
+            return
+    stored = User.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._revoke_tokens = stored is not None and any(
+        stored[name] != getattr(instance, name) for name in fields
+    )
+
+
+# Queryset .update() calls bypass these signals; bump token_revision alongside such updates.
+@receiver(post_save, sender=User, dispatch_uid="user_saved_token_state")
+@receiver(post_delete, sender=User, dispatch_uid="user_deleted_token_state")
+def revoke_user_tokens(sender, instance: User, **kwargs) -> None:
+    if getattr(instance, "_revoke_tokens", False):
+        User.objects.filter(pk=instance.pk).update(token_revision=F("token_revision") + 1)
+        instance.refresh_from_db(fields=["token_revision"])
+        instance._revoke_tokens = False
+    # Forget immediately and again after commit, like the pricing rule cache.
+    token_state_cache.forget(instance.pk)
+    transaction.on_commit(lambda: token_state_cache.forget(instance.pk))
+
+
+@receiver(post_save, sender=BlacklistedToken, dispatch_uid="blacklisted_token_saved")
+def cache_blacklisted_jti(sender, instance: BlacklistedToken, created=False, **kwargs) -> None:
+    if created:
+        blacklisted_jti_cache.add(instance.token.jti, instance.token.expires_at)
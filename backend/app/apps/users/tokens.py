@@ -0,0 +1,142 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class BlacklistedJTICache:
+    # In-memory set of blacklisted JTIs (with their expiry). New blacklist rows are read
+    # incrementally by id every TOKEN_BLACKLIST_REFRESH_INTERVAL seconds; a full reload every
+    # TOKEN_BLACKLIST_RELOAD_INTERVAL seconds also catches rows whose transaction committed after
+    # a higher id was read. Blacklisting in this process is visible at once.
+    def __init__(
+        self, refresh_interval: float | None = None, reload_interval: float | None = None
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._jtis: dict[str, datetime] = {}
+        self._last_id = 0
+        self._refreshed_at: float | None = None
+        self._reloaded_at: float | None = None
+
+    def __contains__(self, jti: str) -> bool:
+        self.refresh()
+        return jti in self._jtis
+
+    def __len__(self) -> int:
+        return len(self._jtis)
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and not self._due(self._refreshed_at, now, self._refresh_interval()):
+            return
+        with self._lock:
+            # __contains__ reads without the lock, so a reload fills a new dict and swaps it in
+            # whole; readers never see it empty or half filled. Incremental reads only add.
+            reload = self._due(self._reloaded_at, now, self._reload_interval())
+            jtis = {} if reload else self._jtis
+            last_id = 0 if reload else self._last_id
+            rows = (
+                BlacklistedToken.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "token__jti", "token__expires_at")
+            )
+            for row_id, jti, expires_at in rows:
+                jtis[jti] = expires_at
+                last_id = row_id
+            self._jtis, self._last_id = jtis, last_id
+            self._refreshed_at = now
+            if reload:
+                self._reloaded_at = now
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._jtis[jti] = expires_at
+
+    def discard_expired(self, now: datetime | None = None) -> None:
+        now = now or timezone.now()
+        with self._lock:
+            self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jtis, self._last_id = {}, 0
+            self._refreshed_at = self._reloaded_at = None
+
+    @staticmethod
+    def _due(last: float | None, now: float, interval: float) -> bool:
+        return last is None or now - last >= interval
+
+    def _refresh_interval(self) -> float:
+        if self.refresh_interval is not None:
+            return self.refresh_interval
+        return getattr(settings, "TOKEN_BLACKLIST_REFRESH_INTERVAL", 1.0)
+
+    def _reload_interval(self) -> float:
+        if self.reload_interval is not None:
+            return self.reload_interval
+        return getattr(settings, "TOKEN_BLACKLIST_RELOAD_INTERVAL", 60.0)
+
+
+blacklisted_jti_cache = BlacklistedJTICache()
+
+
+class RefreshToken(tokens.RefreshToken):
+    def check_blacklist(self) -> None:
+        if self.payload[api_settings.JTI_CLAIM] in blacklisted_jti_cache:
+            raise TokenError("Token is blacklisted")
+
+    def outstand(self) -> OutstandingToken:
+        # Called after set_jti() on rotation, so the JTI is new: insert without the user lookup
+        # and get_or_create round trips of the base implementation.
+        return OutstandingToken.objects.create(
+            user_id=self.payload.get(api_settings.USER_ID_CLAIM),
+            jti=self.payload[api_settings.JTI_CLAIM],
+            token=str(self),
+            created_at=self.current_time,
+            expires_at=datetime_from_epoch(self.payload["exp"]),
+        )
+
+
+@dataclass
+class TokenPruneSummary:
+    outstanding: int = 0
+    blacklisted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+def prune_expired_tokens(batch_size: int = 1000, now: datetime | None = None) -> TokenPruneSummary:
+    # Expired tokens fail verification regardless, so their outstanding and blacklist rows can
+    # go. Deletes in batches (each its own transaction) to keep locks and undo logs small.
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    started = time.perf_counter()
+    now = now or timezone.now()
+    summary = TokenPruneSummary()
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by("expires_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            _, deleted = OutstandingToken.objects.filter(id__in=ids).delete()
+        summary.outstanding += deleted.get(OutstandingToken._meta.label, 0)
+        summary.blacklisted += deleted.get(BlacklistedToken._meta.label, 0)
+        summary.batches += 1
+    blacklisted_jti_cache.discard_expired(now)
+    summary.seconds = time.perf_counter() - started
+    return summary
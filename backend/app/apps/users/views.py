@@ -23,17 +23,21 @@ class RegisterView(APIView):
 class MeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_user(self):
+        # request.user only carries the token claims; load the full row once.
+        return User.objects.select_related("profile").get(pk=self.request.user.pk)
+
     def get(self, request):
-        return Response(MeSerializer(request.user).data)
+        return Response(MeSerializer(self.get_user()).data)
 
     def put(self, request):
-        serializer = MeSerializer(instance=request.user, data=request.data)
+        serializer = MeSerializer(instance=self.get_user(), data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
 
     def patch(self, request):
-        serializer = MeSerializer(instance=request.user, data=request.data, partial=True)
+        serializer = MeSerializer(instance=self.get_user(), data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -0,0 +1,20 @@
+from django.urls import path, re_path
+
+from apps.bookings.views import AsyncPayInvoiceView
+from apps.cars.views import AsyncCarListView
+from apps.pricing.views import AsyncQuoteView
+
+from .urls import urlpatterns as sync_urlpatterns
+
+# Async views for the endpoints that mostly wait on the database or the payment provider; they
+# shadow the sync routes, which still serve everything else.
+urlpatterns = [
+    path("api/cars/", AsyncCarListView.as_view(), name="car-list-async"),
+    path("api/pricing/quote/", AsyncQuoteView.as_view(), name="pricing-quote-async"),
+    re_path(
+        r"^api/bookings/(?P<pk>[^/.]+)/invoice/pay/$",
+        AsyncPayInvoiceView.as_view(),
+        name="booking-pay-invoice-async",
+    ),
+    *sync_urlpatterns,
+]
@@ -44,6 +44,7 @@ USE_SQLITE_FOR_TESTS = env.bool(
 )
 
 MIDDLEWARE = [
+    "apps.common.middleware.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -54,7 +55,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "core.urls"
+# core.asgi defaults this to core.asgi_urls, which routes the hot endpoints to async views.
+ROOT_URLCONF = env.str("DJANGO_ROOT_URLCONF", "core.urls")
 
 TEMPLATES = [
     {
@@ -74,6 +76,16 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "core.wsgi.application"
 
+# Connection reuse on Postgres. By default each worker thread keeps its connection for
+# DB_CONN_MAX_AGE seconds (0 closes it after every request), checking it is alive before reuse.
+# DB_POOL_MAX_SIZE > 0 uses a psycopg connection pool per process instead, which also suits ASGI,
+# where connections are per request.
+DB_CONN_MAX_AGE = env.int("DB_CONN_MAX_AGE", 60)
+DB_CONN_HEALTH_CHECKS = env.bool("DB_CONN_HEALTH_CHECKS", True)
+DB_POOL_MIN_SIZE = env.int("DB_POOL_MIN_SIZE", 2)
+DB_POOL_MAX_SIZE = env.int("DB_POOL_MAX_SIZE", 0)
+DB_POOL_TIMEOUT = env.float("DB_POOL_TIMEOUT", 10.0)
+
 DATABASES = {
     "default": (
         {
@@ -88,10 +100,33 @@ DATABASES = {
             "PASSWORD": env.str("POSTGRES_PASSWORD", "car_rental_password"),
             "HOST": env.str("POSTGRES_HOST", "db"),
             "PORT": env.int("POSTGRES_PORT", 5432),
+            # A pool requires CONN_MAX_AGE=0: Django returns the connection after each request.
+            "CONN_MAX_AGE": 0 if DB_POOL_MAX_SIZE else DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+            "OPTIONS": (
+                {
+                    "pool": {
+                        "min_size": DB_POOL_MIN_SIZE,
+                        "max_size": DB_POOL_MAX_SIZE,
+                        "timeout": DB_POOL_TIMEOUT,
+                    }
+                }
+                if DB_POOL_MAX_SIZE
+                else {}
+            ),
         }
     )
 }
 
+# Point the cache at a shared backend (e.g. Redis/Memcached) in multi-worker deployments so
+# version stamps such as the car catalog version are seen by every worker.
+CACHES = {
+    "default": {
+        "BACKEND": env.str("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": env.str("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -109,9 +144,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("apps.users.authentication.StatelessJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
@@ -125,9 +158,49 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "apps.users.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.serializers.TokenRefreshSerializer",
 }
 
+# Seconds a worker trusts a user's cached token revision/active flag; role changes and
+# deactivations made by other workers take effect within this window.
+AUTH_TOKEN_STATE_TTL = env.float("AUTH_TOKEN_STATE_TTL", 5.0)
+
+# Refresh tokens are checked against an in-memory copy of the blacklist: new entries are read
+# every TOKEN_BLACKLIST_REFRESH_INTERVAL seconds and the whole list every RELOAD_INTERVAL.
+TOKEN_BLACKLIST_REFRESH_INTERVAL = env.float("TOKEN_BLACKLIST_REFRESH_INTERVAL", 1.0)
+TOKEN_BLACKLIST_RELOAD_INTERVAL = env.float("TOKEN_BLACKLIST_RELOAD_INTERVAL", 60.0)
+
 CORS_ALLOWED_ORIGINS = env.list(
     "DJANGO_CORS_ALLOWED_ORIGINS", ["http://localhost:5173", "http://127.0.0.1:5173"]
 )
 CORS_ALLOW_CREDENTIALS = True
+
+# Seconds a worker trusts its compiled pricing rules before re-reading the version row, and the
+# age after which it reloads them even if the version did not move.
+PRICING_RULES_CHECK_INTERVAL = env.float("PRICING_RULES_CHECK_INTERVAL", 1.0)
+PRICING_RULES_MAX_AGE = env.float("PRICING_RULES_MAX_AGE", 300.0)
+
+# Per-process LRU of computed quotes (0 disables it) and its TTL in seconds. With
+# PRICING_QUOTE_CACHE_SHARED, misses also go through the default cache so workers share quotes.
+PRICING_QUOTE_CACHE_SIZE = env.int("PRICING_QUOTE_CACHE_SIZE", 10_000)
+PRICING_QUOTE_CACHE_TIMEOUT = env.int("PRICING_QUOTE_CACHE_TIMEOUT", 300)
+PRICING_QUOTE_CACHE_SHARED = env.bool("PRICING_QUOTE_CACHE_SHARED", False)
+
+# Simulated round trip of the mock payment provider, in seconds.
+PAYMENT_PROVIDER_LATENCY = env.float("PAYMENT_PROVIDER_LATENCY", 0.0)
+
+# Seconds a cached car list/detail payload lives; writes invalidate it earlier.
+CAR_CATALOG_CACHE_TIMEOUT = env.int("CAR_CATALOG_CACHE_TIMEOUT", 300)
+
+# "sync" runs event handlers inside the request; "outbox" stores events transactionally for
+# `manage.py run_event_workers` to deliver.
+EVENT_BUS_MODE = env.str("EVENT_BUS_MODE", "sync")
+EVENT_BUS_HANDLER_TIMEOUT = env.float("EVENT_BUS_HANDLER_TIMEOUT", 10.0)
+EVENT_BUS_MAX_ATTEMPTS = env.int("EVENT_BUS_MAX_ATTEMPTS", 5)
+
+# Per-request SQL/latency accounting, reported as Server-Timing headers and on /metrics.
+REQUEST_METRICS_ENABLED = env.bool("REQUEST_METRICS_ENABLED", True)
+# /metrics answers only to `Authorization: Bearer <METRICS_TOKEN>` or these client addresses.
+METRICS_TOKEN = env.str("METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = env.list("METRICS_ALLOWED_IPS", [])
@@ -3,6 +3,8 @@ from django.http import JsonResponse
 from django.urls import include, path
 from rest_framework.schemas import get_schema_view
 
+from apps.common.metrics import metrics_view
+
 
 def healthcheck_view(_request):
     return JsonResponse({"status": "ok"})
@@ -11,6 +13,7 @@ def healthcheck_view(_request):
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/health/", healthcheck_view, name="healthcheck"),
+    path("metrics", metrics_view, name="metrics"),
     path("api/schema/", get_schema_view(title="Car Rental API"), name="api-schema"),
     path("api/auth/", include("apps.users.urls")),
     path("api/cars/", include("apps.cars.urls")),
@@ -0,0 +1,67 @@
+import json
+import math
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def summarize(samples: Sequence[float], wall_seconds: float | None = None) -> Dict[str, float]:
+    # Latencies are reported in milliseconds; throughput uses the wall time of the whole run
+    # when it is known (concurrent runs) and the sum of samples otherwise.
+    if not samples:
+        return {"runs": 0}
+    elapsed = wall_seconds if wall_seconds is not None else sum(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+        "ops_per_sec": len(samples) / elapsed if elapsed else 0.0,
+    }
+
+
+def environment(**extra) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **extra,
+    }
+
+
+def write_results(path: str | Path, results: Dict[str, dict], meta: dict) -> None:
+    payload = {"meta": meta, "results": dict(sorted(results.items()))}
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def read_results(path: str | Path) -> Dict[str, dict]:
+    return json.loads(Path(path).read_text())["results"]
+
+
+def format_table(rows: Iterable[Sequence[str]]) -> str:
+    rows = [list(map(str, row)) for row in rows]
+    widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows
+    )
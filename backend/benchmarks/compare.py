@@ -0,0 +1,49 @@
+"""Compare two benchmark result files and fail on regressions.
+
+python benchmarks/compare.py baseline.json current.json --metric p95_ms --threshold 0.15
+"""
+
+import argparse
+import sys
+
+from benchstats import format_table, read_results
+
+
+def compare(baseline: dict, current: dict, metric: str, threshold: float):
+    rows, regressions = [], []
+    for name in sorted(set(baseline) | set(current)):
+        before = baseline.get(name, {}).get(metric)
+        after = current.get(name, {}).get(metric)
+        if before is None or after is None:
+            rows.append((name, before or "-", after or "-", "n/a"))
+            continue
+        change = (after - before) / before if before else 0.0
+        # Throughput regresses when it drops; every latency metric regresses when it grows.
+        worse = -change if metric == "ops_per_sec" else change
+        flag = " !" if worse > threshold else ""
+        if flag:
+            regressions.append(name)
+        rows.append((name, f"{before:.3f}", f"{after:.3f}", f"{change:+.1%}{flag}"))
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="p95_ms")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative change.")
+    args = parser.parse_args(argv)
+
+    rows, regressions = compare(
+        read_results(args.baseline), read_results(args.current), args.metric, args.threshold
+    )
+    print(format_table([("benchmark", "baseline", "current", "change"), *rows]))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%} on {args.metric}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import os
+import statistics
+import time
+
+import pytest
+from benchstats import environment, summarize, write_results
+
+os.environ.setdefault("USE_SQLITE_FOR_TESTS", "1")
+
+pytest_plugins = ["apps.common.testing"]
+
+RESULTS: dict[str, dict] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-json",
+        default=os.environ.get("BENCH_JSON", ""),
+        help="Write benchmark summaries to this JSON file (compare runs with compare.py).",
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = session.config.getoption("--bench-json", default="")
+    if not path or not RESULTS:
+        return
+    from django.db import connection
+
+    from dataset import scale_name
+
+    meta = environment(database=connection.vendor, scale=scale_name())
+    write_results(path, RESULTS, meta)
+
+
+class Timer:
+    def __init__(self, name: str, repeat: int = 5) -> None:
+        self.name = name
+        self.repeat = repeat
+        self.samples: list[float] = []
+        self.wall_seconds: float | None = None
+
+    def __call__(self, func, *args, **kwargs):
+        result = None
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.samples.append(time.perf_counter() - started)
+        return result
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def measure(self, func, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.samples.append(time.perf_counter() - started)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def summary(self) -> dict:
+        return summarize(self.samples, self.wall_seconds)
+
+    def report(self) -> str:
+        summary = self.summary()
+        if len(self.samples) < 20:
+            return f"{self.name}: median {self.median * 1000:.2f} ms over {len(self.samples)} runs"
+        return (
+            f"{self.name}: p50 {summary['p50_ms']:.2f} ms, p95 {summary['p95_ms']:.2f} ms, "
+            f"p99 {summary['p99_ms']:.2f} ms, {summary['ops_per_sec']:.1f} ops/s "
+            f"over {summary['runs']} runs"
+        )
+
+
+@pytest.fixture
+def bench(request):
+    timers: list[Timer] = []
+
+    def make(name: str, repeat: int = 5) -> Timer:
+        timer = Timer(name, repeat)
+        timers.append(timer)
+        return timer
+
+    yield make
+    for timer in timers:
+        if not timer.samples:
+            continue
+        RESULTS[f"{request.node.name}::{timer.name}"] = timer.summary()
+        print(f"\n[{request.node.name}] {timer.report()}")
@@ -0,0 +1,36 @@
+import os
+from datetime import date, timedelta
+
+from apps.common.seeding import BulkSeeder
+
+# cars, customers, bookings
+SCALES = {
+    "smoke": (50, 200, 2_000),
+    "medium": (1_000, 10_000, 100_000),
+    "full": (10_000, 100_000, 1_000_000),
+}
+
+# Seeded history ends here; benchmarks book after it so they never collide with seeded rows.
+HISTORY_END = date(2029, 12, 31)
+BENCH_START = HISTORY_END + timedelta(days=1)
+
+PREFIX = "bench"
+
+
+def scale_name() -> str:
+    return os.environ.get("BENCH_SCALE", "smoke")
+
+
+def seeder(name: str | None = None, seed: int = 0) -> BulkSeeder:
+    cars, customers, bookings = SCALES[name or scale_name()]
+    return BulkSeeder(cars, customers, bookings, seed=seed, prefix=PREFIX, end=HISTORY_END)
+
+
+def seed_scale(name: str | None = None, seed: int = 0) -> BulkSeeder:
+    generator = seeder(name, seed)
+    generator.run()
+    return generator
+
+
+def purge() -> None:
+    seeder().purge()
@@ -0,0 +1,185 @@
+"""End-to-end load generator for a running API (stdlib only).
+
+Each virtual user loops through the booking lifecycle: quote, create, confirm, check in,
+return and pay. Customers act through the customer account and transitions through the
+manager account, both authenticated with JWT like the frontend. `--scenario reads` only
+requests the health check and quotes, to compare connection settings on cheap endpoints.
+
+    python benchmarks/loadgen.py --base-url http://localhost:8000 --users 16 --duration 60 \\
+        --json results/loadgen.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from datetime import date, timedelta
+
+from benchstats import environment, format_table, summarize, write_results
+
+STEPS = (
+    "GET /api/pricing/quote/",
+    "POST /api/bookings/",
+    "POST /api/bookings/<id>/confirm/",
+    "POST /api/bookings/<id>/checkin/",
+    "POST /api/bookings/<id>/return/",
+    "POST /api/bookings/<id>/invoice/pay/",
+)
+READ_STEPS = ("GET /api/health/", STEPS[0])
+
+
+class Client:
+    def __init__(self, base_url: str, timeout: float) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.token = ""
+
+    def login(self, username: str, password: str) -> None:
+        _, body = self.request(
+            "POST", "/api/auth/login/", {"username": username, "password": password}
+        )
+        self.token = body["access"]
+
+    def request(self, method: str, path: str, data: dict | None = None) -> tuple[int, dict]:
+        headers = {"Accept": "application/json"}
+        payload = None
+        if data is not None:
+            payload = json.dumps(data).encode()
+            headers["Content-Type"] = "application/json"
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        req = urllib.request.Request(
+            self.base_url + path, data=payload, headers=headers, method=method
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, json.loads(response.read() or b"{}")
+        except urllib.error.HTTPError as exc:
+            return exc.code, {}
+
+
+class LoadRun:
+    def __init__(self, args) -> None:
+        self.args = args
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.conflicts = 0
+        self.lock = threading.Lock()
+
+    def timed(self, step: str, client: Client, method: str, path: str, data=None, ok=(200,)):
+        started = time.perf_counter()
+        status, body = client.request(method, path, data)
+        elapsed = time.perf_counter() - started
+        with self.lock:
+            if status in ok:
+                self.samples[step].append(elapsed)
+            else:
+                self.errors[step] += 1
+        return status, body
+
+    def user(self, worker: int, cars: list[str], deadline: float) -> None:
+        args = self.args
+        rng = random.Random(args.seed + worker)
+        customer = Client(args.base_url, args.timeout)
+        customer.login(*args.customer.split(":", 1))
+        manager = Client(args.base_url, args.timeout)
+        manager.login(*args.manager.split(":", 1))
+
+        while time.monotonic() < deadline:
+            car = rng.choice(cars)
+            start = date.fromisoformat(args.start) + timedelta(days=rng.randint(0, args.horizon))
+            end = start + timedelta(days=rng.randint(1, 7))
+            query = f"?car={car}&start={start.isoformat()}&end={end.isoformat()}"
+            if args.scenario == "reads":
+                self.timed(READ_STEPS[0], customer, "GET", "/api/health/")
+            self.timed(STEPS[0], customer, "GET", "/api/pricing/quote/" + query)
+            if args.scenario == "reads":
+                continue
+            payload = {"car_id": car, "start_date": start.isoformat(), "end_date": end.isoformat()}
+            status, booking = self.timed(
+                STEPS[1], customer, "POST", "/api/bookings/", payload, ok=(201,)
+            )
+            if status == 400:
+                with self.lock:
+                    self.conflicts += 1
+                continue
+            if status != 201:
+                continue
+            base = f"/api/bookings/{booking['id']}"
+            for step, path in zip(STEPS[2:5], ("confirm", "checkin", "return")):
+                self.timed(step, manager, "POST", f"{base}/{path}/")
+            self.timed(STEPS[5], customer, "POST", f"{base}/invoice/pay/", {"method": "card"})
+
+    def run(self) -> dict[str, dict]:
+        lister = Client(self.args.base_url, self.args.timeout)
+        lister.login(*self.args.customer.split(":", 1))
+        _, page = lister.request("GET", "/api/cars/?page_size=100")
+        cars = [car["id"] for car in page.get("results", [])]
+        if not cars:
+            sys.exit("No cars available; seed the database first.")
+
+        deadline = time.monotonic() + self.args.duration
+        threads = [
+            threading.Thread(target=self.user, args=(idx, cars, deadline), daemon=True)
+            for idx in range(self.args.users)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+        results = {}
+        for step in READ_STEPS if self.args.scenario == "reads" else STEPS:
+            summary = summarize(self.samples[step], wall)
+            summary["errors"] = self.errors[step]
+            results[f"loadgen::{step}"] = summary
+        return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--customer", default="customer:customerpass", help="username:password")
+    parser.add_argument("--manager", default="manager:managerpass", help="username:password")
+    parser.add_argument("--scenario", choices=("lifecycle", "reads"), default="lifecycle")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent virtual users.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    parser.add_argument("--start", default="2031-01-01", help="Earliest booking date.")
+    parser.add_argument("--horizon", type=int, default=730, help="Days after --start to book.")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write results to this file.")
+    args = parser.parse_args(argv)
+
+    run = LoadRun(args)
+    results = run.run()
+    rows = [("step", "ok", "errors", "p50 ms", "p95 ms", "p99 ms", "req/s")]
+    for name, summary in results.items():
+        rows.append(
+            (
+                name.split("::", 1)[1],
+                summary["runs"],
+                summary["errors"],
+                f"{summary.get('p50_ms', 0):.1f}",
+                f"{summary.get('p95_ms', 0):.1f}",
+                f"{summary.get('p99_ms', 0):.1f}",
+                f"{summary.get('ops_per_sec', 0):.1f}",
+            )
+        )
+    print(format_table(rows))
+    print(f"booking conflicts: {run.conflicts}")
+    if args.json:
+        meta = environment(base_url=args.base_url, users=args.users, duration=args.duration)
+        write_results(args.json, results, meta)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
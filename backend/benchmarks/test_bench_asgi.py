@@ -0,0 +1,110 @@
+import asyncio
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client, override_settings
+
+from apps.bookings.models import Booking, Invoice
+from apps.cars.models import Car
+
+CONCURRENCY = int(os.environ.get("BENCH_ASGI_CONCURRENCY", 50))
+PROVIDER_LATENCY = float(os.environ.get("BENCH_PROVIDER_LATENCY", 0.05))
+
+
+@pytest.fixture
+def auth(django_user_model):
+    django_user_model.objects.create_user(
+        username="bench-asgi", password="pass", role=django_user_model.Role.MANAGER
+    )
+    response = Client().post(
+        "/api/auth/login/",
+        {"username": "bench-asgi", "password": "pass"},
+        content_type="application/json",
+    )
+    return {"Authorization": f"Bearer {response.json()['access']}"}
+
+
+@pytest.fixture
+def bookings(django_user_model):
+    customer = django_user_model.objects.create_user(username="bench-asgi-customer")
+    cars = Car.objects.bulk_create(
+        Car(
+            make="Async",
+            model=f"Model {index}",
+            year=2022,
+            vin=f"ASGIBENCH{index:08d}",
+            type="sedan",
+            base_price_per_day=Decimal("70.00"),
+        )
+        for index in range(2 * CONCURRENCY)
+    )
+    start = date(2030, 1, 1)
+    return Booking.objects.bulk_create(
+        Booking(customer=customer, car=car, start_date=start, end_date=start + timedelta(days=3))
+        for car in cars
+    )
+
+
+def run_wsgi(timer, headers: dict, paths: list[str], method: str = "post") -> None:
+    # One WSGI worker: requests are served one after another.
+    client = Client(headers=headers)
+    started = time.perf_counter()
+    for path in paths:
+        response = timer.measure(getattr(client, method), path, content_type="application/json")
+        assert response.status_code == 200, response.content
+    timer.wall_seconds = time.perf_counter() - started
+
+
+def run_asgi(timer, headers: dict, paths: list[str], method: str = "post") -> None:
+    # One ASGI worker: every request is in flight at once on the event loop.
+    client = AsyncClient()
+
+    async def one(path: str):
+        started = time.perf_counter()
+        response = await getattr(client, method)(
+            path, content_type="application/json", headers=headers
+        )
+        timer.record(time.perf_counter() - started)
+        return response
+
+    async def run_all():
+        return await asyncio.gather(*(one(path) for path in paths))
+
+    started = time.perf_counter()
+    responses = async_to_sync(run_all)()
+    timer.wall_seconds = time.perf_counter() - started
+    assert all(response.status_code == 200 for response in responses)
+
+
+@pytest.mark.django_db
+@override_settings(PAYMENT_PROVIDER_LATENCY=PROVIDER_LATENCY)
+def test_concurrent_invoice_payments(auth, bookings, bench):
+    paths = [f"/api/bookings/{booking.id}/invoice/pay/" for booking in bookings]
+    label = f"{CONCURRENCY} payments, provider {PROVIDER_LATENCY * 1000:.0f} ms"
+
+    with override_settings(ROOT_URLCONF="core.urls"):
+        wsgi = bench(f"WSGI, {label}")
+        run_wsgi(wsgi, auth, paths[:CONCURRENCY])
+    asgi = bench(f"ASGI, {label}")
+    with override_settings(ROOT_URLCONF="core.asgi_urls"):
+        run_asgi(asgi, auth, paths[CONCURRENCY:])
+
+    assert Invoice.objects.filter(paid_at__isnull=False).count() == 2 * CONCURRENCY
+    assert asgi.summary()["ops_per_sec"] > wsgi.summary()["ops_per_sec"]
+
+
+@pytest.mark.django_db
+def test_concurrent_quotes_and_listing(auth, bookings, bench):
+    # No external waits here: this shows the overhead of the async path, not a speedup.
+    car_ids = [booking.car_id for booking in bookings[:CONCURRENCY]]
+    paths = [f"/api/pricing/quote/?car={car}&start=2030-02-01&end=2030-02-05" for car in car_ids]
+    paths += [f"/api/cars/?page={page}" for page in range(1, 6)]
+
+    with override_settings(ROOT_URLCONF="core.urls"):
+        run_wsgi(bench(f"WSGI, {len(paths)} quote/list requests"), auth, paths, "get")
+    with override_settings(ROOT_URLCONF="core.asgi_urls"):
+        run_asgi(bench(f"ASGI, {len(paths)} quote/list requests"), auth, paths, "get")
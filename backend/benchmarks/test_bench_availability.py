@@ -0,0 +1,80 @@
+import os
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bookings.availability import BookingIntervalIndex, filter_available
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingService
+from apps.cars.models import Car
+
+CARS = int(os.environ.get("BENCH_CARS", 1000))
+BOOKINGS_PER_CAR = int(os.environ.get("BENCH_BOOKINGS_PER_CAR", 20))
+
+
+@pytest.fixture
+def booked_fleet(django_user_model):
+    customer = django_user_model.objects.create_user(username="bench", password="pass")
+    Car.objects.bulk_create(
+        Car(
+            make="Bench",
+            model=f"Model {i}",
+            year=2020,
+            vin=f"AVAIL{i:012d}",
+            type="sedan",
+            base_price_per_day=Decimal("50.00"),
+        )
+        for i in range(CARS)
+    )
+    rng = random.Random(7)
+    statuses = list(Booking.Status.values)
+    bookings = []
+    for car_id in Car.objects.values_list("id", flat=True):
+        start = date(2024, 1, 1)
+        for _ in range(BOOKINGS_PER_CAR):
+            start += timedelta(days=rng.randint(1, 10))
+            end = start + timedelta(days=rng.randint(1, 7))
+            bookings.append(
+                Booking(
+                    customer=customer,
+                    car_id=car_id,
+                    start_date=start,
+                    end_date=end,
+                    status=rng.choice(statuses),
+                )
+            )
+            start = end
+    Booking.objects.bulk_create(bookings, batch_size=5000)
+    return list(Car.objects.all())
+
+
+@pytest.mark.django_db
+def test_set_based_availability_vs_per_car_exists(booked_fleet, bench):
+    start, end = date(2024, 3, 1), date(2024, 3, 5)
+    service = BookingService()
+
+    def per_car():
+        return {car.id for car in booked_fleet if not service.has_overlaps(car, start, end)}
+
+    def set_based():
+        return set(filter_available(Car.objects.all(), start, end).values_list("id", flat=True))
+
+    expected = bench("per-car has_overlaps()", repeat=1)(per_car)
+    with CaptureQueriesContext(connection) as queries:
+        actual = bench("filter_available() anti-join", repeat=5)(set_based)
+
+    assert actual == expected
+    assert len(queries) == 5
+
+    index = bench("BookingIntervalIndex.from_queryset()", repeat=1)(
+        BookingIntervalIndex.from_queryset
+    )
+    car_ids = [car.id for car in booked_fleet]
+    indexed = bench("BookingIntervalIndex.available_cars()", repeat=5)(
+        index.available_cars, car_ids, start, end
+    )
+    assert set(indexed) == expected
@@ -0,0 +1,83 @@
+import os
+import random
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import OperationalError, connection
+
+from apps.bookings.availability import BookingIntervalIndex
+from apps.bookings.models import BLOCKING_STATUSES, Booking
+from apps.bookings.services import BookingOverlapError, BookingService
+from apps.cars.models import Car
+
+WORKERS = int(os.environ.get("BENCH_WORKERS", 8))
+ATTEMPTS_PER_WORKER = int(os.environ.get("BENCH_ATTEMPTS", 100))
+CARS = 20
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_booking_throughput(django_user_model):
+    customer = django_user_model.objects.create_user(username="stress", password="pass")
+    Car.objects.bulk_create(
+        Car(
+            make="Stress",
+            model=f"Model {i}",
+            year=2022,
+            vin=f"STRESS{i:011d}",
+            type="sedan",
+            base_price_per_day=Decimal("60.00"),
+        )
+        for i in range(CARS)
+    )
+    cars = list(Car.objects.all())
+    service = BookingService()
+    counts = {"created": 0, "rejected": 0, "retries": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(WORKERS)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(ATTEMPTS_PER_WORKER):
+            start = date(2030, 1, 1) + timedelta(days=rng.randint(0, 90))
+            end = start + timedelta(days=rng.randint(1, 5))
+            car = rng.choice(cars)
+            while True:
+                try:
+                    service.create_booking(customer, car, start, end)
+                    outcome = "created"
+                except BookingOverlapError:
+                    outcome = "rejected"
+                except OperationalError:
+                    with lock:
+                        counts["retries"] += 1
+                    continue
+                break
+            with lock:
+                counts[outcome] += 1
+        connection.close()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(WORKERS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    attempts = WORKERS * ATTEMPTS_PER_WORKER
+    print(
+        f"\n{connection.vendor}: {attempts} attempts by {WORKERS} threads in {elapsed:.2f}s "
+        f"({attempts / elapsed:.0f}/s), created={counts['created']} "
+        f"rejected={counts['rejected']} lock retries={counts['retries']}"
+    )
+
+    assert counts["created"] + counts["rejected"] == attempts
+    assert Booking.objects.count() == counts["created"]
+    index = BookingIntervalIndex()
+    for booking in Booking.objects.filter(status__in=BLOCKING_STATUSES).order_by("start_date"):
+        assert index.is_available(booking.car_id, booking.start_date, booking.end_date)
+        index.add(booking.car_id, booking.start_date, booking.end_date)
@@ -0,0 +1,55 @@
+import os
+import time
+
+import pytest
+from django.db.models import Q
+
+from apps.cars.models import Car
+from apps.cars.search import search_cars
+from apps.common.seeding import BulkSeeder
+
+CARS = int(os.environ.get("BENCH_SEARCH_CARS", 100_000))
+PAGE = 10
+QUERIES = ["camry", "golf hatchback", "0004242", "wrangler suv 00012"]
+
+
+@pytest.fixture(scope="module")
+def fleet(django_db_setup, django_db_blocker):
+    seeder = BulkSeeder(CARS, 0, 0, seed=3, prefix="srch")
+    with django_db_blocker.unblock():
+        started = time.perf_counter()
+        seeder.run()
+        print(f"\nseeded {CARS} cars in {time.perf_counter() - started:.1f}s")
+    yield seeder
+    with django_db_blocker.unblock():
+        seeder.purge()
+
+
+def legacy_page(query):
+    # The previous `search` filter: one icontains scan per field, name ordering.
+    terms = query.split()
+    cars = Car.objects.all()
+    for term in terms:
+        cars = cars.filter(
+            Q(make__icontains=term)
+            | Q(model__icontains=term)
+            | Q(type__icontains=term)
+            | Q(vin__icontains=term)
+        )
+    cars = cars.order_by("make", "model", "year")
+    return cars.count(), [car.vin for car in cars[:PAGE]]
+
+
+def indexed_page(query):
+    cars = search_cars(Car.objects.all(), query).order_by("-search_rank", "make", "model", "year")
+    return cars.count(), [car.vin for car in cars[:PAGE]]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_index_vs_icontains(fleet, bench, query):
+    legacy_count, _ = bench(f"icontains {query!r}")(legacy_page, query)
+    count, page = bench(f"search index {query!r}")(indexed_page, query)
+
+    assert count == legacy_count
+    assert len(page) == min(PAGE, count)
@@ -0,0 +1,49 @@
+import os
+import time
+from datetime import date
+
+import pytest
+
+from apps.bookings.invoice_batch import InvoiceBatch, completed_booking_ids
+from apps.bookings.models import Booking, Invoice
+from apps.bookings.services import BookingService
+from apps.common.event_bus import OUTBOX
+from apps.common.seeding import BulkSeeder
+
+BOOKINGS = int(os.environ.get("BENCH_INVOICE_BOOKINGS", 20_000))
+SINCE = date(2000, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def history(django_db_setup, django_db_blocker):
+    seeder = BulkSeeder(
+        BOOKINGS // 50, 100, BOOKINGS, seed=9, prefix="invb", end=date(2020, 12, 31)
+    )
+    with django_db_blocker.unblock():
+        started = time.perf_counter()
+        seeder.run()
+        print(f"\nseeded {BOOKINGS} bookings in {time.perf_counter() - started:.1f}s")
+    yield seeder
+    with django_db_blocker.unblock():
+        seeder.purge()
+
+
+@pytest.mark.django_db
+def test_batch_vs_per_booking_invoices(history, bench, settings):
+    # Outbox mode keeps report handlers out of both timings.
+    settings.EVENT_BUS_MODE = OUTBOX
+    ids = completed_booking_ids(SINCE)
+    half = len(ids) // 2
+    service = BookingService()
+
+    def one_by_one():
+        for booking in Booking.objects.filter(id__in=ids[:half]).select_related("car"):
+            service.build_invoice(booking)
+
+    bench(f"build_invoice x {half}", repeat=1)(one_by_one)
+    summary = bench(f"InvoiceBatch x {len(ids) - half}", repeat=1)(
+        InvoiceBatch(SINCE).run, ids[half:]
+    )
+
+    assert Invoice.objects.filter(booking_id__in=ids).count() == len(ids)
+    assert summary.created == len(ids) - half
@@ -0,0 +1,127 @@
+import os
+import random
+import time
+from datetime import timedelta
+
+import pytest
+from dataset import BENCH_START, purge, seed_scale
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.bookings.invoice_builder import InvoiceBuilder
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingService
+from apps.bookings.state import BookingStateMachine
+from apps.cars.models import Car
+from apps.payments.services import PaymentService
+from apps.pricing.services import PricingService
+
+ITERATIONS = int(os.environ.get("BENCH_ITERATIONS", 100))
+SAMPLE_CARS = 50
+
+
+@pytest.fixture(scope="module")
+def dataset(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        started = time.perf_counter()
+        data = seed_scale()
+        print(f"\nseeded {data.bookings} bookings in {time.perf_counter() - started:.1f}s")
+    yield data
+    with django_db_blocker.unblock():
+        purge()
+
+
+@pytest.fixture
+def cars(dataset):
+    ids = random.Random(0).sample(dataset.car_ids, min(SAMPLE_CARS, len(dataset.car_ids)))
+    return list(Car.objects.filter(id__in=ids).order_by("vin"))
+
+
+@pytest.fixture
+def customer(dataset):
+    return get_user_model().objects.get(id=dataset.customer_ids[0])
+
+
+def windows(cars):
+    # Yields (car, start, end) slots after the seeded history that never overlap each other.
+    for idx in range(ITERATIONS):
+        start = BENCH_START + timedelta(days=(idx // len(cars)) * 10)
+        yield cars[idx % len(cars)], start, start + timedelta(days=3)
+
+
+@pytest.mark.django_db
+def test_pricing_quote(cars, bench):
+    rng = random.Random(1)
+    service = PricingService()
+    timer = bench("PricingService.quote")
+    for _ in range(ITERATIONS):
+        start = BENCH_START + timedelta(days=rng.randint(0, 365))
+        timer.measure(service.quote, rng.choice(cars), start, start + timedelta(rng.randint(1, 14)))
+
+
+@pytest.mark.django_db
+def test_state_machine_and_invoice_builder(cars, customer, bench):
+    service = BookingService()
+    machine = BookingStateMachine()
+    pricing = PricingService()
+    payments = PaymentService()
+    create = bench("BookingService.create_booking")
+    transitions = {
+        status: bench(f"BookingStateMachine.transition -> {status}")
+        for status in (Booking.Status.CONFIRMED, Booking.Status.ACTIVE, Booking.Status.COMPLETED)
+    }
+    build = bench("InvoiceBuilder.build")
+    pay = bench("PaymentService.pay_invoice")
+
+    for car, start, end in windows(cars):
+        booking = create.measure(service.create_booking, customer, car, start, end)
+        for status, timer in transitions.items():
+            timer.measure(machine.transition, booking, status)
+        quote = pricing.quote(car, start, end)
+
+        def build_invoice(booking=booking, quote=quote):
+            builder = InvoiceBuilder(booking)
+            builder.add_pricing_breakdown(quote["breakdown"])
+            return builder.build()
+
+        invoice = build.measure(build_invoice)
+        pay.measure(payments.pay_invoice, invoice, "card")
+
+    assert Booking.objects.filter(start_date__gte=BENCH_START).count() == ITERATIONS
+
+
+@pytest.mark.django_db
+def test_api_booking_lifecycle(cars, customer, bench, django_user_model):
+    manager = django_user_model.objects.create_user(
+        username="bench-manager", password="pass", role=django_user_model.Role.MANAGER
+    )
+    customer_client, manager_client = APIClient(), APIClient()
+    customer_client.force_authenticate(customer)
+    manager_client.force_authenticate(manager)
+    quote = bench("GET /api/pricing/quote/")
+    create = bench("POST /api/bookings/")
+    steps = [(path, bench(f"POST /api/bookings/<id>/{path}/")) for path in ("confirm", "checkin")]
+    steps.append(("return", bench("POST /api/bookings/<id>/return/")))
+    pay = bench("POST /api/bookings/<id>/invoice/pay/")
+
+    def call(timer, client, method, url, data=None, expected=200):
+        started = time.perf_counter()
+        response = getattr(client, method)(url, data, format="json")
+        timer.record(time.perf_counter() - started)
+        assert response.status_code == expected, response.content
+        return response
+
+    for car, start, end in windows(cars):
+        dates = {"start": start.isoformat(), "end": end.isoformat()}
+        call(quote, customer_client, "get", "/api/pricing/quote/", {"car": str(car.id), **dates})
+        booking = call(
+            create,
+            customer_client,
+            "post",
+            "/api/bookings/",
+            {"car_id": str(car.id), "start_date": dates["start"], "end_date": dates["end"]},
+            expected=201,
+        ).data
+        for path, timer in steps:
+            call(timer, manager_client, "post", f"/api/bookings/{booking['id']}/{path}/")
+        call(pay, customer_client, "post", f"/api/bookings/{booking['id']}/invoice/pay/")
@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from apps.pricing.rule_cache import RuleSet
+from apps.pricing.services import PricingService
+from apps.pricing.strategies import (
+    BasePriceStrategy,
+    DepreciationRule,
+    DurationDiscountStrategy,
+    DurationRule,
+    PricingContext,
+    SeasonalRule,
+    SeasonalStrategy,
+    YearDepreciationStrategy,
+    to_decimal,
+)
+
+CARS = [
+    SimpleNamespace(id=uuid4(), base_price_per_day=Decimal("39.99") + i, year=2008 + i % 18)
+    for i in range(200)
+]
+RANGES = [
+    (date(2025, 1, 1) + timedelta(days=offset), date(2025, 1, 1) + timedelta(days=offset + length))
+    for offset in range(0, 365, 7)
+    for length in (1, 5, 12)
+]
+RULE_SET = RuleSet(
+    version=1,
+    seasonal=(
+        SeasonalRule(name="Summer uplift", months=frozenset({6, 7, 8}), multiplier=Decimal("1.15")),
+        SeasonalRule(name="Low season", months=frozenset({1, 2}), multiplier=Decimal("0.85")),
+    ),
+    duration=(
+        DurationRule(min_days=3, discount_rate=Decimal("0.05")),
+        DurationRule(min_days=10, discount_rate=Decimal("0.12")),
+    ),
+    depreciation=(DepreciationRule(rate=Decimal("0.03")),),
+)
+
+
+@dataclass
+class DecimalItem:
+    name: str
+    amount: Decimal
+    metadata: dict | None = None
+
+
+@dataclass
+class DecimalResult:
+    # The previous PricingResult: Decimal amounts, quantized on every add and again on output.
+    breakdown: list = field(default_factory=list)
+    total: Decimal = field(default_factory=lambda: Decimal("0.00"))
+
+    def add_item(self, name: str, amount: Decimal, metadata: dict | None = None) -> None:
+        normalized = to_decimal(amount)
+        self.breakdown.append(DecimalItem(name=name, amount=normalized, metadata=metadata))
+        self.total += normalized
+
+    def as_dict(self) -> dict:
+        return {
+            "total": to_decimal(self.total),
+            "breakdown": [
+                {
+                    "name": item.name,
+                    "amount": to_decimal(item.amount),
+                    "metadata": item.metadata or {},
+                }
+                for item in self.breakdown
+            ],
+        }
+
+
+# The previous Decimal strategies, restricted to the compiled rules this benchmark uses.
+class DecimalBasePrice(BasePriceStrategy):
+    def apply(self, context: PricingContext, result: DecimalResult) -> None:
+        amount = to_decimal(context.car.base_price_per_day) * context.rental_days
+        result.add_item(self.label, amount, metadata={"days": context.rental_days})
+
+
+class DecimalDurationDiscount(DurationDiscountStrategy):
+    def apply(self, context: PricingContext, result: DecimalResult) -> None:
+        rate = Decimal("0.00")
+        for rule in self.rules:
+            if context.rental_days >= rule.min_days:
+                rate = max(rate, rule.discount_rate)
+        if rate <= 0:
+            return
+        result.add_item(self.label, -(result.total * rate), metadata={"rate": float(rate)})
+
+
+class DecimalYearDepreciation(YearDepreciationStrategy):
+    def apply(self, context: PricingContext, result: DecimalResult) -> None:
+        rate = self.rules[0].rate
+        result.add_item(self.label, -(result.total * rate), metadata={"rate": float(rate)})
+
+
+class DecimalSeasonal(SeasonalStrategy):
+    def apply(self, context: PricingContext, result: DecimalResult) -> None:
+        for rule in self.rules:
+            if context.start_date.month not in rule.months:
+                continue
+            adjustment = result.total * (rule.multiplier - 1)
+            if adjustment == 0:
+                continue
+            result.add_item(rule.name, adjustment, metadata={"multiplier": float(rule.multiplier)})
+
+
+class DecimalPricingService(PricingService):
+    def _price(self, car, start_date: date, end_date: date) -> dict:
+        context = PricingContext(car=car, start_date=start_date, end_date=end_date)
+        result = DecimalResult()
+        for strategy in self.strategies:
+            strategy.apply(context, result)
+        return result.as_dict()
+
+
+def test_money_quote_path_vs_decimal(bench):
+    # Both sides go through PricingService.quote with strategies built from the same rule set;
+    # only the strategy arithmetic and the result type differ.
+    decimal_service = DecimalPricingService(
+        strategies=(
+            DecimalBasePrice(),
+            DecimalDurationDiscount(RULE_SET.duration),
+            DecimalYearDepreciation(RULE_SET.depreciation),
+            DecimalSeasonal(RULE_SET.seasonal),
+        )
+    )
+    money_service = PricingService(strategies=PricingService.build_strategies(RULE_SET))
+    quotes = len(CARS) * len(RANGES)
+
+    def run(service):
+        return [service.quote(car, start, end) for car in CARS for start, end in RANGES]
+
+    # Timed before the other path's results are kept alive, so neither run pays for collecting
+    # the other's quotes.
+    bench(f"Decimal quotes x{quotes}", repeat=5)(run, decimal_service)
+    bench(f"Money quotes x{quotes}", repeat=5)(run, money_service)
+
+    assert run(money_service) == run(decimal_service)
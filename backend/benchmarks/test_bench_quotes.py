@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.cars.models import Car
+from apps.pricing.services import PricingService
+
+CARS = 50
+RANGES = [
+    (date(2025, 1, 1) + timedelta(days=7 * i), date(2025, 1, 4) + timedelta(days=7 * i))
+    for i in range(20)
+]
+
+
+@pytest.fixture
+def fleet():
+    Car.objects.bulk_create(
+        Car(
+            make="Bench",
+            model=f"Model {i}",
+            year=2015 + i % 10,
+            vin=f"BENCH{i:012d}",
+            type="sedan",
+            base_price_per_day=Decimal("50.00") + i,
+        )
+        for i in range(CARS)
+    )
+    return list(Car.objects.values_list("id", flat=True))
+
+
+@pytest.fixture
+def uncached(settings):
+    # These compare pricing paths, so every quote is computed.
+    settings.PRICING_QUOTE_CACHE_SIZE = 0
+
+
+@pytest.mark.django_db
+def test_quote_many_vs_sequential_quotes(fleet, bench, uncached):
+    def sequential():
+        quotes = {}
+        for car_id in fleet:
+            car = Car.objects.get(id=car_id)
+            for start, end in RANGES:
+                quotes[(car.id, start, end)] = PricingService().quote(car, start, end)
+        return quotes
+
+    def batched():
+        return PricingService().quote_many(fleet, RANGES)
+
+    with CaptureQueriesContext(connection) as sequential_queries:
+        expected = bench("sequential quote()", repeat=3)(sequential)
+    with CaptureQueriesContext(connection) as batched_queries:
+        actual = bench("quote_many()", repeat=3)(batched)
+
+    assert actual == expected
+    assert len(batched_queries) <= 3 * 2
+    assert len(batched_queries) < len(sequential_queries)
+
+
+@pytest.mark.django_db
+def test_fleet_engine_vs_quote_many_over_year_horizon(fleet, bench, uncached):
+    from apps.pricing.engine import FleetPricingEngine
+
+    cars = list(Car.objects.filter(id__in=fleet))
+    horizon = [
+        (date(2025, 1, 1) + timedelta(days=offset), date(2025, 1, 1) + timedelta(days=offset + 3))
+        for offset in range(365)
+    ]
+
+    expected = bench("quote_many() 365-day horizon", repeat=1)(
+        PricingService().quote_many, cars, horizon
+    )
+    table = bench("FleetPricingEngine.price() 365-day horizon", repeat=3)(
+        FleetPricingEngine().price, cars, horizon
+    )
+
+    assert table.as_dict() == expected
+
+
+@pytest.mark.django_db
+def test_memoized_vs_computed_quotes(fleet, bench, settings):
+    from apps.pricing.quote_cache import quote_cache
+
+    cars = list(Car.objects.filter(id__in=fleet))
+
+    def quote_all():
+        service = PricingService()
+        return [service.quote(car, start, end) for car in cars for start, end in RANGES]
+
+    settings.PRICING_QUOTE_CACHE_SIZE = 0
+    expected = bench("computed quotes", repeat=5)(quote_all)
+    settings.PRICING_QUOTE_CACHE_SIZE = 10_000
+    quote_all()
+    actual = bench("memoized quotes", repeat=5)(quote_all)
+
+    assert actual == expected
+    assert quote_cache.stats().hit_ratio > 0.8
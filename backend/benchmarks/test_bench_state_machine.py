@@ -0,0 +1,117 @@
+import random
+from dataclasses import dataclass
+
+from apps.bookings.models import Booking
+from apps.bookings.state import BookingStateMachine, InvalidStateTransition
+
+BOOKINGS = 100_000
+Status = Booking.Status
+
+
+# The previous class-per-state design: one dataclass instance per transition and a property
+# that rebuilds the allowed tuple on every access.
+@dataclass
+class LegacyState:
+    booking: Booking
+
+    @property
+    def allowed_transitions(self) -> tuple[str, ...]:
+        return ()
+
+    def check(self, target_status: str) -> None:
+        if target_status not in self.allowed_transitions:
+            raise InvalidStateTransition(
+                f"Cannot transition booking from {self.booking.status} to {target_status}"
+            )
+
+
+class LegacyPending(LegacyState):
+    @property
+    def allowed_transitions(self) -> tuple[str, ...]:
+        return (Status.CONFIRMED, Status.CANCELED)
+
+
+class LegacyConfirmed(LegacyState):
+    @property
+    def allowed_transitions(self) -> tuple[str, ...]:
+        return (Status.ACTIVE, Status.CANCELED)
+
+
+class LegacyActive(LegacyState):
+    @property
+    def allowed_transitions(self) -> tuple[str, ...]:
+        return (Status.COMPLETED, Status.CANCELED)
+
+
+class LegacyTerminal(LegacyState):
+    @property
+    def allowed_transitions(self) -> tuple[str, ...]:
+        return ()
+
+
+LEGACY_FACTORY = {
+    Status.PENDING: LegacyPending,
+    Status.CONFIRMED: LegacyConfirmed,
+    Status.ACTIVE: LegacyActive,
+    Status.COMPLETED: LegacyTerminal,
+    Status.CANCELED: LegacyTerminal,
+}
+
+TARGET = {
+    Status.PENDING: Status.CONFIRMED,
+    Status.CONFIRMED: Status.ACTIVE,
+    Status.ACTIVE: Status.COMPLETED,
+    Status.COMPLETED: Status.ACTIVE,
+    Status.CANCELED: Status.CONFIRMED,
+}
+
+
+def sample():
+    rng = random.Random(0)
+    statuses = list(TARGET)
+    return [
+        (booking, TARGET[booking.status])
+        for booking in (Booking(status=rng.choice(statuses)) for _ in range(BOOKINGS))
+    ]
+
+
+def test_table_lookup_vs_state_objects(bench):
+    pairs = sample()
+    machine = BookingStateMachine()
+
+    def legacy():
+        ok = 0
+        for booking, target in pairs:
+            try:
+                LEGACY_FACTORY[booking.status](booking).check(target)
+            except InvalidStateTransition:
+                continue
+            ok += 1
+        return ok
+
+    def table():
+        ok = 0
+        for booking, target in pairs:
+            ok += machine.can_transition(booking.status, target)
+        return ok
+
+    expected = bench("class-per-state validation", repeat=3)(legacy)
+    actual = bench("compiled table validation", repeat=3)(table)
+    assert actual == expected
+
+
+def test_batch_validation_and_replay(bench):
+    pairs = sample()
+    machine = BookingStateMachine()
+    bookings = [booking for booking, _ in pairs]
+    log = [Status.CONFIRMED, Status.ACTIVE, Status.COMPLETED]
+
+    valid, errors = bench("validate_many(100k)", repeat=3)(
+        machine.validate_many, bookings, Status.CONFIRMED
+    )
+    replays = bench("replay x 100k logs", repeat=3)(
+        lambda: [machine.replay(log) for _ in range(BOOKINGS)]
+    )
+
+    assert len(valid) + len(errors) == BOOKINGS
+    assert set(replays) == {Status.COMPLETED}
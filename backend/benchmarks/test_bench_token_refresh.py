@@ -0,0 +1,53 @@
+import os
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as StockRefreshSerializer
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from apps.users.serializers import TokenRefreshSerializer
+from apps.users.tokens import RefreshToken, prune_expired_tokens
+
+AGED_TOKENS = int(os.environ.get("BENCH_AGED_TOKENS", 200_000))
+REFRESHES = 200
+
+
+@pytest.fixture
+def aged_tables(django_user_model):
+    user = django_user_model.objects.create_user(username="bench-refresh", password="pass")
+    expired = timezone.now() - timedelta(days=2)
+    for offset in range(0, AGED_TOKENS, 10_000):
+        tokens = OutstandingToken.objects.bulk_create(
+            OutstandingToken(
+                user=user, jti=f"aged-{index}", token="x", created_at=expired, expires_at=expired
+            )
+            for index in range(offset, min(offset + 10_000, AGED_TOKENS))
+        )
+        BlacklistedToken.objects.bulk_create(BlacklistedToken(token=t) for t in tokens[::10])
+    return user
+
+
+def refresh_with(serializer_class, token: str):
+    serializer = serializer_class(data={"refresh": token})
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+@pytest.mark.django_db
+def test_refresh_on_aged_token_tables(aged_tables, bench):
+    token = str(RefreshToken.for_user(aged_tables))
+
+    bench(f"stock refresh, {AGED_TOKENS} aged rows", repeat=REFRESHES)(
+        refresh_with, StockRefreshSerializer, token
+    )
+    bench(f"refresh with JTI cache, {AGED_TOKENS} aged rows", repeat=REFRESHES)(
+        refresh_with, TokenRefreshSerializer, token
+    )
+    summary = bench("prune_expired_tokens()", repeat=1)(prune_expired_tokens, 5000)
+    bench("refresh with JTI cache, pruned", repeat=REFRESHES)(
+        refresh_with, TokenRefreshSerializer, token
+    )
+
+    assert summary.outstanding >= AGED_TOKENS
+    assert not OutstandingToken.objects.filter(expires_at__lte=timezone.now()).exists()
@@ -4,15 +4,73 @@ from decimal import Decimal
 
 import pytest
 
-
 os.environ.setdefault("USE_SQLITE_FOR_TESTS", "1")
 
+pytest_plugins = ["apps.common.testing"]
+
+# Upper bound on SQL statements per request, keyed by "<View>.<action>".
+QUERY_BUDGETS = {
+    # Load the booking, its fines and (cold cache) the pricing rules version and rules, two status
+    # updates, the invoice snapshot insert, then 6 + 7 for the invoice and booking report rollups
+    # (savepoint, previous contribution, rollup rows, counters, new contribution).
+    "BookingViewSet.confirm": 20,
+    "BookingViewSet.checkin": 4,
+    "BookingViewSet.return_booking": 7,
+    "BookingViewSet.pay_invoice": 3,
+    "BookingViewSet.pricing_quote": 4,
+}
+
+
+@pytest.fixture(autouse=True)
+def _restore_event_handlers():
+    # Tests may clear or replace subscriptions; put the application wiring back afterwards.
+    yield
+    from apps.bookings.handlers import register as register_bookings
+    from apps.common.event_bus import event_bus
+    from apps.reports.handlers import register as register_reports
+
+    event_bus.clear()
+    event_bus.mode = None
+    register_bookings(event_bus)
+    register_reports(event_bus)
+
+
+@pytest.fixture
+def query_budgets():
+    return QUERY_BUDGETS
+
+
+@pytest.fixture
+def metrics_client(settings):
+    from rest_framework.test import APIClient
+
+    settings.METRICS_TOKEN = "metrics-test-token"
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION="Bearer metrics-test-token")
+    return client
+
 
 @pytest.fixture
 def customer_user(django_user_model):
     return django_user_model.objects.create_user(username="customer", password="pass")
 
 
+@pytest.fixture
+def manager_user(django_user_model):
+    return django_user_model.objects.create_user(
+        username="manager", password="pass", role=django_user_model.Role.MANAGER
+    )
+
+
+@pytest.fixture
+def manager_client(manager_user):
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    client.force_authenticate(manager_user)
+    return client
+
+
 @pytest.fixture
 def car():
     from apps.cars.models import Car
@@ -0,0 +1,50 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from apps.pricing.rule_cache import RuleSet
+from apps.pricing.strategies import DepreciationRule, DurationRule, SeasonalRule
+
+# Seeded sample fleets, date ranges and rule sets shared by the pricing parity tests.
+
+
+def make_car(price: str, year: int):
+    return SimpleNamespace(id=uuid4(), base_price_per_day=Decimal(price), year=year)
+
+
+def random_fleet(rng: random.Random, size: int):
+    return [
+        make_car(f"{rng.randint(20, 400)}.{rng.randint(0, 99):02d}", rng.randint(2000, 2026))
+        for _ in range(size)
+    ]
+
+
+def random_ranges(rng: random.Random, size: int):
+    ranges = []
+    for _ in range(size):
+        start = date(2025, 1, 1) + timedelta(days=rng.randint(0, 364))
+        ranges.append((start, start + timedelta(days=rng.randint(1, 30))))
+    return ranges
+
+
+RULE_SETS = {
+    "defaults": RuleSet(version=0),
+    "configured": RuleSet(
+        version=1,
+        seasonal=(
+            SeasonalRule(
+                name="Summer uplift", months=frozenset({6, 7, 8}), multiplier=Decimal("1.15")
+            ),
+            SeasonalRule(name="", months=frozenset({12}), multiplier=Decimal("1.33")),
+            SeasonalRule(name="Low season", months=frozenset({1, 2}), multiplier=Decimal("0.85")),
+            SeasonalRule(name="Neutral", months=frozenset({3}), multiplier=Decimal("1.00")),
+        ),
+        duration=(
+            DurationRule(min_days=3, discount_rate=Decimal("0.05")),
+            DurationRule(min_days=14, discount_rate=Decimal("0.17")),
+        ),
+        depreciation=(DepreciationRule(rate=Decimal("0.03")),),
+    ),
+}
@@ -0,0 +1,184 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, override_settings
+from rest_framework.test import APIClient
+
+from apps.bookings.models import Booking, Invoice
+from apps.cars.models import Car
+
+pytestmark = [pytest.mark.django_db, pytest.mark.urls("core.asgi_urls")]
+
+
+def access_token(username: str) -> str:
+    response = APIClient().post(
+        "/api/auth/login/", {"username": username, "password": "pass"}, format="json"
+    )
+    assert response.status_code == 200, response.data
+    return response.data["access"]
+
+
+class Clients:
+    # The same bearer token through the sync test client and the ASGI (async) test client.
+    def __init__(self, username: str) -> None:
+        self.auth = f"Bearer {access_token(username)}"
+        self.sync = APIClient()
+        self.sync.credentials(HTTP_AUTHORIZATION=self.auth)
+        self.asgi = AsyncClient()
+
+    def aget(self, path: str, headers: dict | None = None):
+        headers = {"Authorization": self.auth, **(headers or {})}
+        return async_to_sync(self.asgi.get)(path, headers=headers)
+
+    def apost(self, path: str, data: dict):
+        return async_to_sync(self.asgi.post)(
+            path, data, content_type="application/json", headers={"Authorization": self.auth}
+        )
+
+
+def body(response):
+    return json.loads(response.content) if response.content else None
+
+
+@pytest.fixture
+def customer(customer_user):
+    return Clients("customer")
+
+
+@pytest.fixture
+def manager(manager_user):
+    return Clients("manager")
+
+
+@pytest.fixture
+def fleet(car):
+    cars = [car]
+    for index in range(12):
+        cars.append(
+            Car.objects.create(
+                make="Mazda" if index % 2 else "Volvo",
+                model=f"M{index}",
+                year=2020 + index % 4,
+                vin=f"ASYNCVIN{index:09d}",
+                type="suv" if index % 3 else "sedan",
+                base_price_per_day=Decimal("50.00") + index,
+            )
+        )
+    return cars
+
+
+def test_quote_matches_the_sync_view(customer, car):
+    url = f"/api/pricing/quote/?car={car.id}&start=2025-03-01&end=2025-03-04"
+
+    response = customer.aget(url)
+
+    assert response.status_code == 200
+    assert "Server-Timing" in response
+    with override_settings(ROOT_URLCONF="core.urls"):
+        assert body(response) == body(customer.sync.get(url))
+
+
+@pytest.mark.parametrize(
+    "query, status",
+    [
+        ("start=2025-03-01&end=2025-03-04", 400),
+        ("car={car}&start=2025-03-01&end=03/04/2025", 400),
+        ("car={car}&start=2025-03-04&end=2025-03-01", 400),
+        ("car=00000000-0000-0000-0000-000000000000&start=2025-03-01&end=2025-03-04", 404),
+        ("car=not-a-uuid&start=2025-03-01&end=2025-03-04", 404),
+    ],
+)
+def test_quote_errors(customer, car, query, status):
+    url = f"/api/pricing/quote/?{query.format(car=car.id)}"
+    response = customer.aget(url)
+
+    assert response.status_code == status
+    if status == 400:
+        with override_settings(ROOT_URLCONF="core.urls"):
+            assert body(response) == customer.sync.get(url).json()
+
+
+def test_anonymous_requests_are_rejected(car):
+    response = async_to_sync(AsyncClient().get)(f"/api/pricing/quote/?car={car.id}")
+
+    assert response.status_code == 401
+    assert response["WWW-Authenticate"].startswith("Bearer")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "?page=2",
+        "?make=mazda&type=suv",
+        "?year_min=2021&year_max=2022&page_size=50",
+        "?search=volvo",
+        f"?available_from={date.today()}&available_to={date.today() + timedelta(days=3)}",
+    ],
+)
+def test_car_list_matches_the_sync_view(customer, fleet, query):
+    response = customer.aget(f"/api/cars/{query}")
+
+    assert response.status_code == 200
+    with override_settings(ROOT_URLCONF="core.urls"):
+        expected = customer.sync.get(f"/api/cars/{query}")
+    assert body(response) == json.loads(expected.content)
+    assert response["ETag"] == expected["ETag"]
+
+
+def test_car_list_shares_cache_entries_and_etags(customer, fleet, booking):
+    query = f"?available_from={booking.start_date}&available_to={booking.end_date}"
+    listed = body(customer.aget(f"/api/cars/{query}"))
+    assert str(booking.car_id) not in {car["id"] for car in listed["results"]}
+
+    etag = customer.aget("/api/cars/")["ETag"]
+    with override_settings(ROOT_URLCONF="core.urls"):
+        assert customer.sync.get("/api/cars/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    not_modified = customer.aget("/api/cars/", headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == 304
+    assert not not_modified.content
+
+
+def test_car_list_validation_and_create_fallback(customer, manager):
+    response = customer.aget("/api/cars/?available_from=2025-03-01")
+    assert response.status_code == 400
+    assert body(response) == ["available_from and available_to must be provided together."]
+
+    payload = {
+        "make": "Kia",
+        "model": "Ceed",
+        "year": 2024,
+        "vin": "ASYNCVIN000000999",
+        "type": "hatchback",
+        "base_price_per_day": "40.00",
+    }
+    assert customer.apost("/api/cars/", payload).status_code == 403
+    assert manager.apost("/api/cars/", payload).status_code == 201
+    assert Car.objects.filter(vin=payload["vin"]).exists()
+
+
+def test_pay_invoice_builds_and_pays(customer, booking):
+    response = customer.apost(f"/api/bookings/{booking.id}/invoice/pay/", {"method": "cash"})
+
+    assert response.status_code == 200
+    invoice = Invoice.objects.get(booking=booking)
+    assert body(response) == {"id": str(invoice.id), "status": "paid", "method": "cash"}
+    assert invoice.paid_at is not None
+    assert invoice.payment_reference.startswith("payment-")
+
+
+@override_settings(PAYMENT_PROVIDER_LATENCY=0.01)
+def test_pay_invoice_access(manager, booking, django_user_model):
+    django_user_model.objects.create_user(username="other", password="pass")
+    other = Clients("other")
+    url = f"/api/bookings/{booking.id}/invoice/pay/"
+
+    assert other.apost(url, {}).status_code == 404
+    assert other.apost("/api/bookings/not-a-uuid/invoice/pay/", {}).status_code == 404
+    assert async_to_sync(AsyncClient().post)(url).status_code == 401
+    assert manager.apost(url, {}).status_code == 200
+    assert Booking.objects.get(pk=booking.pk).invoice.method == "card"
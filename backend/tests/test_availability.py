@@ -0,0 +1,90 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.bookings.availability import BookingIntervalIndex
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingService
+from apps.cars.models import Car
+
+
+@pytest.fixture
+def other_car():
+    return Car.objects.create(
+        make="Other",
+        model="Car",
+        year=2020,
+        vin="VIN0000000000OTHR",
+        type="suv",
+        base_price_per_day=Decimal("80.00"),
+    )
+
+
+@pytest.mark.django_db
+def test_car_list_filters_by_availability(booking, car, other_car, customer_user):
+    client = APIClient()
+    client.force_authenticate(customer_user)
+
+    response = client.get(
+        "/api/cars/",
+        {
+            "available_from": booking.start_date.isoformat(),
+            "available_to": booking.end_date.isoformat(),
+        },
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.data["results"]] == [str(other_car.id)]
+
+    booking.status = Booking.Status.CANCELED
+    booking.save(update_fields=["status"])
+    response = client.get(
+        "/api/cars/",
+        {
+            "available_from": booking.start_date.isoformat(),
+            "available_to": booking.end_date.isoformat(),
+        },
+    )
+    assert {item["id"] for item in response.data["results"]} == {str(car.id), str(other_car.id)}
+
+
+@pytest.mark.django_db
+def test_car_list_availability_requires_valid_window(customer_user):
+    client = APIClient()
+    client.force_authenticate(customer_user)
+
+    assert client.get("/api/cars/", {"available_from": "2025-01-01"}).status_code == 400
+    assert (
+        client.get(
+            "/api/cars/", {"available_from": "2025-01-05", "available_to": "2025-01-01"}
+        ).status_code
+        == 400
+    )
+
+
+@pytest.mark.django_db
+def test_interval_index_agrees_with_has_overlaps(customer_user, car, other_car):
+    rng = random.Random(4)
+    base = date(2025, 1, 1)
+    for target in (car, other_car):
+        for offset in range(0, 120, 10):
+            start = base + timedelta(days=offset + rng.randint(0, 3))
+            Booking.objects.create(
+                customer=customer_user,
+                car=target,
+                start_date=start,
+                end_date=start + timedelta(days=rng.randint(1, 6)),
+                status=rng.choice(list(Booking.Status.values)),
+            )
+
+    index = BookingIntervalIndex.from_queryset()
+    service = BookingService()
+    for _ in range(200):
+        start = base + timedelta(days=rng.randint(0, 130))
+        end = start + timedelta(days=rng.randint(1, 8))
+        for target in (car, other_car):
+            assert index.is_available(target.id, start, end) == (
+                not service.has_overlaps(target, start, end)
+            )
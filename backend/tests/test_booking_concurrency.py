@@ -0,0 +1,141 @@
+import importlib
+import threading
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.db import OperationalError, connection
+
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingOverlapError, BookingService, TransitionConflict
+from apps.cars.models import Car
+
+
+def run_concurrently(workers: int, target) -> list:
+    barrier = threading.Barrier(workers)
+    outcomes: list = []
+    lock = threading.Lock()
+
+    def worker(idx: int) -> None:
+        barrier.wait()
+        try:
+            outcome = target(idx)
+        except Exception as exc:  # collected for assertions
+            outcome = exc
+        finally:
+            connection.close()
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+@pytest.mark.django_db
+def test_overlap_migration_refuses_existing_overlaps(booking, customer_user, car):
+    migration = importlib.import_module("apps.bookings.migrations.0004_booking_no_overlap")
+    schema_editor = SimpleNamespace(connection=connection)
+    migration.check_no_overlaps(None, schema_editor)
+
+    # Data from before the constraint existed: drop the triggers for this test's transaction.
+    with connection.cursor() as cursor:
+        for statement in migration.SQLITE_REVERSE:
+            cursor.execute(statement)
+    clash = Booking.objects.create(
+        customer=customer_user, car=car, start_date=booking.start_date, end_date=booking.end_date
+    )
+
+    with pytest.raises(RuntimeError) as excinfo:
+        migration.check_no_overlaps(None, schema_editor)
+    assert clash.id.hex in str(excinfo.value)  # SQLite stores UUIDs as hex
+    clash.status = Booking.Status.CANCELED
+    clash.save()
+    migration.check_no_overlaps(None, schema_editor)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_create_booking_never_double_books(customer_user, car):
+    start = date(2030, 5, 1)
+    service = BookingService()
+
+    def book(idx: int):
+        offset = timedelta(days=idx % 3)
+        for _ in range(20):
+            try:
+                return service.create_booking(
+                    customer_user, car, start + offset, start + offset + timedelta(days=4)
+                )
+            except OperationalError:
+                # SQLite reports writer contention as "database is locked"; retry.
+                continue
+        raise AssertionError("could not acquire the database")
+
+    outcomes = run_concurrently(8, book)
+
+    created = [outcome for outcome in outcomes if isinstance(outcome, Booking)]
+    rejected = [outcome for outcome in outcomes if isinstance(outcome, BookingOverlapError)]
+    assert len(created) == 1
+    assert len(rejected) == 7
+    assert Booking.objects.filter(car=car).count() == 1
+
+
+@pytest.mark.django_db
+def test_overlap_constraint_ignores_inactive_bookings(booking, customer_user, car):
+    service = BookingService()
+    service.cancel_booking(booking)
+
+    replacement = service.create_booking(customer_user, car, booking.start_date, booking.end_date)
+
+    assert replacement.status == Booking.Status.PENDING
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_transitions_from_stale_copies_apply_exactly_once(booking):
+    service = BookingService()
+    service.confirm_booking(booking)
+    # Every worker validates against its own copy read before anyone writes.
+    copies = [Booking.objects.select_related("car").get(pk=booking.pk) for _ in range(8)]
+
+    def move(idx: int):
+        copy = copies[idx]
+        action = service.cancel_booking if idx % 2 else service.checkin_booking
+        for attempt in range(50):
+            try:
+                return action(copy)
+            except OperationalError:
+                time.sleep(0.005 * attempt)
+        raise AssertionError("could not acquire the database")
+
+    outcomes = run_concurrently(8, move)
+
+    applied = [outcome for outcome in outcomes if isinstance(outcome, Booking)]
+    conflicts = [outcome for outcome in outcomes if isinstance(outcome, TransitionConflict)]
+    assert len(applied) == 1
+    assert len(conflicts) == 7
+    booking.refresh_from_db()
+    booking.car.refresh_from_db()
+    assert booking.status == applied[0].status
+    expected_car = (
+        Car.Status.RENTED if booking.status == Booking.Status.ACTIVE else Car.Status.AVAILABLE
+    )
+    assert booking.car.status == expected_car
+
+
+@pytest.mark.django_db
+def test_transition_from_stale_instance_raises_conflict(booking):
+    service = BookingService()
+    stale = Booking.objects.get(pk=booking.pk)
+    service.cancel_booking(booking)
+
+    with pytest.raises(TransitionConflict, match="expected pending, found canceled"):
+        service.confirm_booking(stale)
+
+    booking.refresh_from_db()
+    booking.car.refresh_from_db()
+    assert booking.status == Booking.Status.CANCELED
+    assert booking.car.status == Car.Status.AVAILABLE
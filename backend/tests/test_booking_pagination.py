@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.bookings.models import Booking, Deposit, Fine, Invoice
+from apps.cars.models import Car
+
+
+def make_bookings(customer, count, cars=3):
+    fleet = [
+        Car.objects.create(
+            make="Make",
+            model=f"Model {idx}",
+            year=2024,
+            vin=f"PAGEVIN{idx:010d}",
+            type="sedan",
+            base_price_per_day=Decimal("50.00"),
+        )
+        for idx in range(cars)
+    ]
+    start = date(2030, 1, 1)
+    bookings = []
+    for idx in range(count):
+        car = fleet[idx % cars]
+        day = start + timedelta(days=(idx // cars) * 2)
+        booking = Booking.objects.create(
+            customer=customer, car=car, start_date=day, end_date=day + timedelta(days=1)
+        )
+        Deposit.objects.create(booking=booking, amount=Decimal("100.00"))
+        Invoice.objects.create(booking=booking, total=Decimal("50.00"), breakdown=[])
+        Fine.objects.create(booking=booking, type=Fine.FineType.OTHER, amount=Decimal("5.00"))
+        bookings.append(booking)
+    return bookings
+
+
+def count_list_queries(client):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get("/api/bookings/")
+    assert response.status_code == 200
+    return len(ctx.captured_queries), response
+
+
+@pytest.mark.django_db
+def test_list_query_count_is_constant_per_page(customer_user, manager_client):
+    make_bookings(customer_user, 2)
+    few, _ = count_list_queries(manager_client)
+
+    Car.objects.all().delete()
+    make_bookings(customer_user, 30, cars=5)
+    many, response = count_list_queries(manager_client)
+
+    assert few == many
+    assert len(response.data["results"]) == 10
+    assert "count" not in response.data
+
+
+@pytest.mark.django_db
+def test_list_uses_lean_representation(customer_user, manager_client):
+    make_bookings(customer_user, 1)
+
+    item = manager_client.get("/api/bookings/").data["results"][0]
+
+    assert item["fines_count"] == 1
+    assert item["deposit_status"] == Deposit.Status.HELD
+    assert item["invoice_total"] == "50.00"
+    assert item["invoice_paid_at"] is None
+    assert item["car"]["model"] == "Model 0"
+    assert "fines" not in item and "invoice" not in item
+
+
+@pytest.mark.django_db
+def test_cursor_walks_forward_and_back_without_duplicates(customer_user, manager_client):
+    bookings = make_bookings(customer_user, 23, cars=4)
+    expected = [
+        str(b.id)
+        for b in sorted(bookings, key=lambda b: (-b.start_date.toordinal(), str(b.car_id), b.id))
+    ]
+
+    pages = []
+    url = "/api/bookings/?page_size=5"
+    while url:
+        data = manager_client.get(url).data
+        pages.append([item["id"] for item in data["results"]])
+        url = data["next"]
+
+    assert [item for page in pages for item in page] == expected
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert data["previous"] is not None
+
+    previous = manager_client.get(data["previous"]).data
+    assert [item["id"] for item in previous["results"]] == pages[3]
+    first = manager_client.get(manager_client.get(previous["previous"]).data["previous"]).data
+    assert [item["id"] for item in first["results"]] == pages[1]
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_is_not_found(manager_client):
+    response = manager_client.get("/api/bookings/?cursor=not-a-cursor")
+
+    assert response.status_code == 404
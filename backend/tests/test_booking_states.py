@@ -4,6 +4,7 @@ import pytest
 
 from apps.bookings.models import Booking, Fine
 from apps.bookings.services import BookingOverlapError, BookingService, InvalidStateTransition
+from apps.bookings.state import STATE_FACTORY, TRANSITIONS, BookingStateMachine
 from apps.common.event_bus import BOOKING_CONFIRMED, CAR_RETURNED, event_bus
 
 
@@ -44,6 +45,44 @@ def test_invalid_transition_raises(booking):
         service.return_booking(booking)
 
 
+def test_transition_table_matches_state_classes():
+    for status, state_cls in STATE_FACTORY.items():
+        assert set(TRANSITIONS[status]) == set(state_cls.allowed_transitions)
+    effect = TRANSITIONS[Booking.Status.ACTIVE][Booking.Status.COMPLETED]
+    assert effect.car_status == "available"
+    assert effect.event == CAR_RETURNED
+
+
+def test_state_machine_validates_without_allocating_effects():
+    machine = BookingStateMachine()
+    first = machine.effect(Booking.Status.PENDING, Booking.Status.CONFIRMED)
+
+    assert machine.effect(Booking.Status.PENDING, Booking.Status.CONFIRMED) is first
+    assert machine.can_transition(Booking.Status.CONFIRMED, Booking.Status.ACTIVE)
+    assert not machine.can_transition(Booking.Status.COMPLETED, Booking.Status.ACTIVE)
+    with pytest.raises(InvalidStateTransition, match="from completed to active"):
+        machine.effect(Booking.Status.COMPLETED, Booking.Status.ACTIVE)
+    with pytest.raises(InvalidStateTransition, match="No state registered for archived"):
+        machine.effect("archived", Booking.Status.ACTIVE)
+
+
+def test_state_machine_validates_batches_and_replays():
+    machine = BookingStateMachine()
+    bookings = [
+        Booking(status=Booking.Status.PENDING),
+        Booking(status=Booking.Status.CANCELED),
+        Booking(status=Booking.Status.PENDING),
+    ]
+
+    valid, errors = machine.validate_many(bookings, Booking.Status.CONFIRMED)
+
+    assert valid == [bookings[0], bookings[2]]
+    assert list(errors) == [bookings[1].pk]
+    assert machine.replay(["confirmed", "active", "completed"]) == Booking.Status.COMPLETED
+    with pytest.raises(InvalidStateTransition):
+        machine.replay(["confirmed", "completed"])
+
+
 @pytest.mark.django_db
 def test_overlap_detection(booking, customer_user, car):
     service = BookingService()
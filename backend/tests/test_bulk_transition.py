@@ -0,0 +1,149 @@
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.bookings.models import Booking, Invoice
+from apps.bookings.services import BookingService
+from apps.cars.models import Car
+from apps.common.event_bus import BOOKING_CONFIRMED, event_bus
+from apps.common.models import OutboxEvent
+from apps.reports.models import DailyRollup
+from apps.reports.rollups import rebuild_rollups
+
+URL = "/api/bookings/bulk-transition/"
+
+
+def make_bookings(customer, count, status=Booking.Status.PENDING):
+    bookings = []
+    for idx in range(count):
+        car = Car.objects.create(
+            make="Bulk",
+            model=f"Model {idx}",
+            year=2024,
+            vin=f"BULKT{uuid.uuid4().hex[:12]}",
+            type="sedan",
+            base_price_per_day=Decimal("40.00"),
+        )
+        start = date(2030, 1, 1) + timedelta(days=idx)
+        bookings.append(
+            Booking.objects.create(
+                customer=customer,
+                car=car,
+                start_date=start,
+                end_date=start + timedelta(days=2),
+                status=status,
+            )
+        )
+    return bookings
+
+
+@pytest.mark.django_db
+def test_bulk_confirm_reports_each_item(customer_user, manager_client):
+    pending = make_bookings(customer_user, 3)
+    (completed,) = make_bookings(customer_user, 1, status=Booking.Status.COMPLETED)
+    missing = uuid.uuid4()
+    confirmed: list = []
+    event_bus.subscribe(BOOKING_CONFIRMED, confirmed.append)
+
+    ids = [str(b.id) for b in pending] + [str(completed.id), str(missing)]
+    response = manager_client.post(URL, {"ids": ids, "status": "confirmed"}, format="json")
+
+    assert response.status_code == 200
+    assert response.data["updated"] == 3
+    results = {str(item["id"]): item for item in response.data["results"]}
+    assert [str(item["id"]) for item in response.data["results"]] == ids
+    for booking in pending:
+        assert results[str(booking.id)] == {"id": booking.id, "ok": True, "status": "confirmed"}
+        booking.refresh_from_db()
+        booking.car.refresh_from_db()
+        assert booking.status == Booking.Status.CONFIRMED
+        assert booking.car.status == Car.Status.RESERVED
+    assert results[str(completed.id)]["ok"] is False
+    assert results[str(completed.id)]["status"] == Booking.Status.COMPLETED
+    assert "Cannot transition" in results[str(completed.id)]["error"]
+    assert results[str(missing)] == {
+        "id": missing,
+        "ok": False,
+        "status": None,
+        "error": "Not found.",
+    }
+    assert sorted(b.id for b in confirmed) == sorted(b.id for b in pending)
+
+
+@pytest.mark.django_db
+def test_bulk_transition_query_count_does_not_grow_with_batch(customer_user, manager_client):
+    # Default (sync) event bus: invoices and report rollups are written inside the request.
+    def run(count, status="confirmed", source=Booking.Status.PENDING):
+        ids = [str(b.id) for b in make_bookings(customer_user, count, status=source)]
+        with CaptureQueriesContext(connection) as ctx:
+            response = manager_client.post(URL, {"ids": ids, "status": status}, format="json")
+        assert response.data["updated"] == count
+        return len(ctx.captured_queries)
+
+    run(1)  # warms the process-wide pricing rule cache
+    assert run(2) == run(25)
+    assert Invoice.objects.count() == 28
+    assert run(2, "canceled", Booking.Status.CONFIRMED) == run(25, "canceled")
+
+
+@pytest.mark.django_db
+def test_bulk_transition_queues_events_in_outbox_mode(customer_user, manager_client, settings):
+    settings.EVENT_BUS_MODE = "outbox"
+    ids = [str(b.id) for b in make_bookings(customer_user, 3)]
+
+    manager_client.post(URL, {"ids": ids, "status": "confirmed"}, format="json")
+
+    assert OutboxEvent.objects.filter(event_name=BOOKING_CONFIRMED).count() == 3
+    assert not Invoice.objects.exists()
+
+
+@pytest.mark.django_db
+def test_bulk_handlers_match_the_per_booking_path(customer_user, manager_client):
+    bookings = make_bookings(customer_user, 4)
+    ids = [str(b.id) for b in bookings]
+    manager_client.post(URL, {"ids": ids[:3], "status": "confirmed"}, format="json")
+    manager_client.post(URL, {"ids": ids[1:3], "status": "canceled"}, format="json")
+    manager_client.post(f"/api/bookings/{ids[3]}/confirm/")
+
+    def rollups():
+        # Cancellations leave zeroed rows behind; a rebuild does not create them.
+        rows = DailyRollup.objects.values_list(
+            "day", "car_id", "booked_days", "bookings_started", "revenue", "invoices"
+        )
+        return sorted(row for row in rows if any(row[2:]))
+
+    incremental = rollups()
+    rebuild_rollups()
+
+    assert incremental == rollups()
+    assert Invoice.objects.count() == 4
+    for booking in bookings:
+        invoice = Invoice.objects.get(booking=booking)
+        assert (
+            invoice.total
+            == BookingService().pricing_service.quote(
+                booking.car, booking.start_date, booking.end_date
+            )["total"]
+        )
+
+
+@pytest.mark.django_db
+def test_bulk_transition_requires_manager_and_valid_status(customer_user, manager_client):
+    (booking,) = make_bookings(customer_user, 1)
+    client = APIClient()
+    client.force_authenticate(customer_user)
+
+    forbidden = client.post(URL, {"ids": [str(booking.id)], "status": "confirmed"}, format="json")
+    invalid = manager_client.post(
+        URL, {"ids": [str(booking.id)], "status": "pending"}, format="json"
+    )
+    empty = manager_client.post(URL, {"ids": [], "status": "confirmed"}, format="json")
+
+    assert forbidden.status_code == 403
+    assert invalid.status_code == 400
+    assert empty.status_code == 400
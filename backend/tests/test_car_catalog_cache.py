@@ -0,0 +1,134 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingService
+from apps.cars.models import Car
+
+
+@pytest.fixture
+def client(customer_user):
+    client = APIClient()
+    client.force_authenticate(customer_user)
+    return client
+
+
+def count_queries(call):
+    with CaptureQueriesContext(connection) as ctx:
+        response = call()
+    return response, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_repeat_list_is_served_from_cache_and_param_order_is_ignored(client, car):
+    first, cold = count_queries(lambda: client.get("/api/cars/?make=test&type=sedan"))
+    second, warm = count_queries(lambda: client.get("/api/cars/?type=sedan&make=test"))
+
+    assert first.status_code == second.status_code == 200
+    assert cold > 0
+    assert warm == 0
+    assert second.data == first.data
+    assert second["ETag"] == first["ETag"]
+    assert first["ETag"].startswith('"')
+    assert client.get("/api/cars/?make=test&make=other")["ETag"] != first["ETag"]
+
+
+@pytest.mark.django_db
+def test_params_the_filters_see_differently_get_separate_entries(client, car):
+    Car.objects.create(
+        make="Test Ultra",
+        model="Roadster",
+        year=2024,
+        vin="CACHEKEYVIN000001",
+        type="coupe",
+        base_price_per_day=car.base_price_per_day,
+    )
+
+    def makes(query):
+        return sorted(item["make"] for item in client.get(f"/api/cars/{query}").data["results"])
+
+    assert makes("?make=test") == ["Test", "Test Ultra"]
+    assert makes("?make=%20ultra") == ["Test Ultra"]
+    assert makes("?make=ultra%20") == []
+    assert makes("?make=ultra&make=") == ["Test", "Test Ultra"]
+
+
+@pytest.mark.django_db
+def test_pagination_links_follow_the_request_scheme(client, car):
+    Car.objects.bulk_create(
+        Car(
+            make="Other",
+            model=f"Model {index}",
+            year=2024,
+            vin=f"CACHEKEYVIN{index:06d}",
+            type="sedan",
+            base_price_per_day=car.base_price_per_day,
+        )
+        for index in range(10)
+    )
+
+    plain = client.get("/api/cars/")
+    secure = client.get("/api/cars/", secure=True)
+
+    assert plain.data["next"].startswith("http://")
+    assert secure.data["next"].startswith("https://")
+
+
+@pytest.mark.django_db
+def test_matching_etag_returns_not_modified(client, car):
+    etag = client.get("/api/cars/")["ETag"]
+    detail_etag = client.get(f"/api/cars/{car.id}/")["ETag"]
+
+    listed, queries = count_queries(lambda: client.get("/api/cars/", HTTP_IF_NONE_MATCH=etag))
+    detail = client.get(f"/api/cars/{car.id}/", HTTP_IF_NONE_MATCH=f'"stale", {detail_etag}')
+    stale = client.get(f"/api/cars/{car.id}/", HTTP_IF_NONE_MATCH='"stale"')
+
+    assert listed.status_code == detail.status_code == 304
+    assert queries == 0
+    assert listed["ETag"] == etag
+    assert not listed.content
+    assert stale.status_code == 200
+
+
+@pytest.mark.django_db
+def test_car_writes_invalidate_cached_pages(client, car):
+    etag = client.get(f"/api/cars/{car.id}/")["ETag"]
+    client.get("/api/cars/")
+
+    car.mileage = 1234
+    car.save()
+    detail = client.get(f"/api/cars/{car.id}/", HTTP_IF_NONE_MATCH=etag)
+    Car.objects.filter(pk=car.pk).get().delete()
+    listed = client.get("/api/cars/")
+
+    assert detail.status_code == 200
+    assert detail.data["mileage"] == 1234
+    assert detail["ETag"] != etag
+    assert listed.data["results"] == []
+
+
+@pytest.mark.django_db
+def test_booking_transitions_invalidate_car_status(client, booking, car):
+    BookingService().confirm_booking(booking)
+    assert client.get(f"/api/cars/{car.id}/").data["status"] == Car.Status.RESERVED
+
+    BookingService().cancel_booking(booking)
+
+    assert client.get(f"/api/cars/{car.id}/").data["status"] == Car.Status.AVAILABLE
+
+
+@pytest.mark.django_db
+def test_new_booking_invalidates_availability_results(client, car, customer_user):
+    start = date(2031, 3, 1)
+    params = {"available_from": start.isoformat(), "available_to": "2031-03-04"}
+    assert len(client.get("/api/cars/", params).data["results"]) == 1
+
+    Booking.objects.create(
+        customer=customer_user, car=car, start_date=start, end_date=start + timedelta(days=2)
+    )
+
+    assert client.get("/api/cars/", params).data["results"] == []
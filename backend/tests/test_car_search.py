@@ -0,0 +1,101 @@
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.cars import search
+from apps.cars.models import Car
+from apps.cars.search import search_cars
+
+FLEET = [
+    ("Toyota", "Camry", "sedan", "JTCAMRY0000000001"),
+    ("Toyota", "Corolla Cross", "suv", "JTCOROLLA00000002"),
+    ("Honda", "Civic", "sedan", "HNCIVIC0000000003"),
+    ("Tesla", "Model Y", "suv", "TSLAMODELY0000004"),
+]
+
+
+@pytest.fixture
+def fleet():
+    return {
+        vin: Car.objects.create(
+            make=make,
+            model=model,
+            year=2024,
+            vin=vin,
+            type=car_type,
+            base_price_per_day=Decimal("50.00"),
+        )
+        for make, model, car_type, vin in FLEET
+    }
+
+
+def vins(queryset):
+    return [car.vin for car in queryset]
+
+
+@pytest.mark.django_db
+def test_search_matches_every_term_across_fields(fleet):
+    assert sorted(vins(search_cars(Car.objects.all(), "toyota"))) == [
+        "JTCAMRY0000000001",
+        "JTCOROLLA00000002",
+    ]
+    assert vins(search_cars(Car.objects.all(), "TOYOTA suv")) == ["JTCOROLLA00000002"]
+    assert vins(search_cars(Car.objects.all(), "civic0000")) == ["HNCIVIC0000000003"]
+    assert vins(search_cars(Car.objects.all(), "odel")) == ["TSLAMODELY0000004"]
+    assert vins(search_cars(Car.objects.all(), 'camry "quoted')) == []
+
+
+@pytest.mark.django_db
+def test_short_terms_fall_back_to_substring_filters(fleet):
+    assert vins(search_cars(Car.objects.all(), "y")) != []
+    assert vins(search_cars(Car.objects.all(), "cx")) == []
+    assert vins(search_cars(Car.objects.all(), "CA sedan")) == ["JTCAMRY0000000001"]
+
+
+@pytest.mark.django_db
+def test_postgres_short_terms_skip_the_trigram_search(fleet, monkeypatch):
+    trigram_queries = []
+    monkeypatch.setattr(search.connection, "vendor", "postgresql")
+    monkeypatch.setattr(
+        search, "_search_postgres", lambda cars, terms: trigram_queries.append(terms)
+    )
+
+    assert vins(search_cars(Car.objects.all(), "CA sedan")) == ["JTCAMRY0000000001"]
+    assert vins(search_cars(Car.objects.all(), "y")) != []
+    search_cars(Car.objects.all(), "camry sedan")
+
+    assert trigram_queries == [["camry", "sedan"]]
+
+
+@pytest.mark.django_db
+def test_search_index_follows_car_writes(fleet):
+    camry = fleet["JTCAMRY0000000001"]
+    camry.make = "Lexus"
+    camry.save()
+    fleet["HNCIVIC0000000003"].delete()
+
+    assert vins(search_cars(Car.objects.all(), "lexus")) == ["JTCAMRY0000000001"]
+    assert vins(search_cars(Car.objects.all(), "toyota")) == ["JTCOROLLA00000002"]
+    assert vins(search_cars(Car.objects.all(), "civic")) == []
+
+
+@pytest.mark.django_db
+def test_api_search_orders_by_relevance(fleet, customer_user):
+    Car.objects.create(
+        make="Sedanista",
+        model="Sedan Sedan",
+        year=2020,
+        vin="SEDANSEDAN0000005",
+        type="sedan",
+        base_price_per_day=Decimal("30.00"),
+    )
+    client = APIClient()
+    client.force_authenticate(customer_user)
+
+    response = client.get("/api/cars/", {"search": "sedan", "type": "sedan"})
+
+    assert response.status_code == 200
+    results = [item["vin"] for item in response.data["results"]]
+    assert results[0] == "SEDANSEDAN0000005"
+    assert sorted(results[1:]) == ["HNCIVIC0000000003", "JTCAMRY0000000001"]
@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection, connections
+
+from apps.common.db_connections import connection_metrics
+
+
+class FakePool:
+    def get_stats(self):
+        return {
+            "pool_size": 4,
+            "pool_available": 1,
+            "requests_waiting": 2,
+            "requests_queued": 7,
+            "requests_wait_ms": 1500,
+            "requests_errors": 1,
+        }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_counts():
+    connection_metrics.reset()
+    yield
+    connection_metrics.reset()
+
+
+@pytest.mark.django_db
+def test_connects_are_counted_per_alias():
+    extra = connections.create_connection("default")
+    try:
+        extra.ensure_connection()
+        extra.ensure_connection()
+    finally:
+        extra.close()
+
+    [stats] = connection_metrics.stats()
+    assert (stats.alias, stats.mode, stats.opened) == ("default", "per-request", 1)
+    assert stats.in_use == stats.waits == 0
+
+
+def test_pool_figures_come_from_the_pool(monkeypatch):
+    monkeypatch.setattr(connection, "pool", FakePool(), raising=False)
+
+    [stats] = connection_metrics.stats()
+
+    assert stats.mode == "pool"
+    assert (stats.size, stats.in_use, stats.waiting, stats.waits) == (4, 3, 2, 7)
+    assert (stats.wait_seconds, stats.timeouts) == (1.5, 1)
+    lines = connection_metrics.render_metrics()
+    assert 'db_pool_in_use{alias="default",mode="pool"} 3' in lines
+    assert 'db_pool_wait_seconds_total{alias="default",mode="pool"} 1.500000' in lines
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_connections(metrics_client):
+    body = metrics_client.get("/metrics").content.decode()
+
+    assert "# TYPE db_connections_opened_total counter" in body
+    assert 'db_connections_opened_total{alias="default",mode="per-request"}' in body
+    assert "db_pool_in_use" not in body
@@ -0,0 +1,139 @@
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.services import BookingService
+from apps.common.event_bus import BOOKING_CONFIRMED, OUTBOX, event_bus
+from apps.common.models import OutboxEvent
+from apps.common.outbox import OutboxDispatcher
+
+
+@pytest.fixture
+def outbox_bus():
+    event_bus.clear()
+    event_bus.mode = OUTBOX
+    yield event_bus
+    event_bus.mode = None
+    event_bus.clear()
+
+
+@pytest.mark.django_db
+def test_publish_defers_handlers_to_dispatcher(outbox_bus, booking):
+    received = []
+    outbox_bus.subscribe(BOOKING_CONFIRMED, received.append)
+
+    BookingService().confirm_booking(booking)
+
+    assert received == []
+    event = OutboxEvent.objects.get()
+    assert event.event_name == BOOKING_CONFIRMED
+    assert event.aggregate_id == str(booking.id)
+
+    assert OutboxDispatcher(workers=1, handler_timeout=0).run_once() == 1
+    assert [item.status for item in received] == [Booking.Status.CONFIRMED]
+    event.refresh_from_db()
+    assert event.status == OutboxEvent.Status.DONE
+    assert event.processed_at is not None
+
+
+@pytest.mark.django_db
+def test_dispatcher_preserves_order_per_aggregate(outbox_bus, booking):
+    received = []
+    outbox_bus.subscribe("First", lambda payload: received.append("first"))
+    outbox_bus.subscribe("Second", lambda payload: received.append("second"))
+    outbox_bus.publish("First", booking)
+    outbox_bus.publish("Second", booking)
+    dispatcher = OutboxDispatcher(workers=1, handler_timeout=0)
+
+    assert [event.event_name for event in dispatcher.claim()] == ["First"]
+    assert dispatcher.claim() == []
+
+    # An expired lease makes a claimed-but-unfinished event claimable again.
+    OutboxEvent.objects.filter(event_name="First").update(
+        available_at=timezone.now() - timedelta(seconds=1)
+    )
+    assert dispatcher.run_once() == 1
+    assert dispatcher.run_once() == 1
+    assert received == ["first", "second"]
+
+
+@pytest.mark.django_db
+def test_rows_claimed_by_another_dispatcher_are_skipped(outbox_bus):
+    for idx in range(3):
+        outbox_bus.publish("Ping", {"n": idx}, aggregate_id=f"agg-{idx}")
+    rival = OutboxEvent.objects.get(aggregate_id="agg-1")
+    raced = []
+
+    def rival_claims_after_read(execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        if not raced and sql.lstrip().upper().startswith("SELECT"):
+            # Another dispatcher claims a row between our read and our update.
+            raced.append(True)
+            OutboxEvent.objects.filter(id=rival.id).update(
+                status=OutboxEvent.Status.PROCESSING,
+                available_at=timezone.now() + timedelta(minutes=5),
+            )
+        return result
+
+    with connection.execute_wrapper(rival_claims_after_read):
+        claimed = OutboxDispatcher(workers=1, handler_timeout=0).claim()
+
+    assert raced
+    assert [event.aggregate_id for event in claimed] == ["agg-0", "agg-2"]
+
+
+@pytest.mark.django_db
+def test_failing_handler_is_retried_then_failed(outbox_bus, booking):
+    def broken(payload):
+        raise RuntimeError("boom")
+
+    outbox_bus.subscribe(BOOKING_CONFIRMED, broken)
+    outbox_bus.publish(BOOKING_CONFIRMED, booking)
+    dispatcher = OutboxDispatcher(workers=1, handler_timeout=0, max_attempts=2)
+
+    dispatcher.run_once()
+    event = OutboxEvent.objects.get()
+    assert event.status == OutboxEvent.Status.PENDING
+    assert event.attempts == 1
+    assert event.available_at > timezone.now()
+    assert "boom" in event.last_error
+
+    OutboxEvent.objects.update(available_at=timezone.now() - timedelta(seconds=1))
+    dispatcher.run_once()
+    event.refresh_from_db()
+    assert event.status == OutboxEvent.Status.FAILED
+    assert event.attempts == 2
+
+
+@pytest.mark.django_db
+def test_slow_handler_times_out(outbox_bus):
+    outbox_bus.subscribe("Slow", lambda payload: time.sleep(0.5))
+    outbox_bus.publish("Slow", {"id": 1}, aggregate_id="slow")
+    dispatcher = OutboxDispatcher(workers=1, handler_timeout=0.05)
+
+    try:
+        dispatcher.run_once()
+    finally:
+        dispatcher.close()
+
+    event = OutboxEvent.objects.get()
+    assert event.status == OutboxEvent.Status.PENDING
+    assert "TimeoutError" in event.last_error
+
+
+@pytest.mark.django_db
+def test_run_event_workers_once(outbox_bus):
+    received = []
+    outbox_bus.subscribe("Ping", received.append)
+    for idx in range(3):
+        outbox_bus.publish("Ping", {"n": idx}, aggregate_id=f"agg-{idx}")
+
+    call_command("run_event_workers", "--once", "--workers", "1", "--handler-timeout", "0")
+
+    assert sorted(item["n"] for item in received) == [0, 1, 2]
+    assert not OutboxEvent.objects.exclude(status=OutboxEvent.Status.DONE).exists()
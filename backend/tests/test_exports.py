@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.bookings.models import Fine
+from apps.bookings.services import BookingService
+
+
+def window(booking):
+    return {
+        "from": booking.start_date.isoformat(),
+        "to": (booking.start_date + timedelta(days=30)).isoformat(),
+    }
+
+
+@pytest.mark.django_db
+def test_booking_export_streams_csv_with_invoice_and_fines(booking, manager_client):
+    service = BookingService()
+    service.apply_fine(booking, Fine.FineType.DAMAGE, Decimal("50.00"))
+    service.apply_fine(booking, Fine.FineType.CLEANING, Decimal("15.00"))
+    service.build_invoice(booking)
+
+    response = manager_client.get(
+        "/api/reports/exports/bookings/", window(booking), HTTP_ACCEPT="text/csv"
+    )
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(booking.id)
+    assert rows[0]["customer"] == "customer"
+    assert rows[0]["invoice_total"] == "165.00"
+    assert rows[0]["fines_count"] == "2"
+    assert Decimal(rows[0]["fines_total"]) == Decimal("65.00")
+
+
+@pytest.mark.django_db
+def test_fine_export_streams_ndjson(booking, manager_client, django_assert_num_queries):
+    service = BookingService()
+    for amount in ("10.00", "20.00", "30.00"):
+        service.apply_fine(booking, Fine.FineType.OTHER, Decimal(amount))
+
+    response = manager_client.get(
+        "/api/reports/exports/fines/", {**window(booking), "output": "ndjson"}
+    )
+    with django_assert_num_queries(1):
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert sorted(json.loads(line)["amount"] for line in lines) == ["10.00", "20.00", "30.00"]
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_dataset_and_format(booking, manager_client, customer_user):
+    assert manager_client.get("/api/reports/exports/cars/").status_code == 404
+    assert (
+        manager_client.get("/api/reports/exports/bookings/", {"output": "xml"}).status_code == 400
+    )
+    client = APIClient()
+    client.force_authenticate(customer_user)
+    assert client.get("/api/reports/exports/bookings/").status_code == 403
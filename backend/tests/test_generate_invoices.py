@@ -0,0 +1,98 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.bookings.invoice_batch import InvoiceBatch, completed_booking_ids, generate_invoices
+from apps.bookings.invoice_builder import InvoiceBuilder
+from apps.bookings.models import Booking, Fine, Invoice
+from apps.pricing.services import PricingService
+
+SINCE = date(2020, 3, 1)
+
+
+@pytest.fixture
+def history():
+    call_command("seed_bulk", cars=4, customers=3, bookings=60, seed=5, end=date(2020, 6, 30))
+    return completed_booking_ids(SINCE)
+
+
+@pytest.mark.django_db
+def test_generate_invoices_prices_completed_bookings_since_date(history):
+    summary = generate_invoices(SINCE, chunk_size=7)
+
+    assert summary.bookings == summary.created == len(history) > 0
+    assert Invoice.objects.count() == len(history)
+    assert not Invoice.objects.filter(booking__end_date__lt=SINCE).exists()
+    pricing = PricingService()
+    for invoice in Invoice.objects.select_related("booking__car")[:5]:
+        booking = invoice.booking
+        assert booking.status == Booking.Status.COMPLETED
+        quote = pricing.quote(booking.car, booking.start_date, booking.end_date)
+        assert invoice.total == Decimal(quote["total"])
+
+
+@pytest.mark.django_db
+def test_rerun_only_writes_changed_invoices(history):
+    generate_invoices(SINCE)
+    booking = Booking.objects.get(pk=history[0])
+    Fine.objects.create(booking=booking, type=Fine.FineType.LATE_RETURN, amount=Decimal("25.00"))
+
+    summary = generate_invoices(SINCE)
+
+    assert (summary.created, summary.updated) == (0, 1)
+    assert summary.unchanged == len(history) - 1
+    invoice = Invoice.objects.get(booking=booking)
+    assert invoice.breakdown[-1]["label"] == "Fine: Late Return"
+
+
+@pytest.mark.django_db
+def test_invoices_paid_while_the_batch_runs_are_not_rewritten(history, monkeypatch):
+    generate_invoices(SINCE)
+    for pk in history[:2]:
+        booking = Booking.objects.get(pk=pk)
+        Fine.objects.create(booking=booking, type=Fine.FineType.DAMAGE, amount=Decimal("40.00"))
+    paid = Invoice.objects.get(booking_id=history[0])
+    stage = InvoiceBuilder.stage
+
+    def stage_then_pay(builder):
+        staged = stage(builder)
+        if builder.booking.pk == paid.booking_id:
+            # A payment lands after the batch read the invoice but before it writes.
+            Invoice.objects.filter(pk=paid.pk).update(paid_at=timezone.now())
+        return staged
+
+    monkeypatch.setattr(InvoiceBuilder, "stage", stage_then_pay)
+    summary = generate_invoices(SINCE)
+
+    assert (summary.updated, summary.unchanged) == (1, len(history) - 1)
+    stored = Invoice.objects.get(pk=paid.pk)
+    assert (stored.total, stored.content_hash) == (paid.total, paid.content_hash)
+    assert Invoice.objects.get(booking_id=history[1]).breakdown[-1]["label"] == "Fine: Damage"
+
+
+@pytest.mark.django_db
+def test_chunk_query_count_does_not_grow_with_chunk_size(history, settings):
+    settings.EVENT_BUS_MODE = "outbox"
+    batch = InvoiceBatch(SINCE)
+
+    def queries(ids):
+        with CaptureQueriesContext(connection) as ctx:
+            batch.process(ids)
+        return len(ctx.captured_queries)
+
+    assert queries(history[:3]) == queries(history[3:20])
+
+
+@pytest.mark.django_db
+def test_command_reports_throughput_and_rejects_pool_on_sqlite(history, capsys):
+    call_command("generate_invoices", since=SINCE, chunk_size=10)
+
+    assert f"Processed {len(history)} bookings" in capsys.readouterr().out
+    with pytest.raises(CommandError):
+        call_command("generate_invoices", since=SINCE, workers=2)
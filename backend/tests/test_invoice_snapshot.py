@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.bookings.invoice_builder import InvoiceBuilder, content_hash
+from apps.bookings.models import Fine, Invoice
+from apps.bookings.services import BookingService
+from apps.common.event_bus import INVOICE_ISSUED, event_bus
+from apps.payments.services import PaymentService
+from apps.pricing.services import PricingService
+
+
+class CountingPricing(PricingService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def quote(self, car, start_date, end_date) -> dict:
+        self.calls += 1
+        return super().quote(car, start_date, end_date)
+
+
+@pytest.fixture
+def issued():
+    invoices: list = []
+    event_bus.subscribe(INVOICE_ISSUED, invoices.append)
+    return invoices
+
+
+@pytest.mark.django_db
+def test_confirmation_snapshots_priced_invoice(booking, issued):
+    BookingService().confirm_booking(booking)
+
+    invoice = Invoice.objects.get(booking=booking)
+    assert invoice.total == Decimal("100.00")
+    assert invoice.content_hash == content_hash(invoice.breakdown)
+    assert issued == [invoice]
+
+
+@pytest.mark.django_db
+def test_fines_are_appended_once_and_rebuild_does_not_reprice(booking, issued):
+    pricing = CountingPricing()
+    service = BookingService(pricing_service=pricing)
+    service.confirm_booking(booking)
+    fine = service.apply_fine(booking, Fine.FineType.DAMAGE, Decimal("50.00"))
+    service.append_fine(fine)  # a replayed FineApplied event
+
+    invoice = Invoice.objects.get(booking=booking)
+    assert invoice.total == Decimal("150.00")
+    assert [item["metadata"].get("fine_id") for item in invoice.breakdown][-1] == str(fine.id)
+    assert len(invoice.breakdown) == 2
+
+    rebuilt = service.build_invoice(booking)["invoice"]
+    assert rebuilt.total == Decimal("150.00")
+    assert pricing.calls == 0  # priced once, by the confirmation handler
+    assert len(issued) == 2
+
+
+@pytest.mark.django_db
+def test_build_skips_write_when_breakdown_is_unchanged(booking):
+    BookingService().confirm_booking(booking)
+    invoice = Invoice.objects.get(booking=booking)
+    builder = InvoiceBuilder(booking, invoice)
+    builder.add_items(invoice.breakdown)
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert builder.build() == invoice
+
+    assert ctx.captured_queries == []
+    assert builder.changed is False
+    assert Invoice.objects.get(pk=invoice.pk).updated_at == invoice.updated_at
+
+
+@pytest.mark.django_db
+def test_paying_a_confirmed_booking_reuses_the_snapshot(booking, customer_user):
+    BookingService().confirm_booking(booking)
+    client = APIClient()
+    client.force_authenticate(customer_user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.post(f"/api/bookings/{booking.id}/invoice/pay/", {"method": "card"})
+
+    assert response.status_code == 200
+    assert not any("INSERT" in query["sql"] for query in ctx.captured_queries)
+    assert Invoice.objects.get(booking=booking).paid_at is not None
+
+
+@pytest.mark.django_db
+def test_fines_after_payment_leave_the_paid_invoice_alone(booking, issued):
+    service = BookingService()
+    service.confirm_booking(booking)
+    invoice = PaymentService().pay_invoice(Invoice.objects.get(booking=booking), "card")
+
+    fine = service.apply_fine(booking, Fine.FineType.DAMAGE, Decimal("50.00"))
+
+    assert service.build_invoice(booking)["invoice"].total == Decimal("100.00")
+    stored = Invoice.objects.get(booking=booking)
+    assert (stored.total, stored.content_hash) == (invoice.total, invoice.content_hash)
+    assert str(fine.id) not in {item["metadata"].get("fine_id") for item in stored.breakdown}
+    assert issued == [invoice]
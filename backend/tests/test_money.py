@@ -0,0 +1,139 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from apps.pricing.money import ZERO, Money, from_cents, to_cents
+from apps.pricing.rule_cache import RuleSet
+from apps.pricing.services import PricingService
+from apps.pricing.strategies import DepreciationRule, DurationRule, SeasonalRule, to_decimal
+
+from pricing_samples import RULE_SETS, random_fleet, random_ranges
+
+
+def random_amount(rng: random.Random) -> Decimal:
+    # Up to four decimal places so that half-cent ties (x.xx5, x.xx50) come up often.
+    places = rng.randint(0, 4)
+    return Decimal(rng.randint(-(10**8), 10**8)).scaleb(-places)
+
+
+def decimal_quote(rule_set: RuleSet, car, start: date, end: date) -> dict:
+    # The Decimal pricing path the Money strategies replaced.
+    days = max((end - start).days, 1)
+    items = []
+    total = Decimal("0.00")
+
+    def add(name, amount, metadata):
+        nonlocal total
+        amount = to_decimal(amount)
+        items.append({"name": name, "amount": amount, "metadata": metadata})
+        total += amount
+
+    add("Base price", to_decimal(car.base_price_per_day) * days, {"days": days})
+    rate = Decimal("0.00")
+    for rule in rule_set.duration:
+        if days >= rule.min_days:
+            rate = max(rate, rule.discount_rate)
+    if not rule_set.duration and days >= 7:
+        rate = Decimal("0.10")
+    if rate > 0:
+        add("Duration discount", -(total * rate), {"rate": float(rate)})
+    if rule_set.depreciation:
+        rate = rule_set.depreciation[0].rate
+    else:
+        rate = min(Decimal("0.01") * max(date.today().year - car.year, 0), Decimal("0.20"))
+    if rate > 0:
+        add("Year depreciation", -(total * rate), {"rate": float(rate)})
+    for rule in rule_set.seasonal:
+        if start.month not in rule.months:
+            continue
+        adjustment = total * (rule.multiplier - 1)
+        if adjustment != 0:
+            add(
+                rule.name or "Seasonal adjustment",
+                adjustment,
+                {"multiplier": float(rule.multiplier)},
+            )
+    return {"total": to_decimal(total), "breakdown": items}
+
+
+def test_to_cents_rounds_like_decimal_quantize():
+    rng = random.Random("to_cents")
+    for _ in range(5000):
+        amount = random_amount(rng)
+        expected = to_decimal(amount)
+        for value in (amount, str(amount), float(amount)):
+            assert from_cents(to_cents(value)) == to_decimal(value)
+        assert from_cents(to_cents(amount)) == expected
+        assert str(Money.of(amount)) == str(expected)
+    for value in (0, 7, -3, 10**9):
+        assert Money.of(value).to_decimal() == to_decimal(value)
+
+
+def test_times_rate_matches_decimal_multiplication():
+    rng = random.Random("times_rate")
+    for _ in range(5000):
+        total = to_decimal(random_amount(rng))
+        rate = Decimal(rng.randint(-100, 300)).scaleb(-2)
+        money = Money.of(total).times_rate(to_cents(rate))
+        assert money.to_decimal() == to_decimal(total * rate)
+
+
+def test_money_arithmetic_matches_decimal():
+    rng = random.Random("arithmetic")
+    for _ in range(1000):
+        amounts = [to_decimal(random_amount(rng)) for _ in range(rng.randint(0, 8))]
+        days = rng.randint(0, 60)
+        assert sum(map(Money.of, amounts), ZERO).to_decimal() == sum(amounts, Decimal("0.00"))
+        # Decimal can produce a signed zero ("-0.00"); it compares equal to Money's 0.00.
+        assert (sum(map(Money.of, amounts), ZERO) * days).to_decimal() == (
+            sum(amounts, Decimal("0.00")) * days
+        )
+    assert Money.of("1.00") - Money.of("1.01") == -Money(1)
+    assert sorted([Money(3), Money(-2), ZERO]) == [Money(-2), ZERO, Money(3)]
+    assert not ZERO and Money(1)
+    assert Money.of(Money(5)) == Money(5)
+    assert sum([Money(5), Money(7)]) == Money(12)
+
+
+@pytest.mark.parametrize("rule_set_name", sorted(RULE_SETS))
+def test_quote_matches_decimal_pricing(rule_set_name):
+    rule_set = RULE_SETS[rule_set_name]
+    rng = random.Random(f"money-{rule_set_name}")
+    service = PricingService(strategies=PricingService.build_strategies(rule_set))
+
+    for car in random_fleet(rng, 40):
+        for start, end in random_ranges(rng, 25):
+            assert service.quote(car, start, end) == decimal_quote(rule_set, car, start, end)
+
+
+def test_quote_matches_decimal_pricing_for_random_rules():
+    rng = random.Random("random-rules")
+    for index in range(50):
+        rule_set = RuleSet(
+            version=index,
+            duration=tuple(
+                DurationRule(
+                    min_days=rng.randint(1, 21), discount_rate=Decimal(rng.randint(0, 40)) / 100
+                )
+                for _ in range(rng.randint(0, 3))
+            ),
+            depreciation=tuple(
+                DepreciationRule(rate=Decimal(rng.randint(0, 25)) / 100)
+                for _ in range(rng.randint(0, 1))
+            ),
+            seasonal=tuple(
+                SeasonalRule(
+                    name=f"rule-{n}",
+                    months=frozenset(rng.sample(range(1, 13), 3)),
+                    multiplier=Decimal(rng.randint(50, 200)) / 100,
+                )
+                for n in range(rng.randint(0, 3))
+            ),
+        )
+        service = PricingService(strategies=PricingService.build_strategies(rule_set))
+        for car in random_fleet(rng, 5):
+            start = date(2025, 1, 1) + timedelta(days=rng.randint(0, 364))
+            end = start + timedelta(days=rng.randint(1, 40))
+            assert service.quote(car, start, end) == decimal_quote(rule_set, car, start, end)
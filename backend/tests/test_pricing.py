@@ -1,9 +1,12 @@
 from datetime import date, timedelta
 from decimal import Decimal
+from uuid import uuid4
 
 import pytest
+from django.db.models import F
 
-from apps.pricing.models import PricingRule
+from apps.pricing.models import PricingRule, PricingRulesVersion
+from apps.pricing.rule_cache import PricingRuleCache
 from apps.pricing.services import PricingService
 
 
@@ -25,3 +28,125 @@ def test_pricing_breakdown_total_with_seasonal(car):
     assert quote["total"] == Decimal("360.00")
     assert sum(item["amount"] for item in quote["breakdown"]) == Decimal("360.00")
     assert {item["name"] for item in quote["breakdown"]} == {"Base price", "Summer uplift"}
+
+
+@pytest.mark.django_db
+def test_rule_cache_serves_quotes_without_queries(car, django_assert_num_queries):
+    PricingRule.objects.create(
+        name="Winter uplift",
+        strategy_type=PricingRule.StrategyType.SEASONAL,
+        params={"months": [1], "multiplier": 1.5},
+        active=True,
+    )
+    start = date(2025, 1, 10)
+    end = start + timedelta(days=2)
+    assert PricingService().quote(car, start, end)["total"] == Decimal("300.00")
+
+    with django_assert_num_queries(0):
+        assert PricingService().quote(car, start, end)["total"] == Decimal("300.00")
+
+
+@pytest.mark.django_db
+def test_rule_cache_invalidated_on_save_and_delete(car):
+    rule = PricingRule.objects.create(
+        name="Winter uplift",
+        strategy_type=PricingRule.StrategyType.SEASONAL,
+        params={"months": [1], "multiplier": 1.5},
+        active=True,
+    )
+    start = date(2025, 1, 10)
+    end = start + timedelta(days=2)
+    assert PricingService().quote(car, start, end)["total"] == Decimal("300.00")
+
+    rule.params = {"months": [1], "multiplier": 2}
+    rule.save()
+    assert PricingService().quote(car, start, end)["total"] == Decimal("400.00")
+
+    rule.delete()
+    assert PricingService().quote(car, start, end)["total"] == Decimal("200.00")
+
+
+def winter_uplift(multiplier) -> PricingRule:
+    return PricingRule.objects.create(
+        name="Winter uplift",
+        strategy_type=PricingRule.StrategyType.SEASONAL,
+        params={"months": [1], "multiplier": multiplier},
+        active=True,
+    )
+
+
+@pytest.mark.django_db
+def test_rule_cache_reloads_when_another_process_bumps_the_version():
+    rule = winter_uplift(1.5)
+    rules = PricingRuleCache(check_interval=0, max_age=3600)
+    loaded = rules.get()
+    assert loaded.seasonal[0].multiplier == Decimal("1.50")
+
+    # Another worker changes the rule and bumps the version row; no signal reaches this one.
+    PricingRule.objects.filter(pk=rule.pk).update(params={"months": [1], "multiplier": 2})
+    assert rules.get() is loaded
+    PricingRulesVersion.objects.update(version=F("version") + 1)
+
+    reloaded = rules.get()
+    assert reloaded.version == loaded.version + 1
+    assert reloaded.seasonal[0].multiplier == Decimal("2.00")
+
+
+@pytest.mark.django_db
+def test_rule_cache_reloads_after_max_age_without_a_bump():
+    rule = winter_uplift(1.5)
+    rules = PricingRuleCache(check_interval=0, max_age=0)
+    assert rules.get().seasonal[0].multiplier == Decimal("1.50")
+
+    PricingRule.objects.filter(pk=rule.pk).update(params={"months": [1], "multiplier": 2})
+
+    assert rules.get().seasonal[0].multiplier == Decimal("2.00")
+
+
+@pytest.mark.django_db
+def test_quote_many_matches_single_quotes_in_one_query(car, django_assert_num_queries):
+    from apps.cars.models import Car
+
+    other = Car.objects.create(
+        make="Other",
+        model="Car",
+        year=date.today().year - 3,
+        vin="VIN0000000000OTHR",
+        type="suv",
+        base_price_per_day=Decimal("80.00"),
+    )
+    ranges = [(date(2025, 3, 1), date(2025, 3, 4)), (date(2025, 3, 1), date(2025, 3, 10))]
+    service = PricingService()
+
+    with django_assert_num_queries(1):
+        quotes = service.quote_many([car.id, str(other.id)], ranges)
+
+    assert len(quotes) == 4
+    for target in (car, other):
+        for start, end in ranges:
+            assert quotes[(target.id, start, end)] == service.quote(target, start, end)
+
+
+@pytest.mark.django_db
+def test_batch_quote_endpoint(car, customer_user):
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    client.force_authenticate(customer_user)
+    response = client.post(
+        "/api/pricing/quote/batch/",
+        {"cars": [str(car.id)], "ranges": [{"start": "2025-03-01", "end": "2025-03-03"}]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    [quote] = response.data["quotes"]
+    assert quote["car"] == car.id
+    assert quote["total"] == Decimal("200.00")
+
+    response = client.post(
+        "/api/pricing/quote/batch/",
+        {"cars": [str(uuid4())], "ranges": [{"start": "2025-03-01", "end": "2025-03-03"}]},
+        format="json",
+    )
+    assert response.status_code == 404
@@ -0,0 +1,55 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from apps.pricing.engine import FleetPricingEngine
+from apps.pricing.rule_cache import RuleSet
+from apps.pricing.services import PricingService
+from apps.pricing.strategies import DepreciationRule, DurationRule
+
+from pricing_samples import RULE_SETS, make_car, random_fleet, random_ranges
+
+
+@pytest.mark.parametrize("rule_set_name", sorted(RULE_SETS))
+def test_engine_matches_pricing_service(rule_set_name):
+    rule_set = RULE_SETS[rule_set_name]
+    rng = random.Random(rule_set_name)
+    cars = random_fleet(rng, 40)
+    ranges = random_ranges(rng, 60)
+    service = PricingService(strategies=PricingService.build_strategies(rule_set))
+
+    table = FleetPricingEngine(rule_set).price(cars, ranges)
+
+    assert len(table) == len(cars) * len(ranges)
+    for car in cars:
+        for start, end in ranges:
+            expected = service.quote(car, start, end)
+            assert table.quote(car.id, start, end) == expected
+            assert table.total(car.id, start, end) == expected["total"]
+
+
+def test_engine_rounds_half_up_like_decimal_path():
+    rule_set = RuleSet(
+        version=0,
+        duration=(DurationRule(min_days=1, discount_rate=Decimal("0.05")),),
+        depreciation=(DepreciationRule(rate=Decimal("0.00")),),
+    )
+    car = make_car("10.10", 2020)
+    start = date(2025, 4, 1)
+    service = PricingService(strategies=PricingService.build_strategies(rule_set))
+
+    table = FleetPricingEngine(rule_set).price([car], [(start, start + timedelta(days=1))])
+
+    assert table.quote(car.id, start, start + timedelta(days=1)) == service.quote(
+        car, start, start + timedelta(days=1)
+    )
+    assert table.total(car.id, start, start + timedelta(days=1)) == Decimal("9.59")
+
+
+def test_engine_rejects_invalid_ranges():
+    with pytest.raises(ValueError):
+        FleetPricingEngine(RuleSet(version=0)).price(
+            [make_car("10.00", 2020)], [(date(2025, 1, 2), date(2025, 1, 2))]
+        )
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from apps.pricing.models import PricingRule
+from apps.pricing.quote_cache import QuoteCache, quote_cache
+from apps.pricing.rule_cache import RuleSet
+from apps.pricing.services import PricingService
+
+START = date(2025, 3, 1)
+END = START + timedelta(days=2)
+
+
+@pytest.mark.django_db
+def test_repeated_quotes_are_served_from_cache(car, django_assert_num_queries):
+    first = PricingService().quote(car, START, END)
+    first["breakdown"][0]["metadata"]["days"] = 99
+
+    with django_assert_num_queries(0):
+        second = PricingService().quote(car, START, END)
+
+    assert second["total"] == Decimal("200.00")
+    assert second["breakdown"][0]["metadata"] == {"days": 2}
+    stats = quote_cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_ratio == 0.5
+
+
+@pytest.mark.django_db
+def test_car_price_change_is_a_new_key(car):
+    assert PricingService().quote(car, START, END)["total"] == Decimal("200.00")
+
+    car.base_price_per_day = Decimal("120.00")
+    car.save()
+
+    assert PricingService().quote(car, START, END)["total"] == Decimal("240.00")
+    assert quote_cache.stats().misses == 2
+
+
+@pytest.mark.django_db
+def test_rule_change_clears_local_quotes(car):
+    PricingService().quote(car, START, END)
+    assert quote_cache.stats().size == 1
+
+    PricingRule.objects.create(
+        name="Spring uplift",
+        strategy_type=PricingRule.StrategyType.SEASONAL,
+        params={"months": [3], "multiplier": 1.5},
+        active=True,
+    )
+
+    assert quote_cache.stats().size == 0
+    assert PricingService().quote(car, START, END)["total"] == Decimal("300.00")
+
+
+@pytest.mark.django_db
+def test_lru_is_bounded_and_entries_expire(car):
+    cache = QuoteCache(max_entries=2, timeout=300)
+    service = PricingService(quote_cache=cache)
+    for offset in range(3):
+        service.quote(car, START + timedelta(days=offset), END + timedelta(days=offset))
+    service.quote(car, START + timedelta(days=2), END + timedelta(days=2))
+
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits, stats.misses) == (2, 1, 1, 3)
+
+    expired = QuoteCache(max_entries=10, timeout=0)
+    service = PricingService(quote_cache=expired)
+    service.quote(car, START, END)
+    service.quote(car, START, END)
+    assert expired.stats().misses == 2
+
+
+@pytest.mark.django_db
+def test_shared_backend_serves_other_processes(car):
+    PricingService(quote_cache=QuoteCache(shared=True)).quote(car, START, END)
+
+    other = QuoteCache(shared=True)
+    quote = PricingService(quote_cache=other).quote(car, START, END)
+
+    assert quote["total"] == Decimal("200.00")
+    assert (other.stats().shared_hits, other.stats().misses) == (1, 0)
+
+
+@pytest.mark.django_db
+def test_quotes_bypass_cache_when_disabled_or_with_custom_strategies(car, settings):
+    PricingService(strategies=PricingService.build_strategies(RuleSet(version=0))).quote(
+        car, START, END
+    )
+    settings.PRICING_QUOTE_CACHE_SIZE = 0
+    PricingService().quote(car, START, END)
+
+    assert quote_cache.stats() == quote_cache.stats().__class__()
+
+
+@pytest.mark.django_db
+def test_cache_counters_are_exported(car, metrics_client):
+    PricingService().quote(car, START, END)
+    PricingService().quote(car, START, END)
+
+    body = metrics_client.get("/metrics").content.decode()
+
+    assert 'pricing_quote_cache_hits_total{layer="local"} 1' in body
+    assert "pricing_quote_cache_misses_total 1" in body
+    assert "pricing_quote_cache_entries 1" in body
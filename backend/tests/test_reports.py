@@ -0,0 +1,112 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.bookings.handlers import register as register_bookings
+from apps.bookings.models import Fine
+from apps.bookings.services import BookingService
+from apps.common.event_bus import event_bus
+from apps.reports.handlers import register
+from apps.reports.models import DailyRollup, ReportContribution
+from apps.reports.rollups import rebuild_rollups
+
+
+@pytest.fixture(autouse=True)
+def report_handlers():
+    event_bus.clear()
+    register_bookings(event_bus)
+    register(event_bus)
+    yield
+
+
+def rollup_snapshot():
+    return sorted(
+        DailyRollup.objects.values_list(
+            "day",
+            "car_id",
+            "booked_days",
+            "bookings_started",
+            "revenue",
+            "invoices",
+            "fines_total",
+            "fines_count",
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_rollups_follow_booking_events_and_match_backfill(booking, customer_user, car):
+    service = BookingService()
+    service.confirm_booking(booking)
+    service.apply_fine(booking, Fine.FineType.DAMAGE, Decimal("50.00"))
+    service.build_invoice(booking)
+    service.build_invoice(booking)
+
+    later = service.create_booking(
+        customer_user, car, booking.end_date, booking.end_date + timedelta(days=2)
+    )
+    service.confirm_booking(later)
+    service.cancel_booking(later)
+
+    assert DailyRollup.objects.filter(booked_days__gt=0).count() == 1
+    rollup = DailyRollup.objects.get(day=booking.start_date, car=car)
+    assert rollup.bookings_started == 1
+    assert rollup.revenue == Decimal("150.00")
+    assert rollup.invoices == 1
+    assert ReportContribution.objects.count() == 3
+
+    incremental = rollup_snapshot()
+    rebuild_rollups()
+    assert [row for row in rollup_snapshot() if any(row[2:])] == [
+        row for row in incremental if any(row[2:])
+    ]
+
+
+@pytest.mark.django_db
+def test_report_endpoints(booking, manager_client):
+    service = BookingService()
+    service.confirm_booking(booking)
+    service.apply_fine(booking, Fine.FineType.CLEANING, Decimal("20.00"))
+    service.build_invoice(booking)
+    window = {
+        "from": booking.start_date.replace(day=1).isoformat(),
+        "to": (booking.start_date.replace(day=1) + timedelta(days=40)).isoformat(),
+    }
+
+    utilization = manager_client.get("/api/reports/utilization/", window)
+    assert utilization.status_code == 200
+    assert utilization.data["fleet_size"] == 1
+    assert utilization.data["booked_days"] == 1
+
+    revenue = manager_client.get("/api/reports/revenue/", {**window, "group_by": "type"})
+    assert revenue.status_code == 200
+    assert revenue.data["rows"][0]["type"] == "sedan"
+    assert revenue.data["total"] == Decimal("120.00")
+
+    fines = manager_client.get("/api/reports/fines/", window)
+    assert fines.data["total"] == Decimal("20.00")
+    assert fines.data["count"] == 1
+
+    assert manager_client.get("/api/reports/revenue/", {"group_by": "bogus"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_reports_require_manager(customer_user):
+    client = APIClient()
+    client.force_authenticate(customer_user)
+    assert client.get("/api/reports/utilization/").status_code == 403
+
+
+@pytest.mark.django_db
+def test_canceling_drops_unpaid_invoice_revenue(booking, car):
+    service = BookingService()
+    service.confirm_booking(booking)
+    assert DailyRollup.objects.get(day=booking.start_date, car=car).revenue == Decimal("100.00")
+
+    service.cancel_booking(booking)
+
+    rollup = DailyRollup.objects.get(day=booking.start_date, car=car)
+    assert (rollup.revenue, rollup.invoices) == (Decimal("0.00"), 0)
+    assert not ReportContribution.objects.exists()
@@ -0,0 +1,69 @@
+import pytest
+from rest_framework.test import APIClient
+
+from apps.common.event_bus import event_bus
+from apps.common.metrics import metrics
+from apps.reports.handlers import register
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    register(event_bus)
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.django_db
+def test_responses_carry_server_timing(booking, manager_client):
+    response = manager_client.get(f"/api/bookings/{booking.id}/")
+
+    assert response.status_code == 200
+    timing = response["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="' in timing and "render;dur=" in timing and "total;dur=" in timing
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_per_view_totals(booking, manager_client, metrics_client):
+    manager_client.get(f"/api/bookings/{booking.id}/quote/")
+    manager_client.get(f"/api/bookings/{booking.id}/quote/")
+
+    response = metrics_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    body = response.content.decode()
+    assert "# TYPE http_request_queries_total counter" in body
+    assert 'http_requests_total{endpoint="BookingViewSet.pricing_quote",method="GET"} 2' in body
+    totals = metrics.snapshot()[("BookingViewSet.pricing_quote", "GET")]
+    assert totals.queries > 0
+    assert totals.sql_seconds > 0
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_closed_by_default(manager_client, settings):
+    anonymous = APIClient().get("/metrics")
+    assert anonymous.status_code == 401
+    assert anonymous["WWW-Authenticate"] == 'Bearer realm="metrics"'
+    assert manager_client.get("/metrics").status_code == 401
+
+    settings.METRICS_TOKEN = "right"
+    wrong = APIClient()
+    wrong.credentials(HTTP_AUTHORIZATION="Bearer wrong")
+    assert wrong.get("/metrics").status_code == 401
+
+    settings.METRICS_ALLOWED_IPS = ["127.0.0.1"]
+    assert APIClient().get("/metrics").status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.query_budget(20)
+def test_booking_lifecycle_stays_within_query_budgets(booking, manager_client, query_budgets):
+    base = f"/api/bookings/{booking.id}"
+    for path in ("confirm", "checkin", "return"):
+        assert manager_client.post(f"{base}/{path}/").status_code == 200
+    assert manager_client.get(f"{base}/quote/").status_code == 200
+    assert manager_client.post(f"{base}/invoice/pay/", {"method": "card"}).status_code == 200
+
+    assert {endpoint for endpoint, _ in metrics.snapshot()} == set(query_budgets)
@@ -0,0 +1,136 @@
+import csv
+import io
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from apps.bookings.models import Booking
+from apps.cars.models import Car
+from apps.common.seeding import BulkSeeder
+from apps.reports.models import DailyRollup
+from apps.users.models import CustomerProfile, User
+
+OPTIONS = {"cars": 6, "customers": 15, "bookings": 100, "seed": 7, "end": date(2031, 6, 30)}
+
+
+def snapshot():
+    return sorted(
+        Booking.objects.values_list(
+            "id", "car__vin", "customer__username", "start_date", "end_date"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_seed_bulk_generates_requested_rows_without_overlaps():
+    call_command("seed_bulk", batch_size=32, **OPTIONS)
+
+    assert Car.objects.filter(vin__startswith="BULK-").count() == 6
+    assert User.objects.filter(username__startswith="bulk-customer-").count() == 15
+    assert CustomerProfile.objects.count() == 15
+    assert Booking.objects.count() == 100
+
+    by_car = defaultdict(list)
+    for car_id, start, end in Booking.objects.values_list("car_id", "start_date", "end_date"):
+        assert start < end <= date(2031, 6, 30)
+        by_car[car_id].append((start, end))
+    for intervals in by_car.values():
+        intervals.sort()
+        assert all(prev[1] <= nxt[0] for prev, nxt in zip(intervals, intervals[1:]))
+
+
+@pytest.mark.django_db
+def test_seed_bulk_is_deterministic_for_a_seed():
+    call_command("seed_bulk", **OPTIONS)
+    first = snapshot()
+
+    call_command("seed_bulk", purge=True, **OPTIONS)
+
+    assert snapshot() == first
+    call_command("seed_bulk", purge=True, **{**OPTIONS, "seed": 8})
+    assert snapshot() != first
+
+
+@pytest.mark.django_db
+def test_seed_bulk_rejects_bookings_without_cars():
+    with pytest.raises(CommandError):
+        call_command("seed_bulk", cars=0, customers=1, bookings=1)
+
+
+@pytest.mark.django_db
+def test_purge_leaves_runs_with_other_prefixes_alone():
+    small = {**OPTIONS, "bookings": 10}
+    call_command("seed_bulk", prefix="bulk", **small)
+    call_command("seed_bulk", prefix="bulk2", **{**small, "seed": 8})
+
+    call_command("seed_bulk", prefix="bulk", purge=True, **small)
+
+    assert Car.objects.filter(vin__startswith="BULK2-").count() == 6
+    assert Car.objects.count() == 12
+    assert Booking.objects.count() == 20
+
+
+@pytest.mark.parametrize(
+    "prefix, cars",
+    [("Bulk", 1), ("bulk-a", 1), ("", 1), ("abcdefghijklmno", 100), ("abcdefghijklmnop", 1)],
+)
+def test_seed_bulk_rejects_prefixes_that_could_collide(prefix, cars):
+    with pytest.raises(ValueError):
+        BulkSeeder(cars=cars, customers=1, bookings=0, prefix=prefix)
+
+
+@pytest.mark.django_db
+def test_seed_bulk_can_rebuild_report_rollups():
+    call_command(
+        "seed_bulk", cars=2, customers=2, bookings=10, end=date(2020, 1, 31), rebuild_reports=True
+    )
+
+    assert DailyRollup.objects.filter(booked_days__gt=0).exists()
+
+
+class StubCopyCursor:
+    # Records what BulkSeeder._write sends through psycopg's cursor.copy().
+    def __init__(self) -> None:
+        self.sql = None
+        self.data: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @contextmanager
+    def copy(self, sql: str):
+        self.sql = sql
+        yield self
+
+    def write(self, data: str) -> None:
+        self.data.append(data)
+
+
+def test_copy_writes_csv_rows_through_cursor_copy(monkeypatch):
+    cursor = StubCopyCursor()
+    monkeypatch.setattr(connection, "cursor", lambda: cursor)
+    car = Car(
+        make="Copy",
+        model="Path",
+        year=2024,
+        vin="COPY0000000000001",
+        type="sedan",
+        base_price_per_day="55.00",
+    )
+
+    BulkSeeder(cars=1, customers=1, bookings=0, use_copy=True)._write(Car, [car])
+
+    table = connection.ops.quote_name(Car._meta.db_table)
+    assert cursor.sql.startswith(f"COPY {table} (")
+    assert cursor.sql.endswith("FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+    [row] = list(csv.reader(io.StringIO("".join(cursor.data))))
+    assert len(row) == len(Car._meta.concrete_fields)
+    assert {car.id.hex, "Copy", "COPY0000000000001", "55.00"} <= set(row)
@@ -0,0 +1,112 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.users.authentication import token_state_cache
+from apps.users.models import CustomerProfile, User
+
+
+def login(username: str, password: str = "pass") -> dict:
+    response = APIClient().post(
+        "/api/auth/login/", {"username": username, "password": password}, format="json"
+    )
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+def bearer(access: str) -> APIClient:
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+    return client
+
+
+def user_queries(queries) -> list[str]:
+    return [query["sql"] for query in queries if '"users_user"' in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_access_token_carries_role_and_revision(manager_user):
+    token = AccessToken(login("manager")["access"])
+
+    assert (token["role"], token["username"], token["rev"]) == ("manager", "manager", 0)
+
+
+@pytest.mark.django_db
+def test_requests_skip_the_user_lookup(car, manager_user):
+    client = bearer(login("manager")["access"])
+    url = f"/api/pricing/quote/?car={car.id}&start=2025-03-01&end=2025-03-03"
+    assert client.get(url).status_code == 200
+
+    with CaptureQueriesContext(connection) as stateless:
+        assert client.get(url).status_code == 200
+        assert client.get("/api/bookings/").status_code == 200
+
+    legacy = bearer(str(RefreshToken.for_user(manager_user).access_token))
+    with CaptureQueriesContext(connection) as loaded:
+        assert legacy.get(url).status_code == 200
+
+    assert user_queries(stateless.captured_queries) == []
+    assert len(user_queries(loaded.captured_queries)) == 1
+
+
+@pytest.mark.django_db
+def test_role_change_revokes_tokens(manager_user):
+    tokens = login("manager")
+    client = bearer(tokens["access"])
+    assert client.get("/api/bookings/").status_code == 200
+
+    manager_user.role = User.Role.CUSTOMER
+    manager_user.save()
+
+    assert manager_user.token_revision == 1
+    assert client.get("/api/bookings/").status_code == 401
+    response = APIClient().post("/api/auth/refresh/", {"refresh": tokens["refresh"]})
+    assert response.status_code == 401
+    assert AccessToken(login("manager")["access"])["role"] == "customer"
+
+
+@pytest.mark.django_db
+def test_deactivation_and_password_change_revoke_tokens(customer_user):
+    client = bearer(login("customer")["access"])
+
+    customer_user.set_password("new-password")
+    customer_user.save(update_fields=["password"])
+    assert client.get("/api/bookings/").status_code == 401
+
+    client = bearer(login("customer", "new-password")["access"])
+    customer_user.is_active = False
+    customer_user.save()
+    assert client.get("/api/bookings/").status_code == 401
+
+
+@pytest.mark.django_db
+def test_profile_updates_keep_tokens_valid(customer_user):
+    CustomerProfile.objects.create(
+        user=customer_user, full_name="Cu Stomer", phone="1", driver_license_no="D1", address="A"
+    )
+    client = bearer(login("customer")["access"])
+
+    response = client.patch("/api/auth/me/", {"email": "c@example.com"}, format="json")
+    assert response.status_code == 200
+
+    response = client.get("/api/auth/me/")
+    assert response.status_code == 200
+    assert response.data["email"] == "c@example.com"
+    assert response.data["profile"]["full_name"] == "Cu Stomer"
+    customer_user.refresh_from_db()
+    assert customer_user.token_revision == 0
+
+
+@pytest.mark.django_db
+def test_other_workers_see_revocation_after_the_state_ttl(manager_user):
+    client = bearer(login("manager")["access"])
+    assert client.get("/api/bookings/").status_code == 200
+
+    # A change made elsewhere does not reach this process's signal handlers.
+    User.objects.filter(pk=manager_user.pk).update(role=User.Role.CUSTOMER, token_revision=1)
+    assert client.get("/api/bookings/").status_code == 200
+
+    token_state_cache.clear()
+    assert client.get("/api/bookings/").status_code == 401
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from apps.users.tokens import (
+    BlacklistedJTICache,
+    RefreshToken,
+    blacklisted_jti_cache,
+    prune_expired_tokens,
+)
+
+
+def make_tokens(user, count: int, expires_in: timedelta, blacklist_every: int = 0):
+    now = timezone.now()
+    tokens = OutstandingToken.objects.bulk_create(
+        OutstandingToken(
+            user=user,
+            jti=f"{expires_in.total_seconds():.0f}-{index}",
+            token="x",
+            created_at=now,
+            expires_at=now + expires_in,
+        )
+        for index in range(count)
+    )
+    if blacklist_every:
+        BlacklistedToken.objects.bulk_create(
+            BlacklistedToken(token=token) for token in tokens[::blacklist_every]
+        )
+    return tokens
+
+
+def refresh(token: str):
+    return APIClient().post("/api/auth/refresh/", {"refresh": token}, format="json")
+
+
+@pytest.mark.django_db
+def test_prune_deletes_expired_tokens_in_batches(customer_user):
+    make_tokens(customer_user, 7, timedelta(hours=-1), blacklist_every=2)
+    live = make_tokens(customer_user, 3, timedelta(hours=1), blacklist_every=3)
+
+    summary = prune_expired_tokens(batch_size=3)
+
+    assert (summary.outstanding, summary.blacklisted, summary.batches) == (7, 4, 3)
+    assert set(OutstandingToken.objects.values_list("id", flat=True)) == {t.id for t in live}
+    assert BlacklistedToken.objects.get().token_id == live[0].id
+    assert prune_expired_tokens().outstanding == 0
+
+
+@pytest.mark.django_db
+def test_prune_tokens_command(customer_user, capsys):
+    make_tokens(customer_user, 2, timedelta(hours=-1))
+
+    call_command("prune_tokens", "--once", "--batch-size", "1")
+
+    assert "Pruned 2 outstanding and 0 blacklisted tokens in 2 batches" in capsys.readouterr().out
+    assert not OutstandingToken.objects.exists()
+
+
+@pytest.mark.django_db
+def test_blacklisted_refresh_tokens_are_rejected_from_memory(customer_user):
+    token = RefreshToken.for_user(customer_user)
+    other = RefreshToken.for_user(customer_user)
+    token.blacklist()
+
+    assert token["jti"] in blacklisted_jti_cache
+    with CaptureQueriesContext(connection) as queries:
+        assert refresh(str(token)).status_code == 401
+    assert not any("blacklistedtoken" in query["sql"] for query in queries.captured_queries)
+    assert refresh(str(other)).status_code == 200
+
+
+@pytest.mark.django_db
+def test_cache_picks_up_blacklist_rows_written_elsewhere(customer_user):
+    [outstanding] = make_tokens(customer_user, 1, timedelta(hours=1))
+    blacklisted_jti_cache.refresh(force=True)
+    assert outstanding.jti not in blacklisted_jti_cache
+
+    # bulk_create skips the post_save receiver, like a write from another process.
+    BlacklistedToken.objects.bulk_create([BlacklistedToken(token=outstanding)])
+    blacklisted_jti_cache.refresh(force=True)
+
+    assert outstanding.jti in blacklisted_jti_cache
+    prune_expired_tokens(now=timezone.now() + timedelta(hours=2))
+    assert len(blacklisted_jti_cache) == 0
+
+
+@pytest.mark.django_db
+def test_full_reload_never_exposes_an_empty_cache(customer_user):
+    [blacklisted] = make_tokens(customer_user, 1, timedelta(hours=1), blacklist_every=1)
+    cache = BlacklistedJTICache(refresh_interval=3600, reload_interval=0)
+    cache.refresh(force=True)
+    seen_during_reload = []
+
+    def check_while_loading(execute, sql, params, many, context):
+        # A request thread checking the cache while the reload query runs.
+        seen_during_reload.append(blacklisted.jti in cache)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(check_while_loading):
+        cache.refresh(force=True)
+
+    assert seen_during_reload == [True]
+    assert blacklisted.jti in cache
+
+
+@pytest.mark.django_db
+def test_refresh_records_the_rotated_token(customer_user):
+    token = RefreshToken.for_user(customer_user)
+
+    response = refresh(str(token))
+
+    assert response.status_code == 200
+    rotated = RefreshToken(response.data["refresh"])
+    stored = OutstandingToken.objects.get(jti=rotated["jti"])
+    assert stored.user_id == customer_user.id
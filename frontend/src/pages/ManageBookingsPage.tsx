@@ -14,10 +14,10 @@ import { Link as RouterLink } from 'react-router-dom'
 import ErrorAlert from '../components/ErrorAlert'
 import LoadingState from '../components/LoadingState'
 import bookingService from '../services/bookingService'
-import { Booking } from '../types'
+import { BookingListItem } from '../types'
 
 const ManageBookingsPage = () => {
-  const [bookings, setBookings] = useState<Booking[]>([])
+  const [bookings, setBookings] = useState<BookingListItem[]>([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
   const [success, setSuccess] = useState('')
@@ -58,6 +58,24 @@ const ManageBookingsPage = () => {
     }
   }
 
+  const pendingIds = bookings.filter((b) => b.status === 'pending').map((b) => b.id)
+
+  const handleConfirmPending = async () => {
+    setError('')
+    setSuccess('')
+    try {
+      const report = await bookingService.bulkTransition(pendingIds, 'confirmed')
+      const confirmed = new Set(report.results.filter((r) => r.ok).map((r) => r.id))
+      setBookings((prev) =>
+        prev.map((b) => (confirmed.has(b.id) ? { ...b, status: 'confirmed' } : b))
+      )
+      const failed = report.results.length - report.updated
+      setSuccess(`Confirmed ${report.updated} booking(s)${failed ? `, ${failed} skipped` : ''}.`)
+    } catch (err: any) {
+      setError(err?.response?.data?.detail ?? 'Bulk confirmation failed.')
+    }
+  }
+
   return (
     <Box sx={{ py: 4 }}>
       <Typography variant="h4" gutterBottom>
@@ -66,6 +84,14 @@ const ManageBookingsPage = () => {
       <Typography color="text.secondary" sx={{ mb: 2 }}>
         Manage confirmations, check-ins, returns, and cancellations.
       </Typography>
+      <Button
+        variant="contained"
+        sx={{ mb: 2 }}
+        onClick={handleConfirmPending}
+        disabled={pendingIds.length === 0}
+      >
+        Confirm all pending ({pendingIds.length})
+      </Button>
       <ErrorAlert message={error} />
       {success && (
         <Card variant="outlined" sx={{ mb: 2, borderColor: 'success.main' }}>
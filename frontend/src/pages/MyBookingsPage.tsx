@@ -14,10 +14,10 @@ import { Link as RouterLink } from 'react-router-dom'
 import ErrorAlert from '../components/ErrorAlert'
 import LoadingState from '../components/LoadingState'
 import bookingService from '../services/bookingService'
-import { Booking } from '../types'
+import { BookingListItem } from '../types'
 
 const MyBookingsPage = () => {
-  const [bookings, setBookings] = useState<Booking[]>([])
+  const [bookings, setBookings] = useState<BookingListItem[]>([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
 
@@ -1,5 +1,5 @@
 import apiClient from '../api/client'
-import { Booking, Fine } from '../types'
+import { Booking, BookingListItem, BulkTransitionResult, Fine } from '../types'
 
 export interface BookingPayload {
   car_id: string
@@ -8,12 +8,18 @@ export interface BookingPayload {
 }
 
 const bookingService = {
-  async listBookings(): Promise<{ results: Booking[]; count?: number }> {
-    const response = await apiClient.get('/bookings/')
+  async listBookings(
+    cursor?: string
+  ): Promise<{ results: BookingListItem[]; next?: string | null; previous?: string | null }> {
+    const response = await apiClient.get('/bookings/', { params: cursor ? { cursor } : undefined })
     if (Array.isArray(response.data)) {
       return { results: response.data }
     }
-    return { results: response.data.results ?? [], count: response.data.count }
+    return {
+      results: response.data.results ?? [],
+      next: response.data.next,
+      previous: response.data.previous
+    }
   },
 
   async getBooking(id: string): Promise<Booking> {
@@ -46,6 +52,14 @@ const bookingService = {
     return response.data as Booking
   },
 
+  async bulkTransition(
+    ids: string[],
+    status: Exclude<Booking['status'], 'pending'>
+  ): Promise<BulkTransitionResult> {
+    const response = await apiClient.post('/bookings/bulk-transition/', { ids, status })
+    return response.data as BulkTransitionResult
+  },
+
   async listFines(id: string): Promise<Fine[]> {
     const response = await apiClient.get(`/bookings/${id}/fines/`)
     return response.data as Fine[]
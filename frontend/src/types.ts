@@ -47,6 +47,22 @@ export interface Booking {
   invoice?: Invoice
 }
 
+export type BookingListItem = Pick<
+  Booking,
+  'id' | 'customer' | 'car' | 'start_date' | 'end_date' | 'status' | 'created_at' | 'updated_at'
+> & {
+  fines_count?: number
+  deposit_status?: Deposit['status'] | null
+  invoice_total?: string | null
+  invoice_paid_at?: string | null
+}
+
+export interface BulkTransitionResult {
+  status: Booking['status']
+  updated: number
+  results: { id: string; ok: boolean; status: Booking['status'] | null; error?: string }[]
+}
+
 export interface Fine {
   id: string
   type: 'damage' | 'late_return' | 'cleaning' | 'other'